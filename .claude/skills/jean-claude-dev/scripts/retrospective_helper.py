@@ -6,158 +6,186 @@ Analyzes recent git commits to help with retrospective reflection.
 Identifies patterns, changes, and areas of focus to inform skill updates.
 """
 
+import heapq
 import subprocess
 import sys
+from collections import Counter
+from collections.abc import Iterable, Iterator
 from datetime import datetime, timedelta
+from operator import itemgetter
 from pathlib import Path
 
+# Marks the start of each commit record in `git log` output. Fields within a
+# record are NUL-separated (`-z`), so subjects containing `|` parse cleanly.
+COMMIT_MARKER = '\x1fCOMMIT\x1f'
 
-def get_recent_commits(days: int = 7) -> list[dict]:
-    """Get commits from the last N days."""
-    since_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
-
-    result = subprocess.run(
-        [
-            'git', 'log',
-            f'--since={since_date}',
-            '--pretty=format:%H|%s|%an|%ad',
-            '--date=short'
-        ],
-        capture_output=True,
-        text=True,
-        check=True
-    )
 
-    commits = []
-    for line in result.stdout.strip().split('\n'):
-        if not line:
-            continue
-        hash_val, subject, author, date = line.split('|', 3)
-        commits.append({
-            'hash': hash_val,
-            'subject': subject,
-            'author': author,
-            'date': date
-        })
-
-    return commits
-
-
-def get_commit_stats(commit_hash: str) -> dict:
-    """Get file change statistics for a commit."""
-    result = subprocess.run(
-        ['git', 'show', '--stat', '--format=', commit_hash],
-        capture_output=True,
-        text=True,
-        check=True
-    )
+def _split_records(stream, chunk_size: int = 65536) -> Iterator[str]:
+    """Yield complete commit records from a text stream as they arrive."""
+    pending = ''
+    for chunk in iter(lambda: stream.read(chunk_size), ''):
+        *records, pending = (pending + chunk).split(COMMIT_MARKER)
+        yield from (record for record in records if record)
+    if pending:
+        yield pending
 
-    files_changed = []
-    for line in result.stdout.strip().split('\n'):
-        if '|' in line:
-            filename = line.split('|')[0].strip()
-            files_changed.append(filename)
 
+def _parse_commit(record: str) -> dict:
+    """Parse one NUL-separated commit record into a commit dict."""
+    # Record layout: hash NUL subject NUL author NUL date LF file NUL ...
+    fields = record.split('\x00')
+    hash_val, subject, author = fields[:3]
+    date, _, first_file = fields[3].partition('\n')
     return {
-        'files_changed': files_changed,
-        'total_files': len(files_changed)
+        'hash': hash_val,
+        'subject': subject,
+        'author': author,
+        'date': date,
+        'files_changed': [f for f in (first_file, *fields[4:]) if f]
     }
 
 
-def categorize_changes(files: list[str]) -> dict:
-    """Categorize file changes by area."""
-    categories = {
-        'tests': [],
-        'core': [],
-        'cli': [],
-        'orchestration': [],
-        'tools': [],
-        'docs': [],
-        'config': [],
-        'other': []
-    }
-
-    for file in files:
-        if file.startswith('tests/'):
-            categories['tests'].append(file)
-        elif file.startswith('src/jean_claude/core/'):
-            categories['core'].append(file)
-        elif file.startswith('src/jean_claude/cli/'):
-            categories['cli'].append(file)
-        elif file.startswith('src/jean_claude/orchestration/'):
-            categories['orchestration'].append(file)
-        elif file.startswith('src/jean_claude/tools/'):
-            categories['tools'].append(file)
-        elif file.startswith('docs/') or file.endswith('.md'):
-            categories['docs'].append(file)
-        elif file.endswith(('.yaml', '.yml', '.toml', '.ini')):
-            categories['config'].append(file)
-        else:
-            categories['other'].append(file)
-
-    return {k: v for k, v in categories.items() if v}
-
-
-def analyze_work_patterns(commits: list[dict]) -> dict:
-    """Analyze patterns in recent work."""
-    all_files = []
-    commit_types = {
-        'feat': 0,
-        'fix': 0,
-        'test': 0,
-        'refactor': 0,
-        'docs': 0,
-        'chore': 0,
-        'other': 0
-    }
+def iter_recent_commits(days: int = 7, now: datetime | None = None) -> Iterator[dict]:
+    """Yield commits from the last N days, including the files each one changed.
+
+    A single `git log --name-only` call replaces the per-commit `git show`
+    invocations, and its output is parsed as it streams in rather than
+    buffered whole, so memory stays bounded by the largest single commit.
+    Rename detection is disabled since only file names are counted.
+
+    Raises:
+        subprocess.CalledProcessError: If git exits with a non-zero status
+    """
+    since_date = ((now or datetime.now()) - timedelta(days=days)).strftime('%Y-%m-%d')
+    args = [
+        'git', 'log',
+        f'--since={since_date}',
+        '-z',
+        '--name-only',
+        '--no-renames',
+        f'--pretty=format:{COMMIT_MARKER}%H%x00%s%x00%an%x00%ad',
+        '--date=short'
+    ]
+
+    # git emits UTF-8 by default; decoding explicitly skips the locale lookup
+    # and keeps a stray invalid byte in a commit subject from aborting the run.
+    with subprocess.Popen(
+        args, stdout=subprocess.PIPE, encoding='utf-8', errors='replace', bufsize=-1
+    ) as proc:
+        for record in _split_records(proc.stdout):
+            yield _parse_commit(record)
+
+    if proc.returncode:
+        raise subprocess.CalledProcessError(proc.returncode, args)
+
+
+# Areas in reporting order; categorize_file() returns one of these.
+AREAS = ('tests', 'core', 'cli', 'orchestration', 'tools', 'docs', 'config', 'other')
+
+
+# Leading directory components mapped to their area. Package areas are keyed
+# on three components, top-level areas on one.
+_PREFIX_AREAS = {
+    ('tests',): 'tests',
+    ('src', 'jean_claude', 'core'): 'core',
+    ('src', 'jean_claude', 'cli'): 'cli',
+    ('src', 'jean_claude', 'orchestration'): 'orchestration',
+    ('src', 'jean_claude', 'tools'): 'tools',
+    ('docs',): 'docs',
+}
+
+# File suffixes checked when no directory prefix matches
+_DOC_SUFFIX = '.md'
+_CONFIG_SUFFIXES = ('.yaml', '.yml', '.toml', '.ini')
+
+
+def categorize_file(file: str) -> str:
+    """Return the area a single changed file belongs to."""
+    # Everything but the last element is a directory component
+    dirs = tuple(file.split('/', 3)[:-1])
+    area = _PREFIX_AREAS.get(dirs[:3]) or _PREFIX_AREAS.get(dirs[:1])
+    if area:
+        return area
+    elif file.endswith(_DOC_SUFFIX):
+        return 'docs'
+    elif file.endswith(_CONFIG_SUFFIXES):
+        return 'config'
+    else:
+        return 'other'
+
+
+# Commit types in reporting order; commit_type() returns one of these.
+COMMIT_TYPES = ('feat', 'fix', 'test', 'refactor', 'docs', 'chore', 'other')
+
+# Commit types recognised by the prefix of a subject's leading token, so
+# "fix:", "Fixes ..." and "feat(cli)!:" / "Features: ..." are all counted
+_TYPE_PREFIXES = COMMIT_TYPES[:-1]
+
+
+def commit_type(subject: str) -> str:
+    """Return the conventional-commit type of a subject line."""
+    token = subject.lstrip().lower()
+    return next((t for t in _TYPE_PREFIXES if token.startswith(t)), 'other')
+
+
+def analyze_work_patterns(commits: Iterable[dict]) -> dict:
+    """Analyze patterns in recent work in a single pass over the commits.
+
+    File frequencies and per-area change counts are updated as each commit
+    arrives, so no combined file list is ever built.
+    """
+    total_commits = 0
+    file_counter = Counter()
+    area_counter = Counter()
+    commit_types = dict.fromkeys(COMMIT_TYPES, 0)
 
     for commit in commits:
-        stats = get_commit_stats(commit['hash'])
-        all_files.extend(stats['files_changed'])
-
-        # Categorize commit type
-        subject = commit['subject'].lower()
-        if subject.startswith('feat'):
-            commit_types['feat'] += 1
-        elif subject.startswith('fix'):
-            commit_types['fix'] += 1
-        elif subject.startswith('test'):
-            commit_types['test'] += 1
-        elif subject.startswith('refactor'):
-            commit_types['refactor'] += 1
-        elif subject.startswith('docs'):
-            commit_types['docs'] += 1
-        elif subject.startswith('chore'):
-            commit_types['chore'] += 1
-        else:
-            commit_types['other'] += 1
-
-    categories = categorize_changes(all_files)
+        total_commits += 1
+        files = commit['files_changed']
+        file_counter.update(files)
+        area_counter.update(map(categorize_file, files))
+
+        commit_types[commit_type(commit['subject'])] += 1
 
     return {
-        'total_commits': len(commits),
+        'total_commits': total_commits,
         'commit_types': commit_types,
-        'areas_of_focus': categories,
-        'most_changed_files': get_most_changed_files(all_files)
+        'areas_of_focus': {area: area_counter[area] for area in AREAS if area_counter[area]},
+        'most_changed_files': get_most_changed_files(file_counter)
     }
 
 
-def get_most_changed_files(files: list[str], top_n: int = 5) -> list[tuple]:
-    """Get the most frequently changed files."""
-    from collections import Counter
-    counter = Counter(files)
-    return counter.most_common(top_n)
+def get_most_changed_files(file_counter: Counter, top_n: int = 5) -> list[tuple]:
+    """Get the most frequently changed files from a per-file change counter.
+
+    Uses a bounded heap of size top_n (a plain max() scan when top_n is 1)
+    rather than sorting every file.
+    """
+    if not file_counter or top_n <= 0:
+        return []
+    if top_n == 1:
+        return [max(file_counter.items(), key=itemgetter(1))]
+    return heapq.nlargest(top_n, file_counter.items(), key=itemgetter(1))
+
 
+def generate_retrospective_template(analysis: dict, date_str: str, timestamp_str: str) -> list[str]:
+    """Generate a retrospective template based on analysis.
 
-def generate_retrospective_template(analysis: dict, commits: list[dict]) -> str:
-    """Generate a retrospective template based on analysis."""
-    date_str = datetime.now().strftime('%Y-%m-%d')
+    Args:
+        analysis: Result of analyze_work_patterns()
+        date_str: Retrospective date, formatted as YYYY-MM-DD
+        timestamp_str: Generation time for the footer, formatted as YYYY-MM-DD HH:MM
+
+    Returns:
+        The template as ordered text chunks, ready for writelines()
+    """
 
     # Find focus area
     focus_areas = analysis['areas_of_focus']
-    primary_focus = max(focus_areas.items(), key=lambda x: len(x[1]))[0] if focus_areas else 'general'
+    primary_focus = max(focus_areas.items(), key=lambda x: x[1])[0] if focus_areas else 'general'
 
-    template = f"""# Retrospective: {date_str}
+    parts: list[str] = []
+    parts.append(f"""# Retrospective: {date_str}
 
 ## Work Summary
 
@@ -166,21 +194,21 @@ def generate_retrospective_template(analysis: dict, commits: list[dict]) -> str:
 **Primary Focus**: {primary_focus.title()} development
 
 ### Commit Breakdown
-"""
+""")
 
-    for commit_type, count in analysis['commit_types'].items():
+    for type_name, count in analysis['commit_types'].items():
         if count > 0:
-            template += f"- {commit_type.title()}: {count}\n"
+            parts.append(f"- {type_name.title()}: {count}\n")
 
-    template += "\n### Areas Modified\n"
-    for area, files in focus_areas.items():
-        template += f"- {area.title()}: {len(files)} files\n"
+    parts.append("\n### Areas Modified\n")
+    parts.extend(f"- {area.title()}: {count} files\n" for area, count in focus_areas.items())
 
-    template += "\n### Most Changed Files\n"
-    for file, count in analysis['most_changed_files']:
-        template += f"- `{file}` ({count} changes)\n"
+    parts.append("\n### Most Changed Files\n")
+    parts.extend(
+        f"- `{file}` ({count} changes)\n" for file, count in analysis['most_changed_files']
+    )
 
-    template += """
+    parts.append(f"""
 ## Key Learnings
 
 [TODO: What did you learn during this work?]
@@ -222,58 +250,60 @@ Based on this work, consider updating:
 
 ---
 
-*Generated by retrospective_helper.py on {datetime.now().strftime('%Y-%m-%d %H:%M')}*
-"""
+*Generated by retrospective_helper.py on {timestamp_str}*
+""")
 
-    return template
+    return parts
 
 
 def main():
     """Main entry point."""
     print("🔍 Analyzing recent development work...\n")
 
-    # Get recent commits
+    # Capture the clock once so every date in this run agrees
+    now = datetime.now()
+    date_str = now.strftime('%Y-%m-%d')
+    timestamp_str = now.strftime('%Y-%m-%d %H:%M')
+
+    # Stream recent commits straight into the analysis
     try:
-        commits = get_recent_commits(days=7)
+        analysis = analyze_work_patterns(iter_recent_commits(days=7, now=now))
     except subprocess.CalledProcessError as e:
         print(f"Error getting git commits: {e}")
         sys.exit(1)
 
-    if not commits:
+    if not analysis['total_commits']:
         print("No commits found in the last 7 days.")
         return
 
-    print(f"Found {len(commits)} commits\n")
-
-    # Analyze patterns
-    analysis = analyze_work_patterns(commits)
+    print(f"Found {analysis['total_commits']} commits\n")
 
     print("📊 Work Summary:")
     print(f"  Total commits: {analysis['total_commits']}")
     print(f"\n  Commit types:")
-    for commit_type, count in analysis['commit_types'].items():
+    for type_name, count in analysis['commit_types'].items():
         if count > 0:
-            print(f"    - {commit_type}: {count}")
+            print(f"    - {type_name}: {count}")
 
     print(f"\n  Areas of focus:")
-    for area, files in analysis['areas_of_focus'].items():
-        print(f"    - {area}: {len(files)} files")
+    for area, count in analysis['areas_of_focus'].items():
+        print(f"    - {area}: {count} files")
 
     print(f"\n  Most changed files:")
     for file, count in analysis['most_changed_files']:
         print(f"    - {file} ({count} changes)")
 
     # Generate template
-    template = generate_retrospective_template(analysis, commits)
+    template_chunks = generate_retrospective_template(analysis, date_str, timestamp_str)
 
     # Save to file
-    date_str = datetime.now().strftime('%Y-%m-%d')
     skill_dir = Path(__file__).parent.parent
     retro_dir = skill_dir / 'references' / 'retrospectives'
     retro_file = retro_dir / f'{date_str}-session.md'
 
-    with open(retro_file, 'w') as f:
-        f.write(template)
+    retro_dir.mkdir(parents=True, exist_ok=True)
+    with open(retro_file, 'w', encoding='utf-8') as f:
+        f.writelines(template_chunks)
 
     print(f"\n✅ Retrospective template created: {retro_file}")
     print("\nNext steps:")
@@ -11,14 +11,18 @@ components using pydantic-evals. It includes:
 - Integration with LLMJudge for subjective quality assessment
 """
 
-from .evaluators import (
-    BeadsTaskValidEvaluator,
-    WorkflowProgressEvaluator,
-    FeatureCompletionEvaluator,
-)
-
 __all__ = [
     "BeadsTaskValidEvaluator",
     "WorkflowProgressEvaluator",
     "FeatureCompletionEvaluator",
 ]
+
+
+def __getattr__(name: str):
+    # Resolve evaluators on first access so that importing evals.run_evals
+    # (e.g. for --help) does not pull in pydantic_evals.
+    if name in __all__:
+        from . import evaluators
+
+        return getattr(evaluators, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
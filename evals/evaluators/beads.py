@@ -16,8 +16,16 @@ from typing import Any
 
 from pydantic_evals.evaluators import Evaluator, EvaluatorContext
 
+# Fixed result for a case whose output could not be parsed. Built once and
+# copied per failure so callers never share a mutable dict.
+_PARSE_FAILED_RESULT: dict[str, bool | float] = {
+    "parsed_successfully": False,
+    "fields_match": False,
+    "score": 0.0,
+}
 
-@dataclass
+
+@dataclass(slots=True)
 class BeadsTaskValidEvaluator(Evaluator[dict[str, Any], dict[str, Any]]):
     """Evaluates whether a BeadsTask was parsed correctly.
 
@@ -30,31 +38,31 @@ class BeadsTaskValidEvaluator(Evaluator[dict[str, Any], dict[str, Any]]):
         expected = ctx.expected_output
 
         if output is None:
-            return {
-                "parsed_successfully": False,
-                "fields_match": False,
-                "score": 0.0,
-            }
+            return dict(_PARSE_FAILED_RESULT)
+
+        # Bind the lookups once; they run for every field on every case
+        actual = output.get
+        want = expected.get
 
         # Check critical fields
-        id_match = output.get("id") == expected.get("id")
-        title_match = output.get("title") == expected.get("title")
-        status_match = output.get("status") == expected.get("status")
+        id_match = actual("id") == want("id")
+        title_match = actual("title") == want("title")
+        status_match = actual("status") == want("status")
 
         # Check optional fields if present in expected
         priority_match = True
         if "priority" in expected:
-            priority_match = output.get("priority") == expected.get("priority")
+            priority_match = actual("priority") == want("priority")
 
         task_type_match = True
         if "task_type" in expected:
-            task_type_match = output.get("task_type") == expected.get("task_type")
-
-        all_match = all([id_match, title_match, status_match, priority_match, task_type_match])
+            task_type_match = actual("task_type") == want("task_type")
 
-        # Calculate partial score
-        checks = [id_match, title_match, status_match, priority_match, task_type_match]
-        score = sum(checks) / len(checks)
+        # Calculate partial score (bools add as ints, so no list is needed)
+        correct = id_match + title_match + status_match + priority_match + task_type_match
+        total = 5
+        all_match = correct == total
+        score = correct / total
 
         return {
             "parsed_successfully": True,
@@ -68,7 +76,7 @@ class BeadsTaskValidEvaluator(Evaluator[dict[str, Any], dict[str, Any]]):
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class BeadsIdFormatEvaluator(Evaluator[str, bool]):
     """Evaluates BeadsTask ID format validation.
 
@@ -16,8 +16,29 @@ from typing import Any
 
 from pydantic_evals.evaluators import Evaluator, EvaluatorContext
 
-
-@dataclass
+# Allowed next phases for each workflow phase, shared by all evaluator instances
+_VALID_TRANSITIONS: dict[str, frozenset[str]] = {
+    "planning": frozenset({"implementing"}),
+    "implementing": frozenset({"verifying", "complete"}),
+    "verifying": frozenset({"implementing", "complete"}),
+    "complete": frozenset(),  # Terminal state
+}
+
+# Fixed results for cases that produced no output. Built once and copied per
+# failure so callers never share a mutable dict.
+_NO_PROGRESS_RESULT: dict[str, bool | float] = {
+    "progress_correct": False,
+    "counts_correct": False,
+    "score": 0.0,
+}
+_NO_COMPLETION_RESULT: dict[str, bool] = {
+    "status_updated": False,
+    "timestamp_set": False,
+    "index_advanced": False,
+}
+
+
+@dataclass(slots=True)
 class WorkflowProgressEvaluator(Evaluator[dict[str, Any], dict[str, Any]]):
     """Evaluates workflow progress calculations.
 
@@ -30,25 +51,20 @@ class WorkflowProgressEvaluator(Evaluator[dict[str, Any], dict[str, Any]]):
         expected = ctx.expected_output
 
         if output is None:
-            return {
-                "progress_correct": False,
-                "counts_correct": False,
-                "score": 0.0,
-            }
+            return dict(_NO_PROGRESS_RESULT)
+
+        # Bind the lookups once; they run for every field on every case
+        actual = output.get
+        want = expected.get
 
         # Check progress percentage (with small tolerance for floating point)
-        expected_progress = expected.get("progress_percentage", 0.0)
-        actual_progress = output.get("progress_percentage", 0.0)
-        progress_correct = abs(expected_progress - actual_progress) < 0.01
+        progress_correct = (
+            abs(want("progress_percentage", 0.0) - actual("progress_percentage", 0.0)) < 0.01
+        )
 
         # Check feature counts
-        expected_completed = expected.get("completed_features", 0)
-        actual_completed = output.get("completed_features", 0)
-        completed_correct = expected_completed == actual_completed
-
-        expected_total = expected.get("total_features", 0)
-        actual_total = output.get("total_features", 0)
-        total_correct = expected_total == actual_total
+        completed_correct = want("completed_features", 0) == actual("completed_features", 0)
+        total_correct = want("total_features", 0) == actual("total_features", 0)
 
         counts_correct = completed_correct and total_correct
 
@@ -65,7 +81,7 @@ class WorkflowProgressEvaluator(Evaluator[dict[str, Any], dict[str, Any]]):
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class FeatureCompletionEvaluator(Evaluator[dict[str, Any], dict[str, Any]]):
     """Evaluates feature completion workflow.
 
@@ -80,11 +96,7 @@ class FeatureCompletionEvaluator(Evaluator[dict[str, Any], dict[str, Any]]):
         expected = ctx.expected_output
 
         if output is None:
-            return {
-                "status_updated": False,
-                "timestamp_set": False,
-                "index_advanced": False,
-            }
+            return dict(_NO_COMPLETION_RESULT)
 
         # Check status was updated
         status_updated = output.get("feature_status") == "completed"
@@ -104,7 +116,7 @@ class FeatureCompletionEvaluator(Evaluator[dict[str, Any], dict[str, Any]]):
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class PhaseTransitionEvaluator(Evaluator[str, str]):
     """Evaluates workflow phase transitions.
 
@@ -112,17 +124,6 @@ class PhaseTransitionEvaluator(Evaluator[str, str]):
     planning -> implementing -> verifying -> complete
     """
 
-    valid_transitions: dict[str, list[str]] = None
-
-    def __post_init__(self):
-        if self.valid_transitions is None:
-            self.valid_transitions = {
-                "planning": ["implementing"],
-                "implementing": ["verifying", "complete"],
-                "verifying": ["implementing", "complete"],
-                "complete": [],  # Terminal state
-            }
-
     def evaluate(self, ctx: EvaluatorContext[str, str]) -> dict[str, bool]:
         # Input is (from_phase, to_phase), output is resulting phase
         from_phase = ctx.attributes.get("from_phase", "planning")
@@ -130,8 +131,9 @@ class PhaseTransitionEvaluator(Evaluator[str, str]):
         expected_phase = ctx.expected_output
 
         # Check if transition is valid
-        allowed = self.valid_transitions.get(from_phase, [])
-        transition_valid = to_phase in allowed or to_phase == from_phase
+        transition_valid = (
+            to_phase in _VALID_TRANSITIONS.get(from_phase, frozenset()) or to_phase == from_phase
+        )
 
         # Check if we got expected result
         result_correct = to_phase == expected_phase
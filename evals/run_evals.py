@@ -25,26 +25,15 @@ import sys
 from datetime import datetime
 from pathlib import Path
 
-# Load .env file for API keys (must be before other imports that use env vars)
-from dotenv import load_dotenv
-load_dotenv(Path(__file__).parent.parent / ".env")
-
-from pydantic_evals import Case, Dataset
-from pydantic_evals.evaluators import IsInstance, MaxDuration
-
-# Import our eval suites
-from evals.suites.test_beads_parsing import (
-    beads_parsing_dataset,
-    parse_beads_task,
-    id_validation_dataset,
-    validate_id_format,
-)
-from evals.suites.test_workflow_state import (
-    progress_dataset,
-    calculate_progress,
-    feature_completion_dataset,
-    complete_feature,
-)
+# Eval suites, pydantic_evals, and dotenv are imported inside the runners so
+# that --help and single-suite runs only pay for what they actually use.
+
+
+def _assertion_value(result):
+    """Return the pass/fail value of an assertion result (a bool or has .value)."""
+    if result is True or result is False:
+        return result
+    return getattr(result, "value", result)
 
 
 def run_deterministic_evals(suite: str | None = None) -> bool:
@@ -66,6 +55,13 @@ def run_deterministic_evals(suite: str | None = None) -> bool:
 
     # Beads parsing evals
     if suite is None or suite == "beads":
+        from evals.suites.test_beads_parsing import (
+            beads_parsing_dataset,
+            parse_beads_task,
+            id_validation_dataset,
+            validate_id_format,
+        )
+
         print("\n" + "-" * 50)
         print("📦 BeadsTask Parsing Evaluations")
         print("-" * 50)
@@ -82,6 +78,13 @@ def run_deterministic_evals(suite: str | None = None) -> bool:
 
     # Workflow state evals
     if suite is None or suite == "workflow":
+        from evals.suites.test_workflow_state import (
+            progress_dataset,
+            calculate_progress,
+            feature_completion_dataset,
+            complete_feature,
+        )
+
         print("\n" + "-" * 50)
         print("🔄 WorkflowState Evaluations")
         print("-" * 50)
@@ -106,22 +109,8 @@ def run_deterministic_evals(suite: str | None = None) -> bool:
         case_count = len(report.cases)
         passed = 0
         for c in report.cases:
-            # assertions is a dict mapping assertion name to result
-            # Check if any assertions failed (value is False)
-            case_passed = True
-            if hasattr(c, 'assertions') and c.assertions:
-                for assertion_name, assertion_result in c.assertions.items():
-                    # assertion_result can be bool or an object with .value
-                    if isinstance(assertion_result, bool):
-                        if not assertion_result:
-                            case_passed = False
-                            break
-                    elif hasattr(assertion_result, 'value'):
-                        if not assertion_result.value:
-                            case_passed = False
-                            break
-            if case_passed:
-                passed += 1
+            # all() stops at the first failed assertion
+            passed += all(_assertion_value(r) for r in (c.assertions or {}).values())
         status = "✅ PASS" if passed == case_count else "❌ FAIL"
         print(f"  {status} {name}: {passed}/{case_count} cases")
         if passed != case_count:
@@ -146,6 +135,13 @@ def run_llm_evals() -> bool:
     Returns:
         True if all evals passed, False otherwise
     """
+    # Load .env file for API keys (must be before imports that use env vars)
+    from dotenv import load_dotenv
+    load_dotenv(Path(__file__).parent.parent / ".env")
+
+    from pydantic_evals import Case, Dataset
+    from pydantic_evals.evaluators import IsInstance, MaxDuration
+
     try:
         from pydantic_evals.evaluators import LLMJudge
     except ImportError:
@@ -11,10 +11,12 @@ and validate task data from various input formats, including:
 - ID format validation (security-critical)
 """
 
+import asyncio
 from typing import Any
 
 from pydantic_evals import Case, Dataset
 from pydantic_evals.evaluators import IsInstance
+from rich.console import Console
 
 from jean_claude.core.beads import (
     BeadsTask,
@@ -37,14 +39,15 @@ def parse_beads_task(inputs: dict[str, Any]) -> dict[str, Any]:
         "title": task.title,
         "description": task.description,
         "status": task.status.value,
-        "priority": task.priority.value if task.priority else None,
-        "task_type": task.task_type.value if task.task_type else None,
+        # Optional enums: None has no .value, so getattr covers the unset case
+        "priority": getattr(task.priority, "value", None),
+        "task_type": getattr(task.task_type, "value", None),
         "acceptance_criteria": task.acceptance_criteria,
     }
 
 
 # Test cases for BeadsTask parsing
-beads_parsing_cases = [
+beads_parsing_cases = (
     Case(
         name="basic_task_parsing",
         inputs={
@@ -140,7 +143,7 @@ beads_parsing_cases = [
         },
         metadata={"category": "parsing", "difficulty": "medium"},
     ),
-]
+)
 
 beads_parsing_dataset = Dataset(
     cases=beads_parsing_cases,
@@ -165,7 +168,7 @@ def validate_id_format(task_id: str) -> bool:
 
 
 # Test cases for ID validation (security-critical)
-id_validation_cases = [
+id_validation_cases = (
     # Valid IDs
     Case(
         name="valid_beads_prefix",
@@ -222,7 +225,7 @@ id_validation_cases = [
         expected_output=False,
         metadata={"category": "format", "security": True},
     ),
-]
+)
 
 id_validation_dataset = Dataset(
     cases=id_validation_cases,
@@ -236,19 +239,34 @@ id_validation_dataset = Dataset(
 # Run evals
 # ============================================================================
 
+async def _evaluate_beads_datasets():
+    """Evaluate the independent BeadsTask datasets concurrently.
+
+    Progress bars are disabled because Rich allows only one live display.
+    """
+    return await asyncio.gather(
+        beads_parsing_dataset.evaluate(parse_beads_task, progress=False),
+        id_validation_dataset.evaluate(validate_id_format, progress=False),
+    )
+
+
 def run_beads_evals():
     """Run all BeadsTask evaluation suites."""
     print("\n" + "=" * 60)
     print("BeadsTask Parsing Evaluations")
     print("=" * 60)
 
-    print("\n--- Task Parsing ---")
-    report = beads_parsing_dataset.evaluate_sync(parse_beads_task)
-    report.print(include_input=True, include_output=True)
+    parsing_report, id_report = asyncio.run(_evaluate_beads_datasets())
+
+    # Render both reports into one buffered console so the section reaches
+    # stdout in a single write instead of one write per print call
+    console = Console()
+    with console:
+        console.out("\n--- Task Parsing ---", highlight=False)
+        parsing_report.print(include_input=True, include_output=True, console=console)
 
-    print("\n--- ID Validation (Security) ---")
-    report = id_validation_dataset.evaluate_sync(validate_id_format)
-    report.print(include_input=True, include_output=True)
+        console.out("\n--- ID Validation (Security) ---", highlight=False)
+        id_report.print(include_input=True, include_output=True, console=console)
 
 
 if __name__ == "__main__":
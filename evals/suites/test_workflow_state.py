@@ -10,11 +10,13 @@ This suite tests the WorkflowState model's ability to correctly:
 - Handle edge cases (empty features, all completed, failures)
 """
 
+import asyncio
 from datetime import datetime
 from typing import Any
 
 from pydantic_evals import Case, Dataset
 from pydantic_evals.evaluators import IsInstance
+from rich.console import Console
 
 from jean_claude.core.state import WorkflowState, Feature
 from evals.evaluators import (
@@ -58,7 +60,7 @@ def calculate_progress(inputs: dict[str, Any]) -> dict[str, Any]:
 
 
 # Test cases for progress calculation
-progress_cases = [
+progress_cases = (
     Case(
         name="empty_workflow",
         inputs={
@@ -138,7 +140,7 @@ progress_cases = [
         },
         metadata={"category": "progress", "difficulty": "medium"},
     ),
-]
+)
 
 progress_dataset = Dataset(
     cases=progress_cases,
@@ -167,9 +169,7 @@ def complete_feature(inputs: dict[str, Any]) -> dict[str, Any]:
         state.add_feature(f"Feature {i+1}", f"Description {i+1}")
 
     # Start and complete the specified number of features
-    for _ in range(inputs.get("complete_count", 1)):
-        state.start_feature()
-        state.mark_feature_complete()
+    state.bulk_complete(inputs.get("complete_count", 1))
 
     # Return state info
     current = state.current_feature
@@ -181,7 +181,7 @@ def complete_feature(inputs: dict[str, Any]) -> dict[str, Any]:
     }
 
 
-feature_completion_cases = [
+feature_completion_cases = (
     Case(
         name="complete_first_feature",
         inputs={
@@ -204,7 +204,7 @@ feature_completion_cases = [
         },
         metadata={"category": "completion", "difficulty": "medium"},
     ),
-]
+)
 
 feature_completion_dataset = Dataset(
     cases=feature_completion_cases,
@@ -218,19 +218,34 @@ feature_completion_dataset = Dataset(
 # Run evals
 # ============================================================================
 
+async def _evaluate_workflow_datasets():
+    """Evaluate the independent WorkflowState datasets concurrently.
+
+    Progress bars are disabled because Rich allows only one live display.
+    """
+    return await asyncio.gather(
+        progress_dataset.evaluate(calculate_progress, progress=False),
+        feature_completion_dataset.evaluate(complete_feature, progress=False),
+    )
+
+
 def run_workflow_evals():
     """Run all WorkflowState evaluation suites."""
     print("\n" + "=" * 60)
     print("WorkflowState Evaluations")
     print("=" * 60)
 
-    print("\n--- Progress Calculation ---")
-    report = progress_dataset.evaluate_sync(calculate_progress)
-    report.print(include_input=True, include_output=True)
+    progress_report, completion_report = asyncio.run(_evaluate_workflow_datasets())
+
+    # Render both reports into one buffered console so the section reaches
+    # stdout in a single write instead of one write per print call
+    console = Console()
+    with console:
+        console.out("\n--- Progress Calculation ---", highlight=False)
+        progress_report.print(include_input=True, include_output=True, console=console)
 
-    print("\n--- Feature Completion ---")
-    report = feature_completion_dataset.evaluate_sync(complete_feature)
-    report.print(include_input=True, include_output=True)
+        console.out("\n--- Feature Completion ---", highlight=False)
+        completion_report.print(include_input=True, include_output=True, console=console)
 
 
 if __name__ == "__main__":
@@ -4,6 +4,7 @@
 
 """Test LLMJudge to verify it's actually calling the API."""
 
+import asyncio
 import os
 import time
 from pathlib import Path
@@ -11,6 +12,9 @@ from pathlib import Path
 from dotenv import load_dotenv
 load_dotenv(Path(__file__).parent.parent / ".env")
 
+# Maximum number of cases judged in parallel (kept low to respect API rate limits)
+LLM_MAX_CONCURRENCY = 4
+
 print("=" * 60)
 print("LLMJudge API Call Verification")
 print("=" * 60)
@@ -58,7 +62,8 @@ print("Running evaluation...")
 print("-" * 60)
 
 start = time.time()
-report = dataset.evaluate_sync(simple_task)
+# LLMJudge calls are network-bound; let cases run concurrently up to the limit
+report = asyncio.run(dataset.evaluate(simple_task, max_concurrency=LLM_MAX_CONCURRENCY))
 elapsed = time.time() - start
 
 print(f"\n⏱️  Total evaluation time: {elapsed:.2f} seconds")
@@ -0,0 +1,18 @@
+# ABOUTME: Shared Rich console for commands that print Claude responses
+# ABOUTME: Creates the console once per process with per-print highlighting disabled
+
+"""Shared Rich console."""
+
+from functools import lru_cache
+
+from rich.console import Console
+
+
+@lru_cache(maxsize=1)
+def get_console() -> Console:
+    """Return the process-wide console used to print Claude responses.
+
+    Rich's automatic highlighting runs a set of regexes over every printed
+    string, which is wasted work on long responses, so it is turned off.
+    """
+    return Console(highlight=False)
@@ -0,0 +1,24 @@
+# ABOUTME: Shared error panels for commands that invoke the Claude Code CLI
+# ABOUTME: Builds the "Claude Code Not Found" panel shown when the CLI check fails
+
+"""Shared error panels."""
+
+from rich.panel import Panel
+
+
+def claude_not_found_panel(error: str) -> Panel:
+    """Build the panel shown when check_claude_installed() reports an error.
+
+    Args:
+        error: Error message from check_claude_installed()
+
+    Returns:
+        Panel with the error and installation instructions
+    """
+    return Panel(
+        f"[red]{error}[/red]\n\n"
+        "Please install Claude Code CLI:\n"
+        "  [cyan]npm install -g @anthropic-ai/claude-code[/cyan]",
+        title="[red]Claude Code Not Found[/red]",
+        border_style="red",
+    )
@@ -0,0 +1,166 @@
+# ABOUTME: Shared execution and result display for commands that run a single Claude request
+# ABOUTME: Handles the spinner, Ctrl-C exits, the response panel, metadata line and error output
+
+"""Shared execution flow for 'jc prompt' and 'jc run'."""
+
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Optional
+
+import click
+from rich.markup import escape
+from rich.panel import Panel
+
+from jean_claude.cli._console import get_console
+from jean_claude.cli.rendering import response_renderable
+from jean_claude.core.agent import ExecutionResult
+
+console = get_console()
+
+
+@contextmanager
+def exit_on_interrupt(raw: bool) -> Iterator[None]:
+    """Turn Ctrl-C into an exit with the conventional SIGINT status (130)."""
+    try:
+        yield
+    except KeyboardInterrupt:
+        if not raw:
+            console.print("[yellow]Interrupted by user[/yellow]")
+        raise SystemExit(130) from None
+
+
+def ensure_output_dir(output_dir: Path, raw: bool) -> None:
+    """Create the output directory before running a request.
+
+    A directory that can't be created is reported and exits with status 1
+    before any time is spent on the Claude call.
+    """
+    try:
+        output_dir.mkdir(parents=True, exist_ok=True)
+    except OSError as e:
+        message = f"Error: Cannot create output directory {output_dir}: {e.strerror or e}"
+        if raw:
+            click.echo(message, err=True)
+        else:
+            console.print(f"[red]{escape(message)}[/red]")
+        raise SystemExit(1) from None
+
+
+def _tool_names(message: Any) -> list[str]:
+    """Return the names of the tools an SDK message starts."""
+    content = getattr(message, "content", None)
+    if not isinstance(content, list):
+        return []
+    return [block.name for block in content if type(block).__name__ == "ToolUseBlock"]
+
+
+def execute_with_progress(
+    execute: Callable[[Optional[Callable[[Any], None]]], ExecutionResult],
+    description: str,
+    raw: bool,
+) -> ExecutionResult:
+    """Run a Claude request, showing a spinner unless output is raw.
+
+    `execute` is called with an `on_message` callback (None in raw mode) to
+    pass to execute_prompt()/execute_template(). As SDK messages arrive the
+    spinner text shows how many tools Claude has called and the latest one.
+
+    Args:
+        execute: Callable that runs the request, given the message callback
+        description: Spinner text
+        raw: Whether output is raw (no spinner)
+
+    Returns:
+        The execution result
+    """
+    with exit_on_interrupt(raw):
+        if raw:
+            return execute(None)
+
+        from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
+
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            TimeElapsedColumn(),
+            console=console,
+            transient=True,
+            # Spinner only; the default 10 fps redraws cost CPU for the whole call
+            refresh_per_second=4,
+        ) as progress:
+            task = progress.add_task(description, total=None)
+            tool_calls = 0
+
+            def on_message(message: Any) -> None:
+                nonlocal tool_calls
+                names = _tool_names(message)
+                if names:
+                    tool_calls += len(names)
+                    progress.update(
+                        task,
+                        description=f"{description} [dim]{tool_calls} tool calls, "
+                        f"using {escape(names[-1])}[/dim]",
+                    )
+
+            return execute(on_message)
+
+
+def format_metadata(result: ExecutionResult) -> str:
+    """Format the session, duration and cost of a result as one line."""
+    return " | ".join(
+        part
+        for part in (
+            result.session_id and f"Session: {result.session_id}",
+            result.duration_ms and f"Duration: {result.duration_ms / 1000:.1f}s",
+            result.cost_usd and f"Cost: ${result.cost_usd:.4f}",
+        )
+        if part
+    )
+
+
+def print_result(result: ExecutionResult, title: str, raw: bool) -> None:
+    """Print an execution result.
+
+    A successful result is shown as a response panel followed by its
+    metadata line (raw mode writes only the output). A failed result is
+    printed as an error and exits with status 1.
+
+    Args:
+        result: Result to print
+        title: Title of the response panel
+        raw: Whether to write plain output without formatting
+    """
+    if result.success:
+        if raw:
+            # Plain write: no markup parsing or wrapping of the response
+            click.echo(result.output)
+            return
+
+        console.print(
+            Panel(
+                response_renderable(result.output),
+                title=f"[green]{title}[/green]",
+                border_style="green",
+            )
+        )
+        metadata = format_metadata(result)
+        if metadata:
+            console.print(f"[dim]{metadata}[/dim]")
+        return
+
+    if raw:
+        click.echo(result.output, err=True)
+        if result.retry_code.value != "none":
+            click.echo(f"Retry code: {result.retry_code.value}", err=True)
+    else:
+        console.print(
+            Panel(
+                f"[red]{result.output}[/red]",
+                title="[red]Error[/red]",
+                border_style="red",
+            )
+        )
+        if result.retry_code.value != "none":
+            console.print(f"[dim]Retry code: {result.retry_code.value}[/dim]")
+    raise SystemExit(1)
@@ -92,7 +92,7 @@ def read_events(events_file: Path) -> Iterator[dict]:
     if not events_file.exists():
         return
 
-    with open(events_file) as f:
+    with open(events_file, encoding="utf-8") as f:
         for line in f:
             line = line.strip()
             if not line:
@@ -419,7 +419,7 @@ def logs(
             last_position = 0
             while True:
                 if events_file.exists():
-                    with open(events_file) as f:
+                    with open(events_file, encoding="utf-8") as f:
                         f.seek(last_position)
                         for line in f:
                             line = line.strip()
@@ -3,6 +3,7 @@
 
 """Agent note-taking command for shared knowledge."""
 
+from datetime import datetime
 from pathlib import Path
 
 import click
@@ -16,6 +17,17 @@ from jean_claude.core.workflow_utils import find_most_recent_workflow
 
 console = Console()
 
+# Rich style per note category; categories not listed render white
+_CATEGORY_STYLES: dict[NoteCategory, str] = {
+    NoteCategory.OBSERVATION: "cyan",
+    NoteCategory.DECISION: "yellow",
+    NoteCategory.LEARNING: "green",
+    NoteCategory.WARNING: "red",
+    NoteCategory.ACCOMPLISHMENT: "magenta",
+    NoteCategory.CONTEXT: "blue",
+    NoteCategory.TODO: "white",
+}
+
 
 def get_category_style(category: NoteCategory) -> str:
     """Get Rich style for a note category.
@@ -26,16 +38,40 @@ def get_category_style(category: NoteCategory) -> str:
     Returns:
         Rich style string
     """
-    styles = {
-        NoteCategory.OBSERVATION: "cyan",
-        NoteCategory.DECISION: "yellow",
-        NoteCategory.LEARNING: "green",
-        NoteCategory.WARNING: "red",
-        NoteCategory.ACCOMPLISHMENT: "magenta",
-        NoteCategory.CONTEXT: "blue",
-        NoteCategory.TODO: "white",
-    }
-    return styles.get(category, "white")
+    return _CATEGORY_STYLES.get(category, "white")
+
+
+# Styled category cell for table rows, rendered once per category
+_CATEGORY_TAGS: dict[NoteCategory, str] = {
+    category: f"[{get_category_style(category)}]{category.value}[/{get_category_style(category)}]"
+    for category in NoteCategory
+}
+
+
+def _truncate(text: str, width: int = 50) -> str:
+    """Shorten text to width characters, marking any cut with an ellipsis."""
+    return text if len(text) <= width else text[:width] + "..."
+
+
+def _format_timestamp(moment: datetime, short: bool = False) -> str:
+    """Format a note time as 'YYYY-MM-DD HH:MM', or 'MM-DD HH:MM' when short.
+
+    Slices isoformat() output, which is several times cheaper per row than
+    the locale-aware strftime() path.
+    """
+    iso = moment.isoformat(timespec="minutes")
+    return iso[5 if short else 0:16].replace("T", " ")
+
+
+def _make_list_table(with_time: bool = True) -> Table:
+    """Build an empty notes table with the Category/Title/Agent[/Time] columns."""
+    table = Table()
+    table.add_column("Category", style="cyan", width=12)
+    table.add_column("Title", style="white")
+    table.add_column("Agent", style="dim")
+    if with_time:
+        table.add_column("Time", style="dim")
+    return table
 
 
 @click.group()
@@ -243,7 +279,7 @@ def list_notes(
         for note in notes_list:
             style = get_category_style(note.category)
             console.print(f"[{style}][{note.category.value.upper()}][/{style}] {note.title}")
-            console.print(f"[dim]Agent: {note.agent_id} | {note.created_at.strftime('%Y-%m-%d %H:%M')}[/dim]")
+            console.print(f"[dim]Agent: {note.agent_id} | {_format_timestamp(note.created_at)}[/dim]")
             if note.tags:
                 console.print(f"[dim]Tags: {', '.join(note.tags)}[/dim]")
             console.print()
@@ -251,19 +287,14 @@ def list_notes(
             console.print("\n" + "-" * 40 + "\n")
     else:
         # Show table
-        table = Table()
-        table.add_column("Category", style="cyan", width=12)
-        table.add_column("Title", style="white")
-        table.add_column("Agent", style="dim")
-        table.add_column("Time", style="dim")
+        table = _make_list_table()
 
         for note in notes_list:
-            style = get_category_style(note.category)
             table.add_row(
-                f"[{style}]{note.category.value}[/{style}]",
-                note.title[:50] + ("..." if len(note.title) > 50 else ""),
+                _CATEGORY_TAGS[note.category],
+                _truncate(note.title),
                 note.agent_id,
-                note.created_at.strftime("%m-%d %H:%M"),
+                _format_timestamp(note.created_at, short=True),
             )
 
         console.print(table)
@@ -321,21 +352,17 @@ def search_notes(
         for note in results:
             style = get_category_style(note.category)
             console.print(f"[{style}][{note.category.value.upper()}][/{style}] {note.title}")
-            console.print(f"[dim]Agent: {note.agent_id} | {note.created_at.strftime('%Y-%m-%d %H:%M')}[/dim]")
+            console.print(f"[dim]Agent: {note.agent_id} | {_format_timestamp(note.created_at)}[/dim]")
             console.print()
             console.print(note.content)
             console.print("\n" + "-" * 40 + "\n")
     else:
-        table = Table()
-        table.add_column("Category", style="cyan", width=12)
-        table.add_column("Title", style="white")
-        table.add_column("Agent", style="dim")
+        table = _make_list_table(with_time=False)
 
         for note in results:
-            style = get_category_style(note.category)
             table.add_row(
-                f"[{style}]{note.category.value}[/{style}]",
-                note.title[:50] + ("..." if len(note.title) > 50 else ""),
+                _CATEGORY_TAGS[note.category],
+                _truncate(note.title),
                 note.agent_id,
             )
 
@@ -13,6 +13,7 @@ from rich.markdown import Markdown
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
+from jean_claude.cli._errors import claude_not_found_panel
 from jean_claude.core.agent import (
     PromptRequest,
     check_claude_installed,
@@ -68,15 +69,7 @@ def prime(
     # Check Claude installation first
     error = check_claude_installed()
     if error:
-        console.print(
-            Panel(
-                f"[red]{error}[/red]\n\n"
-                "Please install Claude Code CLI:\n"
-                "  [cyan]npm install -g @anthropic-ai/claude-code[/cyan]",
-                title="[red]Claude Code Not Found[/red]",
-                border_style="red",
-            )
-        )
+        console.print(claude_not_found_panel(error))
         raise SystemExit(1)
 
     # Generate workflow ID for tracking
@@ -121,6 +114,8 @@ def prime(
             TextColumn("[progress.description]{task.description}"),
             console=console,
             transient=True,
+            # Spinner only; the default 10 fps redraws cost CPU for the whole call
+            refresh_per_second=4,
         ) as progress:
             progress.add_task("Prime subagent exploring codebase...", total=None)
             result = anyio.run(run_prime)
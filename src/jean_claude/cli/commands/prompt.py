@@ -3,32 +3,162 @@
 
 """Execute adhoc prompts with Claude."""
 
+import json
+import sys
 from pathlib import Path
-from typing import Optional
+from typing import IO, Any, Literal, Optional, cast
 
 import anyio
 import click
-from rich.console import Console
-from rich.panel import Panel
-from rich.markdown import Markdown
-from rich.progress import Progress, SpinnerColumn, TextColumn
+from pydantic import ValidationError
 
+from jean_claude.cli._console import get_console
+from jean_claude.cli._errors import claude_not_found_panel
+from jean_claude.cli._runner import (
+    ensure_output_dir,
+    execute_with_progress,
+    exit_on_interrupt,
+    print_result,
+)
 from jean_claude.core.agent import (
     ExecutionResult,
     PromptRequest,
-    RetryCode,
     check_claude_installed,
     execute_prompt,
+    execute_prompts_batch,
     generate_workflow_id,
 )
-from jean_claude.core.sdk_executor import execute_prompt_streaming
-from jean_claude.cli.streaming import stream_output
+from jean_claude.core.cache import (
+    load_cached_response,
+    prompt_cache_key,
+    save_cached_response,
+)
+from jean_claude.core.retry import RetryCode
+
+console = get_console()
+
+ModelName = Literal["sonnet", "opus", "haiku"]
+
+
+def _load_cached_result(cache_key: str) -> Optional[ExecutionResult]:
+    """Return the cached result for cache_key, or None on a miss or unusable entry."""
+    cached = load_cached_response(cache_key)
+    if cached is None:
+        return None
+    try:
+        return ExecutionResult.model_validate(cached)
+    except ValidationError:
+        # Unusable entry; the prompt is run again and the entry overwritten
+        return None
+
+
+def _read_batch(batch: IO[str], default_model: str) -> list[tuple[str, ModelName, Any]]:
+    """Parse batch JSONL into (prompt, model, id) tuples.
+
+    Each non-blank line is a JSON object with a "prompt" string and optional
+    "model" and "id" fields.
+
+    Raises:
+        click.ClickException: If a line is not valid batch input
+    """
+    items: list[tuple[str, ModelName, Any]] = []
+    for line_no, line in enumerate(batch, start=1):
+        if not line.strip():
+            continue
+        try:
+            entry = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise click.ClickException(f"Batch line {line_no}: invalid JSON ({e.msg})") from e
+        if not isinstance(entry, dict) or not isinstance(entry.get("prompt"), str):
+            raise click.ClickException(f'Batch line {line_no}: expected an object with a "prompt" string')
+        model = entry.get("model", default_model)
+        if model not in ("sonnet", "opus", "haiku"):
+            raise click.ClickException(f"Batch line {line_no}: invalid model {model!r}")
+        items.append((entry["prompt"], cast(ModelName, model), entry.get("id")))
+    return items
+
+
+async def _execute_batch(
+    items: list[tuple[str, ModelName, Any]],
+    working_dir: Path,
+    base_dir: Path,
+    concurrency: int,
+    cache: bool,
+    refresh: bool,
+) -> int:
+    """Run batch prompts concurrently, writing one JSON line per finished prompt.
+
+    Cached responses are looked up first (on a worker thread, off the event
+    loop) and written straight away; the remaining prompts run through execute_prompts_batch(), at most
+    `concurrency` at a time, and are written as they complete. "index" is
+    the prompt's position in the input.
+
+    Returns:
+        Number of prompts that failed
+    """
+    failures = 0
+    pending: list[tuple[int, Any, str, PromptRequest, Optional[str]]] = []
+
+    def write_record(
+        index: int,
+        item_id: Any,
+        workflow_id: str,
+        model: str,
+        result: ExecutionResult,
+        cached: bool,
+    ) -> None:
+        nonlocal failures
+        failures += not result.success
+        record = {
+            "index": index,
+            "id": item_id,
+            "workflow_id": workflow_id,
+            "model": model,
+            "success": result.success,
+            "output": result.output,
+            "session_id": result.session_id,
+            "duration_ms": result.duration_ms,
+            "cost_usd": result.cost_usd,
+            "retry_code": result.retry_code.value,
+            "cached": cached,
+        }
+        sys.stdout.write(json.dumps(record) + "\n")
+        sys.stdout.flush()
+
+    for index, (text, model, item_id) in enumerate(items):
+        workflow_id = generate_workflow_id()
+        request = PromptRequest(
+            prompt=text,
+            model=model,
+            working_dir=working_dir,
+            output_dir=base_dir / workflow_id,
+        )
+        cache_key = prompt_cache_key(model, text, working_dir) if cache else None
+        cached_result = None
+        if cache_key and not refresh:
+            cached_result = await anyio.to_thread.run_sync(_load_cached_result, cache_key)
+        if cached_result is not None:
+            write_record(index, item_id, workflow_id, model, cached_result, cached=True)
+        else:
+            pending.append((index, item_id, workflow_id, request, cache_key))
+
+    def finish(position: int, result: ExecutionResult) -> None:
+        index, item_id, workflow_id, request, cache_key = pending[position]
+        if cache_key and result.success:
+            save_cached_response(cache_key, result.model_dump(mode="json"))
+        # Called on the event loop thread, so result lines never interleave
+        write_record(index, item_id, workflow_id, request.model, result, cached=False)
 
-console = Console()
+    await execute_prompts_batch(
+        [request for _, _, _, request, _ in pending],
+        max_concurrency=concurrency,
+        on_result=finish,
+    )
+    return failures
 
 
 @click.command()
-@click.argument("text")
+@click.argument("text", required=False)
 @click.option(
     "--model",
     "-m",
@@ -58,13 +188,39 @@ console = Console()
     is_flag=True,
     help="Show tool uses and internal thinking (requires --stream)",
 )
+@click.option(
+    "--cache/--no-cache",
+    default=False,
+    help="Reuse a response cached in the last 24h for the same model, prompt and directory",
+)
+@click.option(
+    "--refresh",
+    is_flag=True,
+    help="With --cache, ignore any cached response and store the new one",
+)
+@click.option(
+    "--batch",
+    type=click.File("r", encoding="utf-8"),
+    default=None,
+    help='Run prompts from a JSONL file ("-" for stdin); writes JSONL results to stdout',
+)
+@click.option(
+    "--concurrency",
+    type=click.IntRange(min=1),
+    default=8,
+    help="Maximum prompts run at once with --batch (default: 8)",
+)
 def prompt(
-    text: str,
+    text: Optional[str],
     model: str,
     output_dir: Optional[Path],
     raw: bool,
     stream: bool,
     show_thinking: bool,
+    cache: bool,
+    refresh: bool,
+    batch: Optional[IO[str]],
+    concurrency: int,
 ) -> None:
     """Execute an adhoc prompt with Claude.
 
@@ -73,33 +229,67 @@ def prompt(
       jc prompt "Explain the authentication flow"
       jc prompt "Add logging to API endpoints" --model opus
       jc prompt "Quick question" -m haiku
+      jc prompt "Summarize the README" --cache
+
+    \b
+    Batch mode reads one JSON object per line with a "prompt" and optional
+    "model" and "id", runs them concurrently, and prints one JSON result per
+    line as each finishes. With --batch, --output-dir is the parent of the
+    per-prompt directories.
+      jc prompt --batch prompts.jsonl --concurrency 4 > results.jsonl
     """
+    # Validate input: must have exactly one of text or --batch
+    if text is not None and batch is not None:
+        console.print("[red]Error: Provide either TEXT or --batch, not both[/red]")
+        raise SystemExit(1)
+
+    if text is None and batch is None:
+        console.print("[red]Error: Must provide TEXT or --batch[/red]")
+        console.print("[dim]Use --help for usage examples[/dim]")
+        raise SystemExit(1)
+
+    if batch is not None and stream:
+        console.print("[red]Error: --stream cannot be used with --batch[/red]")
+        raise SystemExit(1)
+
     # Check Claude installation first
     error = check_claude_installed()
     if error:
-        console.print(
-            Panel(
-                f"[red]{error}[/red]\n\n"
-                "Please install Claude Code CLI:\n"
-                "  [cyan]npm install -g @anthropic-ai/claude-code[/cyan]",
-                title="[red]Claude Code Not Found[/red]",
-                border_style="red",
-            )
-        )
+        console.print(claude_not_found_panel(error))
         raise SystemExit(1)
 
+    cwd = Path.cwd()
+
+    if batch is not None:
+        items = _read_batch(batch, model)
+        base_dir = output_dir or cwd / "agents"
+        # Results go to stdout as JSONL, so report a bad directory on stderr
+        ensure_output_dir(base_dir, raw=True)
+        try:
+            failures = anyio.run(
+                _execute_batch, items, cwd, base_dir, concurrency, cache, refresh
+            )
+        except KeyboardInterrupt:
+            raise SystemExit(130) from None
+        if failures:
+            raise SystemExit(1)
+        return
+
+    assert text is not None
+
     # Generate workflow ID for tracking
     workflow_id = generate_workflow_id()
 
     # Set up output directory
     if output_dir is None:
-        output_dir = Path.cwd() / "agents" / workflow_id
+        output_dir = cwd / "agents" / workflow_id
 
     # Create request
     request = PromptRequest(
         prompt=text,
-        model=model,
-        working_dir=Path.cwd(),
+        # click.Choice has already restricted the value
+        model=cast(ModelName, model),
+        working_dir=cwd,
         output_dir=output_dir,
     )
 
@@ -109,94 +299,76 @@ def prompt(
         console.print(f"[dim]Model: {model}[/dim]")
         console.print()
 
+    # Exact-match response cache (opt-in; streamed output is never cached)
+    cache_key: Optional[str] = None
+    cached_result: Optional[ExecutionResult] = None
+    if cache and not stream:
+        cache_key = prompt_cache_key(model, text, request.working_dir)
+        if not refresh:
+            cached_result = _load_cached_result(cache_key)
+
+    if cached_result is None:
+        # Fail before the Claude call if the output directory is unusable
+        ensure_output_dir(output_dir, raw)
+
     # Execute with streaming or traditional approach
     result: ExecutionResult
-    output_text: Optional[str] = None
 
-    if stream:
+    if cached_result is not None:
+        result = cached_result
+    elif stream:
+        # The SDK and streaming renderer are only needed on this path
+        from jean_claude.cli.streaming import stream_output
+        from jean_claude.core.sdk_executor import execute_prompt_streaming
+
         # Use streaming execution
         async def run_streaming() -> str:
             message_stream = execute_prompt_streaming(request)
             return await stream_output(message_stream, console, show_thinking)
 
-        try:
-            # Run async streaming in sync context
-            output_text = anyio.run(run_streaming)
-
-            # Create a minimal result for metadata display
-            result = ExecutionResult(
-                output=output_text,
-                success=True,
-                session_id=None,
-                duration_ms=None,
-                cost_usd=None,
-            )
-        except Exception as e:
-            # Handle streaming errors
-            result = ExecutionResult(
-                output=f"Streaming error: {e}",
-                success=False,
-                retry_code=RetryCode.EXECUTION_ERROR,
-            )
-    elif raw:
-        result = execute_prompt(request)
-    else:
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-            transient=True,
-        ) as progress:
-            progress.add_task("Executing prompt...", total=None)
-            result = execute_prompt(request)
-
-    # Display result
-    if result.success:
-        # For streaming mode, output was already shown in real-time
-        if stream:
-            console.print()  # Add blank line after streaming
-            console.print("[green]✓ Complete[/green]")
-            console.print(f"[dim]Output saved to: {output_dir}[/dim]")
-        elif raw:
-            console.print(result.output)
-        else:
-            # Try to render as markdown for better formatting
+        with exit_on_interrupt(raw):
             try:
-                console.print(Panel(
-                    Markdown(result.output),
-                    title="[green]Response[/green]",
-                    border_style="green",
-                ))
-            except Exception:
-                # Fall back to plain text
-                console.print(Panel(
-                    result.output,
-                    title="[green]Response[/green]",
-                    border_style="green",
-                ))
-
-            # Show metadata
-            metadata_parts = []
-            if result.session_id:
-                metadata_parts.append(f"Session: {result.session_id}")
-            if result.duration_ms:
-                duration_sec = result.duration_ms / 1000
-                metadata_parts.append(f"Duration: {duration_sec:.1f}s")
-            if result.cost_usd:
-                metadata_parts.append(f"Cost: ${result.cost_usd:.4f}")
-
-            if metadata_parts:
-                console.print(f"[dim]{' | '.join(metadata_parts)}[/dim]")
-
-            console.print(f"[dim]Output saved to: {output_dir}[/dim]")
+                # Run async streaming in sync context
+                output_text = anyio.run(run_streaming)
+
+                # Create a minimal result for metadata display
+                result = ExecutionResult(
+                    output=output_text,
+                    success=True,
+                    session_id=None,
+                    duration_ms=None,
+                    cost_usd=None,
+                )
+            except Exception as e:
+                # Handle streaming errors
+                result = ExecutionResult(
+                    output=f"Streaming error: {e}",
+                    success=False,
+                    retry_code=RetryCode.EXECUTION_ERROR,
+                )
     else:
-        console.print(
-            Panel(
-                f"[red]{result.output}[/red]",
-                title="[red]Error[/red]",
-                border_style="red",
-            )
+        result = execute_with_progress(
+            lambda on_message: execute_prompt(request, on_message=on_message),
+            "Executing prompt...",
+            raw,
         )
-        if result.retry_code.value != "none":
-            console.print(f"[dim]Retry code: {result.retry_code.value}[/dim]")
-        raise SystemExit(1)
+
+    if cache_key and cached_result is None and result.success:
+        save_cached_response(cache_key, result.model_dump(mode="json"))
+
+    # For streaming mode, output was already shown in real-time
+    if stream and result.success:
+        console.print()  # Add blank line after streaming
+        console.print("[green]✓ Complete[/green]")
+        console.print(f"[dim]Output saved to: {output_dir}[/dim]")
+        return
+
+    # Display result (exits if it failed)
+    print_result(result, "Response", raw)
+    if raw:
+        return
+
+    if cached_result is not None:
+        console.print("[dim]Cached response (use --refresh to run again)[/dim]")
+    else:
+        console.print(f"[dim]Output saved to: {output_dir}[/dim]")
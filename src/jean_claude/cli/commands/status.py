@@ -43,7 +43,7 @@ def get_feature_durations(project_root: Path, workflow_id: str) -> dict[str, int
     feature_starts: dict[str, datetime] = {}
 
     try:
-        with open(events_file) as f:
+        with open(events_file, encoding="utf-8") as f:
             for line in f:
                 event = json.loads(line)
                 event_type = event.get("event_type")
@@ -3,14 +3,14 @@
 
 """Execute Jean Claude workflows from Beads tasks."""
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any
 
 import anyio
 import click
 from rich.console import Console
-from rich.markdown import Markdown
 from rich.panel import Panel
-from rich.prompt import Confirm
 
 from jean_claude.core.beads import (
     fetch_beads_task,
@@ -22,12 +22,21 @@ from jean_claude.core.events import EventLogger
 from jean_claude.core.state import WorkflowState
 from jean_claude.core.task_validator import TaskValidator
 from jean_claude.core.interactive_prompt_handler import InteractivePromptHandler, PromptAction
-from jean_claude.core.edit_and_revalidate import edit_and_revalidate
-from jean_claude.orchestration.two_agent import run_two_agent_workflow
 
 console = Console()
 
 
+async def run_two_agent_workflow(*args: Any) -> WorkflowState:
+    """Run the two-agent workflow, importing the orchestration stack on first use.
+
+    The orchestration modules load the Agent SDK, which dominates the import
+    time of this command; dry runs and `--help` never need it.
+    """
+    from jean_claude.orchestration.two_agent import run_two_agent_workflow as _run
+
+    return await _run(*args)
+
+
 @click.command()
 @click.argument("beads_id")
 @click.option(
@@ -118,17 +127,17 @@ def work(beads_id: str, model: str, show_plan: bool, dry_run: bool, strict: bool
                 console.print()
                 console.print("[bold blue]Opening task for editing...[/bold blue]")
 
+                from jean_claude.core.edit_and_revalidate import edit_and_revalidate
+
                 # Edit and re-validate loop
                 while True:
                     try:
-                        validation_result = edit_and_revalidate(beads_id, strict=strict)
+                        validation_result, task = edit_and_revalidate(beads_id, strict=strict)
 
                         # If no more warnings/errors, break the loop
                         if not validation_result.has_warnings() and not validation_result.has_errors():
                             console.print("[green]✓[/green] Task validation passed after editing")
                             console.print()
-                            # Re-fetch the task to get updated data
-                            task = fetch_beads_task(beads_id)
                             break
 
                         # Still has issues, prompt again
@@ -144,8 +153,6 @@ def work(beads_id: str, model: str, show_plan: bool, dry_run: bool, strict: bool
                             console.print()
                             console.print("[yellow]Proceeding despite warnings...[/yellow]")
                             console.print()
-                            # Re-fetch the task to get updated data
-                            task = fetch_beads_task(beads_id)
                             break
                         # else: action == EDIT, continue loop
 
@@ -170,61 +177,72 @@ def work(beads_id: str, model: str, show_plan: bool, dry_run: bool, strict: bool
             data={"beads_task_id": beads_id}
         )
 
-        # Update Beads task status to 'in_progress'
-        console.print("[bold blue]Updating task status to 'in_progress'...[/bold blue]")
-        try:
-            update_beads_status(beads_id, "in_progress")
-            console.print("[green]✓[/green] Task status updated to 'in_progress'")
-        except RuntimeError as e:
-            # Handle status update failures gracefully - log warning but continue
-            console.print(f"[yellow]⚠[/yellow] Warning: Failed to update task status: {e}")
-            console.print("[dim]Continuing with workflow execution...[/dim]")
-        console.print()
+        # Update the Beads task status to 'in_progress' in the background; the
+        # bd subprocess doesn't depend on the spec generated and saved meanwhile
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            status_update = executor.submit(update_beads_status, beads_id, "in_progress")
 
-        # Initialize WorkflowState with Beads task information
-        console.print("[bold blue]Initializing workflow state...[/bold blue]")
-        workflow_state = WorkflowState(
-            workflow_id=workflow_id,
-            workflow_name=task.title,
-            workflow_type="beads-task",
-            beads_task_id=beads_id,
-            beads_task_title=task.title,
-            phase="planning"
-        )
-        console.print("[green]✓[/green] Workflow state initialized")
-        console.print()
+            # Initialize WorkflowState with Beads task information
+            console.print("[bold blue]Initializing workflow state...[/bold blue]")
+            workflow_state = WorkflowState(
+                workflow_id=workflow_id,
+                workflow_name=task.title,
+                workflow_type="beads-task",
+                beads_task_id=beads_id,
+                beads_task_title=task.title,
+                phase="planning"
+            )
+            console.print("[green]✓[/green] Workflow state initialized")
+            console.print()
 
-        # Generate specification from the task
-        console.print("[bold blue]Generating specification...[/bold blue]")
-        spec_content = generate_spec_from_beads(task)
-        console.print("[green]✓[/green] Specification generated")
-        console.print()
+            # Generate specification from the task
+            console.print("[bold blue]Generating specification...[/bold blue]")
+            spec_content = generate_spec_from_beads(task)
+            console.print("[green]✓[/green] Specification generated")
+            console.print()
 
-        # Create specs directory if it doesn't exist
-        specs_dir = Path("specs")
-        specs_dir.mkdir(exist_ok=True)
+            # Create specs directory if it doesn't exist
+            specs_dir = project_root / "specs"
+            specs_dir.mkdir(exist_ok=True)
+
+            # Write spec to file (messages show it relative to the project)
+            spec_filename = f"beads-{beads_id}.md"
+            spec_path = specs_dir / spec_filename
+            display_path = spec_path.relative_to(project_root)
+            try:
+                spec_path.write_text(spec_content, encoding="utf-8")
+            except PermissionError as e:
+                console.print(f"[bold red]Error:[/bold red] Permission denied writing spec file to [cyan]{display_path}[/cyan]")
+                console.print(f"[dim]Details: {e}[/dim]")
+                console.print("[dim]Check file and directory permissions[/dim]")
+                raise click.Abort()
+            except OSError as e:
+                console.print(f"[bold red]Error:[/bold red] Failed to write spec file to [cyan]{display_path}[/cyan]")
+                console.print(f"[dim]Details: {e}[/dim]")
+                console.print("[dim]Check disk space and file system availability[/dim]")
+                raise click.Abort()
+            console.print(f"[green]✓[/green] Specification saved to: [cyan]{display_path}[/cyan]")
+            console.print()
 
-        # Write spec to file
-        spec_filename = f"beads-{beads_id}.md"
-        spec_path = specs_dir / spec_filename
-        try:
-            spec_path.write_text(spec_content)
-        except PermissionError as e:
-            console.print(f"[bold red]Error:[/bold red] Permission denied writing spec file to [cyan]{spec_path}[/cyan]")
-            console.print(f"[dim]Details: {e}[/dim]")
-            console.print("[dim]Check file and directory permissions[/dim]")
-            raise click.Abort()
-        except OSError as e:
-            console.print(f"[bold red]Error:[/bold red] Failed to write spec file to [cyan]{spec_path}[/cyan]")
-            console.print(f"[dim]Details: {e}[/dim]")
-            console.print("[dim]Check disk space and file system availability[/dim]")
-            raise click.Abort()
-        console.print(f"[green]✓[/green] Specification saved to: [cyan]{spec_path}[/cyan]")
-        console.print()
+            console.print("[bold blue]Updating task status to 'in_progress'...[/bold blue]")
+            try:
+                status_update.result()
+                console.print("[green]✓[/green] Task status updated to 'in_progress'")
+            except RuntimeError as e:
+                # Handle status update failures gracefully - log warning but continue
+                console.print(f"[yellow]⚠[/yellow] Warning: Failed to update task status: {e}")
+                console.print("[dim]Continuing with workflow execution...[/dim]")
+            console.print()
 
-        # Display the spec to the user
+        # Display the spec to the user, rendering markdown only on a terminal;
+        # piped output and CI logs get the spec as written
         console.print("[bold blue]Task Specification:[/bold blue]")
-        console.print(Panel(Markdown(spec_content), border_style="blue"))
+        if console.is_terminal:
+            from rich.markdown import Markdown
+
+            console.print(Panel(Markdown(spec_content), border_style="blue"))
+        else:
+            console.print(spec_content, markup=False, highlight=False)
         console.print()
 
         # Save workflow state (initial planning phase)
@@ -260,6 +278,8 @@ def work(beads_id: str, model: str, show_plan: bool, dry_run: bool, strict: bool
 
         # Handle show-plan mode: wait for user approval
         if show_plan:
+            from rich.prompt import Confirm
+
             console.print()
             confirmed = Confirm.ask(
                 "[yellow]Proceed with workflow execution?[/yellow]",
@@ -316,30 +336,13 @@ def work(beads_id: str, model: str, show_plan: bool, dry_run: bool, strict: bool
                 event_logger,  # Pass event_logger for feature events
             )
 
-            # Phase transition: implementing -> verifying (use final_state from workflow)
-            console.print()
-            console.print("[bold blue]Transitioning to verifying phase...[/bold blue]")
-            from_phase = final_state.phase
-            final_state.phase = "verifying"
-            final_state.save(project_root)
-            event_logger.emit(
-                workflow_id=workflow_id,
-                event_type="workflow.phase_changed",
-                data={
-                    "beads_task_id": beads_id,
-                    "from_phase": from_phase,
-                    "to_phase": "verifying"
-                }
-            )
-            console.print("[green]✓[/green] Phase transition complete (phase: verifying)")
-            console.print()
-
-            # Check workflow result
-            if final_state.is_complete():
-                # Phase transition: verifying -> complete
-                console.print("[bold blue]Transitioning to complete phase...[/bold blue]")
+            # Write the post-run phase and completion events together
+            with event_logger.batch():
+                # Phase transition: implementing -> verifying (use final_state from workflow)
+                console.print()
+                console.print("[bold blue]Transitioning to verifying phase...[/bold blue]")
                 from_phase = final_state.phase
-                final_state.phase = "complete"
+                final_state.phase = "verifying"
                 final_state.save(project_root)
                 event_logger.emit(
                     workflow_id=workflow_id,
@@ -347,40 +350,59 @@ def work(beads_id: str, model: str, show_plan: bool, dry_run: bool, strict: bool
                     data={
                         "beads_task_id": beads_id,
                         "from_phase": from_phase,
-                        "to_phase": "complete"
+                        "to_phase": "verifying"
                     }
                 )
-                console.print("[green]✓[/green] Phase transition complete (phase: complete)")
+                console.print("[green]✓[/green] Phase transition complete (phase: verifying)")
                 console.print()
 
-                # Emit workflow.completed event
-                event_logger.emit(
-                    workflow_id=workflow_id,
-                    event_type="workflow.completed",
-                    data={"beads_task_id": beads_id}
-                )
-
-                console.print("[bold green]Workflow completed successfully![/bold green]")
-                console.print()
-
-                # Close Beads task on successful completion
-                console.print("[bold blue]Closing Beads task...[/bold blue]")
-                try:
-                    close_beads_task(beads_id)
-                    console.print("[green]✓[/green] Task closed successfully")
-                except RuntimeError as e:
-                    console.print(f"[yellow]⚠[/yellow] Warning: Failed to close task: {e}")
-                    console.print("[dim]Task completion tracking may be incomplete[/dim]")
-
-            elif final_state.is_failed():
-                console.print()
-                console.print("[bold red]Workflow failed[/bold red]")
-                console.print(f"[dim]Check state: agents/{final_state.workflow_id}/state.json[/dim]")
-                raise click.Abort()
-            else:
-                console.print()
-                console.print("[bold yellow]Workflow incomplete[/bold yellow]")
-                console.print(f"[dim]Resume with: jc resume {final_state.workflow_id}[/dim]")
+                # Check workflow result
+                if final_state.is_complete():
+                    # Phase transition: verifying -> complete
+                    console.print("[bold blue]Transitioning to complete phase...[/bold blue]")
+                    from_phase = final_state.phase
+                    final_state.phase = "complete"
+                    final_state.save(project_root)
+                    event_logger.emit(
+                        workflow_id=workflow_id,
+                        event_type="workflow.phase_changed",
+                        data={
+                            "beads_task_id": beads_id,
+                            "from_phase": from_phase,
+                            "to_phase": "complete"
+                        }
+                    )
+                    console.print("[green]✓[/green] Phase transition complete (phase: complete)")
+                    console.print()
+
+                    # Emit workflow.completed event
+                    event_logger.emit(
+                        workflow_id=workflow_id,
+                        event_type="workflow.completed",
+                        data={"beads_task_id": beads_id}
+                    )
+
+                    console.print("[bold green]Workflow completed successfully![/bold green]")
+                    console.print()
+
+                    # Close Beads task on successful completion
+                    console.print("[bold blue]Closing Beads task...[/bold blue]")
+                    try:
+                        close_beads_task(beads_id)
+                        console.print("[green]✓[/green] Task closed successfully")
+                    except RuntimeError as e:
+                        console.print(f"[yellow]⚠[/yellow] Warning: Failed to close task: {e}")
+                        console.print("[dim]Task completion tracking may be incomplete[/dim]")
+
+                elif final_state.is_failed():
+                    console.print()
+                    console.print("[bold red]Workflow failed[/bold red]")
+                    console.print(f"[dim]Check state: agents/{final_state.workflow_id}/state.json[/dim]")
+                    raise click.Abort()
+                else:
+                    console.print()
+                    console.print("[bold yellow]Workflow incomplete[/bold yellow]")
+                    console.print(f"[dim]Resume with: jc resume {final_state.workflow_id}[/dim]")
 
         except KeyboardInterrupt:
             console.print()
@@ -146,7 +146,7 @@ def workflow(
     if spec_file:
         console.print(f"[dim]Reading spec file: {spec_file}[/dim]")
         try:
-            task_description = spec_file.read_text()
+            task_description = spec_file.read_text(encoding="utf-8")
         except FileNotFoundError as e:
             console.print(f"[bold red]Error:[/bold red] Spec file not found at [cyan]{spec_file}[/cyan]")
             console.print(f"[dim]Details: {e}[/dim]")
@@ -3,6 +3,9 @@
 
 """Main CLI entry point for Jean Claude."""
 
+import importlib
+from typing import Any, Optional
+
 import click
 from rich.console import Console
 
@@ -11,7 +14,50 @@ from jean_claude import __version__
 console = Console()
 
 
-@click.group()
+# Subcommands as "module:attribute", imported only when the command is used.
+# Loading every command module up front pulls in the Agent SDK and the
+# orchestration stack, which dominates startup for commands that need neither.
+_LAZY_COMMANDS = {
+    "cleanup": "jean_claude.cli.commands.cleanup:cleanup",
+    "dashboard": "jean_claude.cli.commands.dashboard:dashboard",
+    "init": "jean_claude.cli.commands.init:init",
+    "initialize": "jean_claude.cli.commands.initialize:initialize",
+    "logs": "jean_claude.cli.commands.logs:logs",
+    "migrate": "jean_claude.cli.commands.migrate:migrate",
+    "note": "jean_claude.cli.commands.note:note",
+    "onboard": "jean_claude.cli.commands.onboard:onboard",
+    "prime": "jean_claude.cli.commands.prime:prime",
+    "prompt": "jean_claude.cli.commands.prompt:prompt",
+    "resume": "jean_claude.cli.commands.resume:resume",
+    "run": "jean_claude.cli.commands.run:run",
+    "status": "jean_claude.cli.commands.status:status",
+    "upgrade": "jean_claude.cli.commands.upgrade:upgrade",
+    "work": "jean_claude.cli.commands.work:work",
+    "workflow": "jean_claude.cli.commands.workflow:workflow",
+}
+
+
+class LazyGroup(click.Group):
+    """Click group that imports subcommand modules on first use."""
+
+    def __init__(self, *args: Any, lazy_commands: Optional[dict[str, str]] = None, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = lazy_commands or {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted({*super().list_commands(ctx), *self.lazy_commands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        command = super().get_command(ctx, cmd_name)
+        if command is None and cmd_name in self.lazy_commands:
+            module_name, attr = self.lazy_commands[cmd_name].split(":")
+            command = getattr(importlib.import_module(module_name), attr)
+            # Register so later lookups skip the import machinery
+            self.add_command(command, cmd_name)
+        return command
+
+
+@click.group(cls=LazyGroup, lazy_commands=_LAZY_COMMANDS)
 @click.version_option(version=__version__, prog_name="jc")
 @click.pass_context
 def cli(ctx: click.Context) -> None:
@@ -30,46 +76,8 @@ def version() -> None:
     console.print("[dim]AI-powered development workflows[/dim]")
 
 
-# Import and register commands
-from jean_claude.cli.commands import (
-    cleanup,
-    dashboard,
-    resume,
-    init,
-    initialize,
-    logs,
-    migrate,
-    note,
-    onboard,
-    prime,
-    prompt,
-    run,
-    status,
-    upgrade,
-    workflow,
-    work,
-)
-
-cli.add_command(cleanup.cleanup)
-cli.add_command(dashboard.dashboard)
-cli.add_command(resume.resume)
-cli.add_command(init.init)
-cli.add_command(initialize.initialize)
-cli.add_command(logs.logs)
-cli.add_command(migrate.migrate)
-cli.add_command(note.note)
-cli.add_command(onboard.onboard)
-cli.add_command(prime.prime)
-cli.add_command(prompt.prompt)
-cli.add_command(run.run)
-cli.add_command(status.status)
-cli.add_command(upgrade.upgrade)
-cli.add_command(workflow.workflow)
-cli.add_command(work.work)
-
 # Future commands (will be added as implemented):
-# from jean_claude.cli.commands import watch
-# cli.add_command(watch.watch)
+# "watch": "jean_claude.cli.commands.watch:watch",
 
 
 def main() -> None:
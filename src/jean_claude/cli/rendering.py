@@ -0,0 +1,29 @@
+# ABOUTME: Helpers for rendering Claude responses in the terminal
+# ABOUTME: Chooses Markdown or plain Text based on a cheap scan for markdown syntax
+
+"""Rendering helpers for Claude responses."""
+
+import re
+
+from rich.console import RenderableType
+from rich.text import Text
+
+# Markdown syntax worth rendering: headings, quotes, list items, code,
+# strong emphasis, links and table rows. Plain answers match none of these.
+_MARKDOWN_RE = re.compile(
+    r"^ {0,3}(?:#|>|[-*+]\s|\d+[.)]\s|\|)|`|\*\*|__|\[[^\]\n]*\]\(",
+    re.MULTILINE,
+)
+
+
+def response_renderable(text: str) -> RenderableType:
+    """Return a renderable for a response, parsing markdown only when present.
+
+    Text without markdown syntax is shown as-is, skipping the markdown
+    parser and keeping the response's own line breaks.
+    """
+    if _MARKDOWN_RE.search(text):
+        from rich.markdown import Markdown
+
+        return Markdown(text)
+    return Text(text)
@@ -5,12 +5,13 @@
 
 from typing import Any, AsyncIterator, Optional
 
-from rich.console import Console, Group
+from rich.console import Console, Group, RenderableType
 from rich.live import Live
-from rich.markdown import Markdown
 from rich.panel import Panel
 from rich.text import Text
 
+from jean_claude.cli.rendering import response_renderable
+
 try:
     from claude_agent_sdk import AssistantMessage, TextBlock, ToolResultMessage
 except ImportError:
@@ -35,6 +36,19 @@ class StreamingDisplay:
         self.text_blocks: list[str] = []
         self.tool_uses: list[tuple[str, str]] = []  # (tool_name, status)
         self.current_tool: Optional[str] = None
+        # Last accumulated text and its renderable; Markdown parses on
+        # construction, so it is rebuilt only when the text changes
+        self._rendered_text: Optional[str] = None
+        self._rendered_body: Optional[RenderableType] = None
+
+    def _text_renderable(self, text: str) -> RenderableType:
+        """Return the renderable for the accumulated text, reusing the last one."""
+        body = self._rendered_body
+        if body is None or text != self._rendered_text:
+            body = response_renderable(text)
+            self._rendered_body = body
+            self._rendered_text = text
+        return body
 
     def _create_display(self) -> Group:
         """Create the current display renderable."""
@@ -42,12 +56,7 @@ class StreamingDisplay:
 
         # Show accumulated text
         if self.text_blocks:
-            text = "\n".join(self.text_blocks)
-            try:
-                items.append(Markdown(text))
-            except Exception:
-                # Fall back to plain text if markdown parsing fails
-                items.append(Text(text))
+            items.append(self._text_renderable("\n".join(self.text_blocks)))
 
         # Show tool uses if enabled
         if self.show_thinking and self.tool_uses:
@@ -3,40 +3,102 @@
 
 """Core execution modules."""
 
-from jean_claude.core.agent import (
-    ExecutionResult,
-    PromptRequest,
-    RetryCode,
-    TemplateRequest,
-    execute_prompt,
-    execute_template,
-    find_claude_cli,
-    check_claude_installed,
-)
-from jean_claude.core.beads import BeadsTask, BeadsTaskStatus
-from jean_claude.core.beads_trailer_formatter import BeadsTrailerFormatter
-from jean_claude.core.blocker_detector import BlockerDetector, BlockerDetails, BlockerType
-from jean_claude.core.blocker_message_builder import BlockerMessageBuilder
-from jean_claude.core.commit_body_generator import CommitBodyGenerator
-from jean_claude.core.events import Event, EventLogger, EventType
-# event_models removed - not part of current architecture (uses raw SQL EventStore)
-from jean_claude.core.feature_commit_orchestrator import FeatureCommitOrchestrator
-from jean_claude.core.git_file_stager import GitFileStager
-from jean_claude.core.inbox_count import InboxCount
-from jean_claude.core.inbox_count_persistence import read_inbox_count, write_inbox_count
-from jean_claude.core.inbox_writer import InboxWriter
-from jean_claude.core.mailbox_api import Mailbox
-from jean_claude.core.mailbox_directory_manager import MailboxDirectoryManager
-from jean_claude.core.mailbox_paths import MailboxPaths
-from jean_claude.core.mailbox_projection_builder import MailboxProjectionBuilder
-from jean_claude.core.message import Message, MessagePriority
-from jean_claude.core.message_reader import read_messages
-from jean_claude.core.message_writer import MessageBox, write_message
-from jean_claude.core.state import Feature, WorkflowPhase, WorkflowState
-from jean_claude.core.task_validator import TaskValidator, ValidationResult
-from jean_claude.core.test_runner_validator import TestRunnerValidator
-from jean_claude.core.validation_output_formatter import ValidationOutputFormatter
-from jean_claude.core.workflow_event import WorkflowEvent
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from jean_claude.core.agent import (
+        ExecutionResult,
+        PromptRequest,
+        TemplateRequest,
+        execute_prompt,
+        execute_prompts_batch,
+        execute_template,
+        find_claude_cli,
+        check_claude_installed,
+    )
+    from jean_claude.core.beads import BeadsTask, BeadsTaskStatus
+    from jean_claude.core.beads_trailer_formatter import BeadsTrailerFormatter
+    from jean_claude.core.blocker_detector import BlockerDetector, BlockerDetails, BlockerType
+    from jean_claude.core.blocker_message_builder import BlockerMessageBuilder
+    from jean_claude.core.commit_body_generator import CommitBodyGenerator
+    from jean_claude.core.events import Event, EventLogger, EventType
+    # event_models removed - not part of current architecture (uses raw SQL EventStore)
+    from jean_claude.core.feature_commit_orchestrator import FeatureCommitOrchestrator
+    from jean_claude.core.git_file_stager import GitFileStager
+    from jean_claude.core.inbox_count import InboxCount
+    from jean_claude.core.inbox_count_persistence import read_inbox_count, write_inbox_count
+    from jean_claude.core.inbox_writer import InboxWriter
+    from jean_claude.core.mailbox_api import Mailbox
+    from jean_claude.core.mailbox_directory_manager import MailboxDirectoryManager
+    from jean_claude.core.mailbox_paths import MailboxPaths
+    from jean_claude.core.mailbox_projection_builder import MailboxProjectionBuilder
+    from jean_claude.core.message import Message, MessagePriority
+    from jean_claude.core.message_reader import read_messages
+    from jean_claude.core.message_writer import MessageBox, write_message
+    from jean_claude.core.retry import RetryCode
+    from jean_claude.core.state import Feature, WorkflowPhase, WorkflowState
+    from jean_claude.core.task_validator import TaskValidator, ValidationResult
+    from jean_claude.core.test_runner_validator import TestRunnerValidator
+    from jean_claude.core.validation_output_formatter import ValidationOutputFormatter
+    from jean_claude.core.workflow_event import WorkflowEvent
+
+# Public names by defining submodule. Submodules are imported on first
+# attribute access (PEP 562), so importing one submodule of this package
+# doesn't load every other one.
+_EXPORTS: dict[str, tuple[str, ...]] = {
+    "agent": (
+        "ExecutionResult",
+        "PromptRequest",
+        "TemplateRequest",
+        "execute_prompt",
+        "execute_prompts_batch",
+        "execute_template",
+        "find_claude_cli",
+        "check_claude_installed",
+    ),
+    "beads": ("BeadsTask", "BeadsTaskStatus"),
+    "beads_trailer_formatter": ("BeadsTrailerFormatter",),
+    "blocker_detector": ("BlockerDetector", "BlockerDetails", "BlockerType"),
+    "blocker_message_builder": ("BlockerMessageBuilder",),
+    "commit_body_generator": ("CommitBodyGenerator",),
+    "events": ("Event", "EventLogger", "EventType"),
+    "feature_commit_orchestrator": ("FeatureCommitOrchestrator",),
+    "git_file_stager": ("GitFileStager",),
+    "inbox_count": ("InboxCount",),
+    "inbox_count_persistence": ("read_inbox_count", "write_inbox_count"),
+    "inbox_writer": ("InboxWriter",),
+    "mailbox_api": ("Mailbox",),
+    "mailbox_directory_manager": ("MailboxDirectoryManager",),
+    "mailbox_paths": ("MailboxPaths",),
+    "mailbox_projection_builder": ("MailboxProjectionBuilder",),
+    "message": ("Message", "MessagePriority"),
+    "message_reader": ("read_messages",),
+    "message_writer": ("MessageBox", "write_message"),
+    "retry": ("RetryCode",),
+    "state": ("Feature", "WorkflowPhase", "WorkflowState"),
+    "task_validator": ("TaskValidator", "ValidationResult"),
+    "test_runner_validator": ("TestRunnerValidator",),
+    "validation_output_formatter": ("ValidationOutputFormatter",),
+    "workflow_event": ("WorkflowEvent",),
+}
+
+_LAZY_IMPORTS = {name: module for module, names in _EXPORTS.items() for name in names}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    # Cache on the package so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
+
 
 __all__ = [
     "BeadsTask",
@@ -74,6 +136,7 @@ __all__ = [
     "WorkflowPhase",
     "WorkflowState",
     "execute_prompt",
+    "execute_prompts_batch",
     "execute_template",
     "find_claude_cli",
     "check_claude_installed",
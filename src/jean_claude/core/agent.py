@@ -16,27 +16,30 @@ The SDK backend is preferred as it provides better performance, proper async
 support, and cleaner error handling.
 """
 
+import functools
 import json
 import os
+import secrets
+import shutil
 import subprocess
 import time
-import uuid
-from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional, Tuple
+from typing import Any, Callable, Dict, Final, List, Literal, Optional, Tuple
 
 import anyio
+import pydantic_core
+from anyio.abc import ByteReceiveStream
+from anyio.streams.text import TextReceiveStream
 from pydantic import BaseModel
 
-
-class RetryCode(str, Enum):
-    """Codes indicating different types of errors that may be retryable."""
-
-    CLAUDE_CODE_ERROR = "claude_code_error"
-    TIMEOUT_ERROR = "timeout_error"
-    EXECUTION_ERROR = "execution_error"
-    ERROR_DURING_EXECUTION = "error_during_execution"
-    NONE = "none"
+from jean_claude.core.cache import user_cache_dir
+from jean_claude.core.rate_limiter import claude_rate_limiter
+from jean_claude.core.retry import (
+    RetryCode,
+    error_retry_code,
+    record_rate_limit_outcome,
+    retry_delay,
+)
 
 
 class ExecutionResult(BaseModel):
@@ -77,14 +80,26 @@ class TemplateRequest(BaseModel):
 
 
 # Output file name constants
-OUTPUT_JSONL = "cc_raw_output.jsonl"
-OUTPUT_JSON = "cc_raw_output.json"
-FINAL_OBJECT_JSON = "cc_final_object.json"
+OUTPUT_JSONL: Final = "cc_raw_output.jsonl"
+FINAL_OBJECT_JSON: Final = "cc_final_object.json"
+
+# Install locations checked when the Claude CLI is not on PATH
+# (~ is expanded once at import)
+_COMMON_CLAUDE_PATHS: Final[tuple[str, ...]] = (
+    os.path.expanduser("~/.claude/local/claude"),
+    "/usr/local/bin/claude",
+    "/opt/homebrew/bin/claude",
+    "/usr/bin/claude",
+)
 
 
 def generate_workflow_id() -> str:
-    """Generate a short 8-character UUID for workflow tracking."""
-    return str(uuid.uuid4())[:8]
+    """Generate a short 8-character hex ID for workflow tracking.
+
+    Same format and entropy (32 random bits) as the first 8 characters of
+    a UUID4, without building and formatting a full UUID.
+    """
+    return secrets.token_hex(4)
 
 
 def find_claude_cli() -> str:
@@ -95,34 +110,27 @@ def find_claude_cli() -> str:
     2. `which claude` command
     3. Common installation locations
     4. Fall back to "claude"
+
+    The search is remembered for the current CLAUDE_CODE_PATH and PATH, so
+    repeated prompts don't stat every PATH entry again.
     """
+    return _find_claude_cli(os.getenv("CLAUDE_CODE_PATH"), os.getenv("PATH"))
+
+
+@functools.lru_cache(maxsize=4)
+def _find_claude_cli(env_path: Optional[str], search_path: Optional[str]) -> str:
+    """Search for the Claude CLI given CLAUDE_CODE_PATH and PATH."""
     # Check environment variable first
-    env_path = os.getenv("CLAUDE_CODE_PATH")
     if env_path:
         return env_path
 
-    # Try `which claude`
-    try:
-        result = subprocess.run(
-            ["which", "claude"],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-        if result.returncode == 0 and result.stdout.strip():
-            return result.stdout.strip()
-    except Exception:
-        pass
+    # Search PATH like `which claude`, without forking a process
+    which_path = shutil.which("claude", path=search_path)
+    if which_path:
+        return which_path
 
     # Check common locations
-    common_locations = [
-        os.path.expanduser("~/.claude/local/claude"),
-        "/usr/local/bin/claude",
-        "/opt/homebrew/bin/claude",
-        "/usr/bin/claude",
-    ]
-
-    for location in common_locations:
+    for location in _COMMON_CLAUDE_PATHS:
         if os.path.isfile(location) and os.access(location, os.X_OK):
             return location
 
@@ -151,13 +159,50 @@ def get_subprocess_env() -> Dict[str, str]:
     return {k: v for k, v in safe_vars.items() if v is not None}
 
 
+# Claude CLI binaries that passed `--version` in this process, keyed by
+# (path, mtime_ns, size) so a replaced binary is probed again
+_verified_claude_binaries: set[Tuple[str, int, int]] = set()
+
+
+def _claude_probe_stamp_path() -> Path:
+    """Return the file recording the last Claude CLI binary that passed the probe."""
+    return user_cache_dir() / "claude_ok"
+
+
 def check_claude_installed() -> Optional[str]:
     """Check if Claude Code CLI is installed.
 
+    Running `claude --version` starts a Node process, so a successful probe
+    is remembered for the binary's (path, mtime, size): in-process, and in a
+    stamp file under $XDG_CACHE_HOME/jean-claude for later invocations. A
+    stat of the binary is enough to reuse the result; an updated, moved or
+    deleted binary is probed again.
+
     Returns:
         Error message if not installed, None if OK
     """
     claude_path = find_claude_cli()
+
+    try:
+        stat = os.stat(claude_path)
+        binary_key: Optional[Tuple[str, int, int]] = (
+            os.path.abspath(claude_path), stat.st_mtime_ns, stat.st_size
+        )
+    except OSError:
+        binary_key = None
+
+    if binary_key is not None:
+        if binary_key in _verified_claude_binaries:
+            return None
+        stamp = "\t".join(map(str, binary_key))
+        stamp_path = _claude_probe_stamp_path()
+        try:
+            if stamp_path.read_text(encoding="utf-8") == stamp:
+                _verified_claude_binaries.add(binary_key)
+                return None
+        except OSError:
+            pass
+
     try:
         result = subprocess.run(
             [claude_path, "--version"],
@@ -168,59 +213,16 @@ def check_claude_installed() -> Optional[str]:
             return f"Claude Code CLI error at: {claude_path}"
     except FileNotFoundError:
         return f"Claude Code CLI not found. Expected at: {claude_path}"
-    return None
-
-
-def parse_jsonl_output(
-    output_file: Path,
-) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
-    """Parse JSONL output file.
-
-    Returns:
-        Tuple of (all_messages, result_message)
-    """
-    try:
-        with open(output_file) as f:
-            messages = [json.loads(line) for line in f if line.strip()]
-
-        result_message = None
-        for msg in reversed(messages):
-            if msg.get("type") == "result":
-                result_message = msg
-                break
-
-        return messages, result_message
-    except Exception:
-        return [], None
-
 
-def convert_jsonl_to_json(jsonl_file: Path) -> Path:
-    """Convert JSONL file to JSON array file."""
-    json_file = jsonl_file.parent / OUTPUT_JSON
-    messages, _ = parse_jsonl_output(jsonl_file)
-
-    with open(json_file, "w") as f:
-        json.dump(messages, f, indent=2)
-
-    return json_file
-
-
-def save_final_result(json_file: Path) -> Optional[Path]:
-    """Save the last entry from JSON array as final result."""
-    try:
-        with open(json_file) as f:
-            messages = json.load(f)
-
-        if not messages:
-            return None
-
-        final_file = json_file.parent / FINAL_OBJECT_JSON
-        with open(final_file, "w") as f:
-            json.dump(messages[-1], f, indent=2)
-
-        return final_file
-    except Exception:
-        return None
+    if binary_key is not None:
+        _verified_claude_binaries.add(binary_key)
+        try:
+            stamp_path.parent.mkdir(parents=True, exist_ok=True)
+            stamp_path.write_text(stamp, encoding="utf-8")
+        except OSError:
+            # The stamp only saves a probe on the next run
+            pass
+    return None
 
 
 def truncate_output(
@@ -275,12 +277,14 @@ def _ensure_claude_in_path() -> None:
 async def _execute_prompt_sdk_async(
     request: PromptRequest,
     max_retries: int = 3,
+    on_message: Optional[Callable[[Any], None]] = None,
 ) -> ExecutionResult:
     """Execute a prompt using the Claude Code SDK with retry logic (async).
 
     Args:
         request: The prompt request configuration
         max_retries: Maximum retry attempts (default: 3)
+        on_message: Optional callback invoked with each SDK message as it arrives
 
     Returns:
         ExecutionResult with output and status
@@ -299,13 +303,15 @@ async def _execute_prompt_sdk_async(
     # Ensure Claude CLI can be found
     _ensure_claude_in_path()
 
-    retry_delays = [1, 3, 5]
-    last_result = None
+    last_result: Optional[ExecutionResult] = None
 
     for attempt in range(max_retries + 1):
         if attempt > 0:
-            delay = retry_delays[min(attempt - 1, len(retry_delays) - 1)]
-            await anyio.sleep(delay)
+            assert last_result is not None
+            delay = retry_delay(last_result.retry_code, attempt)
+            if delay:
+                await anyio.sleep(delay)
+        await claude_rate_limiter.acquire()
 
         # Execute single attempt
         start_time = time.time()
@@ -330,6 +336,8 @@ async def _execute_prompt_sdk_async(
             async for message in query(prompt=request.prompt, options=options):
                 msg_dict = _serialize_sdk_message(message)
                 messages.append(msg_dict)
+                if on_message is not None:
+                    on_message(message)
 
                 if isinstance(message, AssistantMessage):
                     for block in message.content:
@@ -361,6 +369,7 @@ async def _execute_prompt_sdk_async(
                     output=output,
                     success=not is_error,
                     session_id=session_id,
+                    retry_code=error_retry_code(output) if is_error else RetryCode.NONE,
                     cost_usd=cost_usd,
                     duration_ms=duration_ms,
                 )
@@ -376,7 +385,7 @@ async def _execute_prompt_sdk_async(
             result = ExecutionResult(
                 output=f"Claude Code error: exit code {e.exit_code}",
                 success=False,
-                retry_code=RetryCode.CLAUDE_CODE_ERROR,
+                retry_code=error_retry_code(f"{e} {e.stderr or ''}", RetryCode.CLAUDE_CODE_ERROR),
             )
 
         except ClaudeSDKError as e:
@@ -401,6 +410,7 @@ async def _execute_prompt_sdk_async(
             )
 
         last_result = result
+        record_rate_limit_outcome(claude_rate_limiter, result)
 
         if result.success or result.retry_code == RetryCode.NONE:
             return result
@@ -456,10 +466,6 @@ def _save_sdk_outputs(
         for msg in messages:
             f.write(json.dumps(msg) + "\n")
 
-    json_file = output_dir / OUTPUT_JSON
-    with open(json_file, "w") as f:
-        json.dump(messages, f, indent=2)
-
     if result_message:
         final_file = output_dir / FINAL_OBJECT_JSON
         with open(final_file, "w") as f:
@@ -470,6 +476,7 @@ def execute_prompt(
     request: PromptRequest,
     max_retries: int = 3,
     use_sdk: Optional[bool] = None,
+    on_message: Optional[Callable[[Any], None]] = None,
 ) -> ExecutionResult:
     """Execute a prompt with Claude Code with retry logic.
 
@@ -482,6 +489,9 @@ def execute_prompt(
         max_retries: Maximum retry attempts (default: 3)
         use_sdk: Force SDK (True) or subprocess (False) backend.
                  If None, automatically uses SDK if available.
+        on_message: Optional callback invoked with each SDK message as it
+                    arrives, e.g. to report progress. The subprocess backend
+                    produces no intermediate messages and never calls it.
 
     Returns:
         ExecutionResult with output and status
@@ -493,19 +503,73 @@ def execute_prompt(
     if use_sdk:
         # Use SDK backend - run async code from sync CLI context
         async def _run() -> ExecutionResult:
-            return await _execute_prompt_sdk_async(request, max_retries)
+            return await _execute_prompt_sdk_async(request, max_retries, on_message)
 
         return anyio.run(_run)
 
     # Fall back to subprocess backend
-    return _execute_prompt_subprocess(request, max_retries)
+    return anyio.run(_execute_prompt_subprocess_async, request, max_retries)
+
 
+async def execute_prompts_batch(
+    requests: List[PromptRequest],
+    max_concurrency: int = 4,
+    max_retries: int = 3,
+    use_sdk: Optional[bool] = None,
+    on_result: Optional[Callable[[int, ExecutionResult], None]] = None,
+) -> List[ExecutionResult]:
+    """Execute several independent prompts concurrently.
 
-def _execute_prompt_subprocess(
+    At most `max_concurrency` prompts run at once; the rest wait for a slot.
+    A prompt that raises is reported as a failed result instead of
+    cancelling the others, so the batch always returns one result per
+    request, in request order.
+
+    Args:
+        requests: The prompt requests to execute
+        max_concurrency: Maximum prompts running at the same time (default: 4)
+        max_retries: Maximum retry attempts per prompt (default: 3)
+        use_sdk: Force SDK (True) or subprocess (False) backend.
+                 If None, automatically uses SDK if available.
+        on_result: Optional callback invoked with (request index, result) as
+                   each prompt finishes, in completion order
+
+    Returns:
+        List of ExecutionResult, one per request in the same order
+    """
+    if use_sdk is None:
+        use_sdk = _is_sdk_available()
+    execute = _execute_prompt_sdk_async if use_sdk else _execute_prompt_subprocess_async
+
+    limiter = anyio.CapacityLimiter(max_concurrency)
+    results: List[Optional[ExecutionResult]] = [None] * len(requests)
+
+    async def run_one(index: int, request: PromptRequest) -> None:
+        async with limiter:
+            try:
+                result = await execute(request, max_retries)
+            except Exception as e:
+                result = ExecutionResult(
+                    output=f"Execution error: {e}",
+                    success=False,
+                    retry_code=RetryCode.EXECUTION_ERROR,
+                )
+        results[index] = result
+        if on_result is not None:
+            on_result(index, result)
+
+    async with anyio.create_task_group() as tg:
+        for index, request in enumerate(requests):
+            tg.start_soon(run_one, index, request)
+
+    return [result for result in results if result is not None]
+
+
+async def _execute_prompt_subprocess_async(
     request: PromptRequest,
     max_retries: int = 3,
 ) -> ExecutionResult:
-    """Execute a prompt using subprocess (fallback backend).
+    """Execute a prompt using the Claude CLI subprocess (fallback backend).
 
     Args:
         request: The prompt request configuration
@@ -514,16 +578,29 @@ def _execute_prompt_subprocess(
     Returns:
         ExecutionResult with output and status
     """
-    retry_delays = [1, 3, 5]
-    last_result = None
+    # Checked once per prompt rather than per attempt: a missing CLI is
+    # not retried, and retries skip the probe
+    error_msg = check_claude_installed()
+    if error_msg:
+        return ExecutionResult(
+            output=error_msg,
+            success=False,
+            retry_code=RetryCode.NONE,
+        )
+
+    last_result: Optional[ExecutionResult] = None
 
     for attempt in range(max_retries + 1):
         if attempt > 0:
-            delay = retry_delays[min(attempt - 1, len(retry_delays) - 1)]
-            time.sleep(delay)
+            assert last_result is not None
+            delay = retry_delay(last_result.retry_code, attempt)
+            if delay:
+                await anyio.sleep(delay)
+        await claude_rate_limiter.acquire()
 
-        result = _execute_prompt_once(request)
+        result = await _execute_prompt_once(request)
         last_result = result
+        record_rate_limit_outcome(claude_rate_limiter, result)
 
         if result.success or result.retry_code == RetryCode.NONE:
             return result
@@ -538,17 +615,30 @@ def _execute_prompt_subprocess(
     )
 
 
-def _execute_prompt_once(request: PromptRequest) -> ExecutionResult:
-    """Execute a single prompt attempt."""
-    # Check Claude installation
-    error_msg = check_claude_installed()
-    if error_msg:
-        return ExecutionResult(
-            output=error_msg,
-            success=False,
-            retry_code=RetryCode.NONE,
-        )
+def _parse_jsonl_lines(lines: List[str]) -> List[Dict[str, Any]]:
+    """Parse complete JSONL lines, skipping blank and malformed ones.
 
+    Uses pydantic-core's JSON parser, about twice as fast as json.loads on
+    stream-json messages.
+    """
+    messages = []
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            messages.append(pydantic_core.from_json(line))
+        except ValueError:
+            continue
+    return messages
+
+
+async def _execute_prompt_once(request: PromptRequest) -> ExecutionResult:
+    """Execute a single prompt attempt.
+
+    The CLI's stream-json output is copied to the output file and parsed
+    line by line as it arrives, without blocking the event loop. Only the
+    last message and the last result message are kept in memory.
+    """
     claude_path = find_claude_cli()
 
     # Set up output directory
@@ -581,20 +671,58 @@ def _execute_prompt_once(request: PromptRequest) -> ExecutionResult:
     working_dir = str(request.working_dir) if request.working_dir else None
 
     try:
-        with open(output_file, "w") as f:
-            result = subprocess.run(
-                cmd,
-                stdout=f,
-                stderr=subprocess.PIPE,
-                text=True,
-                env=env,
-                cwd=working_dir,
-            )
-
-        if result.returncode == 0:
-            messages, result_msg = parse_jsonl_output(output_file)
-            convert_jsonl_to_json(output_file)
-            save_final_result(output_file.parent / OUTPUT_JSON)
+        last_msg: Optional[Dict[str, Any]] = None
+        result_msg: Optional[Dict[str, Any]] = None
+        stderr_chunks: List[str] = []
+
+        def handle_lines(lines: List[str]) -> None:
+            """Track the last message and the last result message."""
+            nonlocal last_msg, result_msg
+            for msg in _parse_jsonl_lines(lines):
+                last_msg = msg
+                if msg.get("type") == "result":
+                    result_msg = msg
+
+        async def drain_stderr(stream: ByteReceiveStream) -> None:
+            # Read stderr alongside stdout so a full pipe can't stall the CLI
+            async for chunk in TextReceiveStream(stream):
+                stderr_chunks.append(chunk)
+
+        async with await anyio.open_process(
+            cmd,
+            stdin=None,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            env=env,
+            cwd=working_dir,
+        ) as process:
+            assert process.stdout is not None and process.stderr is not None
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(drain_stderr, process.stderr)
+                # The file is written from a worker thread so a slow disk
+                # doesn't stall other prompts running on this event loop
+                async with await anyio.open_file(output_file, "w", encoding="utf-8") as f:
+                    # Pieces of the unfinished last line; only joined once its
+                    # newline arrives, so a multi-MB line isn't rescanned
+                    # for every chunk
+                    pending: List[str] = []
+                    async for chunk in TextReceiveStream(process.stdout):
+                        await f.write(chunk)
+                        if "\n" not in chunk:
+                            pending.append(chunk)
+                            continue
+                        head, *lines, tail = chunk.split("\n")
+                        pending.append(head)
+                        handle_lines(["".join(pending), *lines])
+                        pending = [tail]
+                    handle_lines(["".join(pending)])
+            await process.wait()
+
+        if process.returncode == 0:
+            if last_msg is not None:
+                await anyio.Path(output_dir / FINAL_OBJECT_JSON).write_bytes(
+                    pydantic_core.to_json(last_msg, indent=2)
+                )
 
             if result_msg:
                 session_id = result_msg.get("session_id")
@@ -617,6 +745,7 @@ def _execute_prompt_once(request: PromptRequest) -> ExecutionResult:
                     output=result_text,
                     success=not is_error,
                     session_id=session_id,
+                    retry_code=error_retry_code(result_text) if is_error else RetryCode.NONE,
                     cost_usd=result_msg.get("total_cost_usd"),
                     duration_ms=result_msg.get("duration_ms"),
                 )
@@ -627,19 +756,13 @@ def _execute_prompt_once(request: PromptRequest) -> ExecutionResult:
                     retry_code=RetryCode.NONE,
                 )
         else:
-            stderr_msg = result.stderr.strip() if result.stderr else ""
+            stderr_msg = "".join(stderr_chunks).strip()
             return ExecutionResult(
-                output=f"Claude Code error: {stderr_msg or f'exit code {result.returncode}'}",
+                output=f"Claude Code error: {stderr_msg or f'exit code {process.returncode}'}",
                 success=False,
-                retry_code=RetryCode.CLAUDE_CODE_ERROR,
+                retry_code=error_retry_code(stderr_msg, RetryCode.CLAUDE_CODE_ERROR),
             )
 
-    except subprocess.TimeoutExpired:
-        return ExecutionResult(
-            output="Command timed out",
-            success=False,
-            retry_code=RetryCode.TIMEOUT_ERROR,
-        )
     except Exception as e:
         return ExecutionResult(
             output=f"Execution error: {e}",
@@ -651,6 +774,7 @@ def _execute_prompt_once(request: PromptRequest) -> ExecutionResult:
 def execute_template(
     request: TemplateRequest,
     use_sdk: Optional[bool] = None,
+    on_message: Optional[Callable[[Any], None]] = None,
 ) -> ExecutionResult:
     """Execute a slash command template.
 
@@ -670,6 +794,8 @@ def execute_template(
         request: The template request configuration
         use_sdk: Force SDK (True) or subprocess (False) backend.
                  If None, automatically uses SDK if available.
+        on_message: Optional callback invoked with each SDK message as it
+                    arrives (see execute_prompt())
 
     Returns:
         ExecutionResult with output and status
@@ -685,4 +811,4 @@ def execute_template(
         dangerously_skip_permissions=True,
     )
 
-    return execute_prompt(prompt_request, use_sdk=use_sdk)
+    return execute_prompt(prompt_request, use_sdk=use_sdk, on_message=on_message)
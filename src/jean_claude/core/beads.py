@@ -21,6 +21,9 @@ from pydantic import AliasChoices, BaseModel, Field, field_validator
 # Pattern for validating beads task IDs (e.g., beads-123, gt-abc, hq-x1y2)
 # Format: 2-5 letters (case insensitive), hyphen, one or more letters or digits
 # Note: Allowing up to 5 characters to support common prefixes like "beads"
+# The pattern has no nested quantifiers, so matching is linear in the input
+# length even for adversarial IDs. Use fullmatch(): with match(), '$' would
+# also accept a trailing newline.
 BEADS_ID_PATTERN = re.compile(r'^[a-zA-Z]{2,5}-[a-zA-Z0-9]+$')
 
 
@@ -55,6 +58,39 @@ class BeadsTaskType(str, Enum):
     EPIC = 'epic'
 
 
+# Normalization tables for BeadsTask validators, built once at import time.
+# Validators try the raw value first and only lowercase on a miss, so inputs
+# already in canonical form skip the str.lower() allocation.
+# Beads CLI status values (lowercased) mapped to internal enum values
+_STATUS_ALIASES: dict[str, BeadsTaskStatus] = {
+    'open': BeadsTaskStatus.OPEN,
+    'not_started': BeadsTaskStatus.OPEN,
+    'todo': BeadsTaskStatus.OPEN,
+    'in_progress': BeadsTaskStatus.IN_PROGRESS,
+    'done': BeadsTaskStatus.CLOSED,
+    'closed': BeadsTaskStatus.CLOSED,
+}
+
+# Integer priorities (0-4) mapped to word-based priorities
+_PRIORITY_BY_INT: dict[int, BeadsTaskPriority] = {
+    0: BeadsTaskPriority.CRITICAL,
+    1: BeadsTaskPriority.HIGH,
+    2: BeadsTaskPriority.MEDIUM,
+    3: BeadsTaskPriority.LOW,
+    4: BeadsTaskPriority.LOW,
+}
+
+# Lowercased priority names, plus the P0-P4 format in both cases
+_PRIORITY_BY_NAME: dict[str, BeadsTaskPriority] = {
+    **{p.value: p for p in BeadsTaskPriority},
+    **{f'p{i}': p for i, p in _PRIORITY_BY_INT.items()},
+    **{f'P{i}': p for i, p in _PRIORITY_BY_INT.items()},
+}
+
+# Lowercased task type names
+_TASK_TYPE_BY_NAME: dict[str, BeadsTaskType] = {t.value: t for t in BeadsTaskType}
+
+
 class BeadsTask(BaseModel):
     """Model representing a Beads task.
 
@@ -136,16 +172,7 @@ class BeadsTask(BaseModel):
                 raise ValueError("status cannot be empty")
 
             # Map Beads CLI status values to internal enum
-            status_map = {
-                'open': BeadsTaskStatus.OPEN,
-                'not_started': BeadsTaskStatus.OPEN,
-                'todo': BeadsTaskStatus.OPEN,
-                'in_progress': BeadsTaskStatus.IN_PROGRESS,
-                'done': BeadsTaskStatus.CLOSED,
-                'closed': BeadsTaskStatus.CLOSED,
-            }
-
-            normalized = status_map.get(v.lower())
+            normalized = _STATUS_ALIASES.get(v) or _STATUS_ALIASES.get(v.lower())
             if normalized:
                 return normalized
 
@@ -179,37 +206,19 @@ class BeadsTask(BaseModel):
 
         # Map integer priority (0-4) to word-based priority
         if isinstance(v, int):
-            int_mapping = {
-                0: 'critical',
-                1: 'high',
-                2: 'medium',
-                3: 'low',
-                4: 'low',
-            }
-            if v in int_mapping:
-                return BeadsTaskPriority(int_mapping[v])
+            priority = _PRIORITY_BY_INT.get(v)
+            if priority is not None:
+                return priority
             raise ValueError(f"Invalid priority: {v}. Must be 0-4")
 
         if isinstance(v, str):
-            # Map P0-P4 format to word-based priority
-            priority_mapping = {
-                'p0': 'critical',
-                'p1': 'high',
-                'p2': 'medium',
-                'p3': 'low',
-                'p4': 'low',
-            }
-            normalized = v.lower()
-            if normalized in priority_mapping:
-                normalized = priority_mapping[normalized]
-
-            # Try to create enum from value
-            try:
-                return BeadsTaskPriority(normalized)
-            except ValueError:
-                raise ValueError(
-                    f"Invalid priority: {v}. Must be one of: low, medium, high, critical (or P0-P4)"
-                )
+            # Word-based names and the P0-P4 format share one lookup
+            priority = _PRIORITY_BY_NAME.get(v) or _PRIORITY_BY_NAME.get(v.lower())
+            if priority is not None:
+                return priority
+            raise ValueError(
+                f"Invalid priority: {v}. Must be one of: low, medium, high, critical (or P0-P4)"
+            )
 
         return v
 
@@ -234,13 +243,12 @@ class BeadsTask(BaseModel):
             return v
 
         if isinstance(v, str):
-            # Try to create enum from value
-            try:
-                return BeadsTaskType(v.lower())
-            except ValueError:
-                raise ValueError(
-                    f"Invalid task_type: {v}. Must be one of: bug, feature, chore, docs, task, epic"
-                )
+            task_type = _TASK_TYPE_BY_NAME.get(v) or _TASK_TYPE_BY_NAME.get(v.lower())
+            if task_type is not None:
+                return task_type
+            raise ValueError(
+                f"Invalid task_type: {v}. Must be one of: bug, feature, chore, docs, task, epic"
+            )
 
         return v
 
@@ -296,7 +304,7 @@ class BeadsTask(BaseModel):
         Raises:
             ValidationError: If required fields are missing or invalid
         """
-        return cls(**data)
+        return cls.model_validate(data)
 
     def to_dict(self) -> dict:
         """Convert the BeadsTask instance to a dictionary.
@@ -329,7 +337,7 @@ def validate_beads_id(task_id: str) -> None:
     if not task_id or not task_id.strip():
         raise ValueError("task_id cannot be empty")
 
-    if not BEADS_ID_PATTERN.match(task_id):
+    if not BEADS_ID_PATTERN.fullmatch(task_id):
         raise ValueError(
             f"Invalid beads task ID format: '{task_id}'. "
             f"Task IDs must match the pattern: <prefix>-<id> "
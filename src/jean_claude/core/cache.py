@@ -0,0 +1,135 @@
+# ABOUTME: On-disk cache helpers for Jean Claude under the user's cache directory
+# ABOUTME: Provides exact-match prompt response caching keyed by model, prompt, and working dir
+
+"""On-disk cache helpers.
+
+Cached data lives under ``$XDG_CACHE_HOME/jean-claude`` (``~/.cache`` when
+unset). Prompt responses are stored as one JSON file per cache key and are
+only reused while younger than a TTL. All reads treat a missing, expired or
+corrupted entry as a cache miss.
+"""
+
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+# How long a cached prompt response stays valid
+PROMPT_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+
+def user_cache_dir() -> Path:
+    """Return Jean Claude's cache directory, honoring XDG_CACHE_HOME."""
+    cache_home = os.getenv("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return Path(cache_home) / "jean-claude"
+
+
+def prompt_cache_dir() -> Path:
+    """Return the directory holding cached prompt responses."""
+    return user_cache_dir() / "prompts"
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Normalize whitespace in a prompt that cannot change its meaning.
+
+    Strips leading/trailing blank space, trailing spaces on each line and
+    CRLF line endings. Indentation and interior spacing are kept, since they
+    can be significant in code snippets.
+    """
+    return "\n".join(line.rstrip() for line in prompt.strip().splitlines())
+
+
+def prompt_cache_key(model: str, prompt: str, working_dir: Path | str | None) -> str:
+    """Build the cache key for a prompt request.
+
+    Prompts that differ only in insignificant whitespace share a key (see
+    normalize_prompt()); otherwise the prompt text is compared exactly.
+
+    Args:
+        model: Claude model name
+        prompt: Prompt text
+        working_dir: Directory the prompt runs in
+
+    Returns:
+        Hex SHA-256 digest identifying the request
+    """
+    payload = json.dumps(
+        {
+            "model": model,
+            "prompt": normalize_prompt(prompt),
+            "working_dir": str(working_dir) if working_dir is not None else None,
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def load_cached_response(
+    key: str,
+    ttl_seconds: float = PROMPT_CACHE_TTL_SECONDS,
+    cache_dir: Optional[Path] = None,
+) -> Optional[dict[str, Any]]:
+    """Load a cached prompt response.
+
+    Args:
+        key: Cache key from prompt_cache_key()
+        ttl_seconds: Maximum age of the entry in seconds
+        cache_dir: Directory to read from (default: prompt_cache_dir())
+
+    Returns:
+        The cached response data, or None on a miss, an expired entry, or
+        an unreadable file
+    """
+    path = (cache_dir or prompt_cache_dir()) / f"{key}.json"
+    try:
+        if time.time() - path.stat().st_mtime > ttl_seconds:
+            return None
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def save_cached_response(
+    key: str,
+    data: dict[str, Any],
+    cache_dir: Optional[Path] = None,
+) -> None:
+    """Save a prompt response to the cache.
+
+    The entry is written to a temporary file and renamed into place so a
+    concurrent reader never sees a partial file. Write failures are ignored;
+    the cache is an optimization only.
+
+    Args:
+        key: Cache key from prompt_cache_key()
+        data: JSON-serializable response data
+        cache_dir: Directory to write to (default: prompt_cache_dir())
+    """
+    directory = cache_dir or prompt_cache_dir()
+    path = directory / f"{key}.json"
+    temp_path: Optional[Path] = None
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        # A uniquely named temp file per write, so concurrent writers of the
+        # same key (e.g. --batch prompts) never truncate each other's file
+        with tempfile.NamedTemporaryFile(
+            "w",
+            encoding="utf-8",
+            dir=directory,
+            prefix=f"{key}.json.",
+            suffix=".tmp",
+            delete=False,
+        ) as f:
+            temp_path = Path(f.name)
+            json.dump(data, f)
+        os.replace(temp_path, path)
+    except OSError:
+        if temp_path is not None:
+            with contextlib.suppress(OSError):
+                temp_path.unlink()
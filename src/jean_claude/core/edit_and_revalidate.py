@@ -8,11 +8,13 @@ it to check if the edits improved the task quality.
 """
 
 from jean_claude.core.edit_task_handler import EditTaskHandler
-from jean_claude.core.beads import fetch_beads_task
+from jean_claude.core.beads import BeadsTask, fetch_beads_task
 from jean_claude.core.task_validator import TaskValidator, ValidationResult
 
 
-def edit_and_revalidate(task_id: str, strict: bool = False) -> ValidationResult:
+def edit_and_revalidate(
+    task_id: str, strict: bool = False
+) -> tuple[ValidationResult, BeadsTask]:
     """Edit a Beads task and re-validate after editing.
 
     This function performs the complete edit and revalidate flow:
@@ -20,14 +22,15 @@ def edit_and_revalidate(task_id: str, strict: bool = False) -> ValidationResult:
     2. Waits for the user to finish editing
     3. Fetches the updated task from Beads
     4. Validates the updated task
-    5. Returns the validation result
+    5. Returns the validation result along with the updated task
 
     Args:
         task_id: The ID of the task to edit
         strict: Whether to use strict validation mode (converts warnings to errors)
 
     Returns:
-        ValidationResult with the validation status of the edited task
+        Tuple of the ValidationResult for the edited task and the updated
+        BeadsTask, so callers don't need to fetch it again
 
     Raises:
         ValueError: If task_id is empty or None
@@ -48,4 +51,4 @@ def edit_and_revalidate(task_id: str, strict: bool = False) -> ValidationResult:
     if strict and result.has_warnings():
         result = result.to_strict()
 
-    return result
+    return result, task
@@ -36,6 +36,8 @@ streamable/tail-able (JSONL) for different use cases.
 
 import json
 import sqlite3
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -315,6 +317,14 @@ class SQLiteEventWriter:
         Args:
             event: The event to write
         """
+        self.write_events([event])
+
+    def write_events(self, events: list[Event]) -> None:
+        """Write several events to the database in a single transaction.
+
+        Args:
+            events: The events to write, in order
+        """
         # Ensure schema exists before writing
         if not self._schema_initialized:
             self._ensure_schema()
@@ -322,18 +332,21 @@ class SQLiteEventWriter:
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
 
-        cursor.execute(
+        cursor.executemany(
             """
             INSERT INTO events (id, timestamp, workflow_id, event_type, data)
             VALUES (?, ?, ?, ?, ?)
             """,
-            (
-                str(event.id),
-                event.timestamp.isoformat(),
-                event.workflow_id,
-                event.event_type.value,
-                json.dumps(event.data),
-            ),
+            [
+                (
+                    str(event.id),
+                    event.timestamp.isoformat(),
+                    event.workflow_id,
+                    event.event_type.value,
+                    json.dumps(event.data),
+                )
+                for event in events
+            ],
         )
 
         conn.commit()
@@ -393,15 +406,24 @@ class JSONLEventWriter:
         Args:
             event: The event to write
         """
+        self.write_events([event])
+
+    def write_events(self, events: list[Event]) -> None:
+        """Append several events to the JSONL file with a single write.
+
+        Args:
+            events: The events to write, in order
+        """
         # Create parent directories if they don't exist
         self.jsonl_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Serialize event to JSON-compatible dict
-        event_dict = event.model_dump(mode="json")
+        # Serialize events to JSON lines with pydantic's serializer, which
+        # skips building an intermediate dict for json.dumps
+        lines = "".join(event.model_dump_json() + '\n' for event in events)
 
-        # Append to file with newline
-        with open(self.jsonl_path, 'a') as f:
-            f.write(json.dumps(event_dict) + '\n')
+        # Append to file
+        with open(self.jsonl_path, 'a', encoding='utf-8') as f:
+            f.write(lines)
             f.flush()  # Ensure data is written immediately for streaming/tailing
 
     async def write_event_async(self, event: Event) -> None:
@@ -416,12 +438,9 @@ class JSONLEventWriter:
         # Create parent directories if they don't exist using anyio.Path
         await anyio.Path(self.jsonl_path.parent).mkdir(parents=True, exist_ok=True)
 
-        # Serialize event to JSON-compatible dict
-        event_dict = event.model_dump(mode="json")
-
         # Append to file asynchronously using anyio.Path
-        async with await anyio.open_file(self.jsonl_path, 'a') as f:
-            await f.write(json.dumps(event_dict) + '\n')
+        async with await anyio.open_file(self.jsonl_path, 'a', encoding='utf-8') as f:
+            await f.write(event.model_dump_json() + '\n')
             await f.flush()  # Ensure data is written immediately for streaming/tailing
 
 
@@ -451,6 +470,47 @@ class EventLogger:
         # Initialize SQLite writer with standard path
         db_path = self.project_root / ".jc" / "events.db"
         self.sqlite_writer = SQLiteEventWriter(db_path)
+        # Events held back by batch(); None when emitting directly
+        self._batch: list[Event] | None = None
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Buffer events emitted inside the block and write them together.
+
+        The buffered events are written when the block exits (also on error)
+        in one SQLite transaction plus one append per workflow JSONL file,
+        instead of a connection, commit and file open per event. Nested
+        batches join the outermost one. emit_async() is not buffered.
+
+        Example:
+            >>> with logger.batch():
+            ...     logger.emit("my-workflow", "workflow.phase_changed", {"to_phase": "complete"})
+            ...     logger.emit("my-workflow", "workflow.completed", {})
+        """
+        if self._batch is not None:
+            yield
+            return
+
+        self._batch = []
+        try:
+            yield
+        finally:
+            events, self._batch = self._batch, None
+            self._write_events(events)
+
+    def _write_events(self, events: list[Event]) -> None:
+        """Write events to SQLite and to each workflow's JSONL file."""
+        if not events:
+            return
+
+        self.sqlite_writer.write_events(events)
+
+        by_workflow: dict[str, list[Event]] = {}
+        for event in events:
+            by_workflow.setdefault(event.workflow_id, []).append(event)
+        for workflow_id, workflow_events in by_workflow.items():
+            jsonl_path = self.project_root / "agents" / workflow_id / "events.jsonl"
+            JSONLEventWriter(jsonl_path).write_events(workflow_events)
 
     def emit(self, workflow_id: str, event_type: EventType | str, data: dict) -> None:
         """Emit an event to both SQLite and JSONL destinations.
@@ -479,6 +539,11 @@ class EventLogger:
             data=data
         )
 
+        # Inside batch(), hold the event until the block exits
+        if self._batch is not None:
+            self._batch.append(event)
+            return
+
         # Write to SQLite
         self.sqlite_writer.write_event(event)
 
@@ -18,8 +18,9 @@ import builtins
 import json
 import logging
 import sqlite3
+from collections.abc import Iterator
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from jean_claude.core.notes import Note, NoteCategory
 
@@ -29,6 +30,33 @@ logger = logging.getLogger(__name__)
 if TYPE_CHECKING:
     from jean_claude.core.events import EventLogger, EventType
 
+# Decoded notes per (events db, workflow), tagged with the store version they
+# were read at; reused by unfiltered reads until the version changes. Only the
+# latest load per workflow is kept, for the most recently loaded workflows.
+_NOTES_CACHE: dict[tuple[str, str], tuple[tuple[int, int], tuple[Note, ...]]] = {}
+
+# Lowercased (title, content) per cached note, built on the first search of a
+# load and kept alongside the exact notes tuple it was built from
+_SEARCH_TEXT_CACHE: dict[
+    tuple[str, str], tuple[tuple[Note, ...], tuple[tuple[str, str], ...]]
+] = {}
+
+# Workflows whose decoded notes are kept in the caches above
+_MAX_CACHED_WORKFLOWS = 8
+
+
+def _cache_put(cache: dict[Any, Any], key: Any, value: Any) -> None:
+    """Store value under key, evicting the least recently stored keys."""
+    cache.pop(key, None)
+    cache[key] = value
+    while len(cache) > _MAX_CACHED_WORKFLOWS:
+        del cache[next(iter(cache))]
+
+
+def _copy_note(note: Note) -> Note:
+    """Return a copy of a cached note that callers are free to mutate."""
+    return note.model_copy(update={"tags": builtins.list(note.tags)})
+
 
 class Notes:
     """High-level API for agent note-taking using event sourcing.
@@ -292,35 +320,31 @@ class Notes:
             **kwargs
         )
 
-    def list(
+    def iter_notes(
         self,
         agent_id: str | None = None,
         category: NoteCategory | None = None,
         tag: str | None = None,
         limit: int | None = None,
-    ) -> list[Note]:
-        """List notes with optional filtering via SQLite query.
+    ) -> Iterator[Note]:
+        """Yield notes newest first, streaming rows from SQLite.
+
+        All filters, including agent_id and tag, are applied in the query so
+        that LIMIT counts only matching notes and non-matching rows are never
+        decoded in Python. Rows are fetched lazily from the cursor; the
+        connection is closed once iteration finishes or is abandoned.
 
         Args:
             agent_id: Optional filter by agent ID
             category: Optional filter by note category
             tag: Optional filter by tag
-            limit: Optional maximum number of notes to return
-
-        Returns:
-            A list of Note objects matching the filters
+            limit: Optional maximum number of notes to yield
 
-        Example:
-            >>> notes = Notes(workflow_id="my-workflow", ...)
-            >>> all_notes = notes.list()
-            >>> learnings = notes.list(category=NoteCategory.LEARNING)
-            >>> recent = notes.list(limit=5)
+        Yields:
+            Note objects matching the filters
         """
         if not self._events_db.exists():
-            return []
-
-        conn = sqlite3.connect(self._events_db)
-        cursor = conn.cursor()
+            return
 
         # Build query with filters
         query = """
@@ -329,52 +353,134 @@ class Notes:
             WHERE workflow_id = ?
               AND event_type LIKE 'agent.note.%'
         """
-        params: list = [self._workflow_id]
+        params: builtins.list = [self._workflow_id]
 
         if category:
             query += " AND event_type = ?"
             params.append(f"agent.note.{category.value}")
 
+        # JSON filters are guarded by json_valid() so a malformed event is
+        # excluded rather than aborting the whole query
+        if agent_id:
+            query += (
+                " AND CASE WHEN json_valid(data)"
+                " THEN json_extract(data, '$.agent_id') = ? ELSE 0 END"
+            )
+            params.append(agent_id)
+
+        if tag:
+            query += (
+                " AND CASE WHEN json_valid(data) THEN EXISTS ("
+                "SELECT 1 FROM json_each(data, '$.tags') WHERE json_each.value = ?"
+                ") ELSE 0 END"
+            )
+            params.append(tag)
+
         query += " ORDER BY timestamp DESC"
 
         if limit and limit > 0:
             query += " LIMIT ?"
             params.append(limit)
 
-        cursor.execute(query, params)
+        conn = sqlite3.connect(self._events_db)
+        try:
+            for row in conn.execute(query, params):
+                try:
+                    data = json.loads(row[0])
+
+                    # Create Note object from event data
+                    yield Note(
+                        agent_id=data["agent_id"],
+                        title=data["title"],
+                        content=data.get("content", ""),
+                        category=NoteCategory(data.get("category", "observation")),
+                        tags=data.get("tags", []),
+                        related_file=data.get("related_file"),
+                        related_feature=data.get("related_feature"),
+                    )
+                except (json.JSONDecodeError, KeyError, ValueError) as e:
+                    # Log malformed events for debugging
+                    logger.warning(
+                        f"Skipping malformed note event in workflow {self._workflow_id}: {type(e).__name__}"
+                    )
+                    continue
+        finally:
+            conn.close()
 
-        notes = []
-        for row in cursor.fetchall():
-            try:
-                data = json.loads(row[0])
+    def list(
+        self,
+        agent_id: str | None = None,
+        category: NoteCategory | None = None,
+        tag: str | None = None,
+        limit: int | None = None,
+    ) -> builtins.list[Note]:
+        """List notes with optional filtering via SQLite query.
 
-                # Apply additional filters (agent_id, tag) in Python
-                if agent_id and data.get("agent_id") != agent_id:
-                    continue
+        Args:
+            agent_id: Optional filter by agent ID
+            category: Optional filter by note category
+            tag: Optional filter by tag
+            limit: Optional maximum number of notes to return
 
-                if tag and tag not in data.get("tags", []):
-                    continue
+        Returns:
+            A list of Note objects matching the filters
+
+        Example:
+            >>> notes = Notes(workflow_id="my-workflow", ...)
+            >>> all_notes = notes.list()
+            >>> learnings = notes.list(category=NoteCategory.LEARNING)
+            >>> recent = notes.list(limit=5)
+        """
+        # A limited read stops after `limit` rows in SQLite; only full
+        # unfiltered reads come from the shared load
+        if agent_id is None and category is None and tag is None and not (limit and limit > 0):
+            return [_copy_note(note) for note in self._all_notes()]
+
+        return builtins.list(
+            self.iter_notes(agent_id=agent_id, category=category, tag=tag, limit=limit)
+        )
 
-                # Create Note object from event data
-                note = Note(
-                    agent_id=data["agent_id"],
-                    title=data["title"],
-                    content=data.get("content", ""),
-                    category=NoteCategory(data.get("category", "observation")),
-                    tags=data.get("tags", []),
-                    related_file=data.get("related_file"),
-                    related_feature=data.get("related_feature"),
-                )
-                notes.append(note)
-            except (json.JSONDecodeError, KeyError, ValueError) as e:
-                # Log malformed events for debugging
-                logger.warning(
-                    f"Skipping malformed note event in workflow {self._workflow_id}: {type(e).__name__}"
-                )
-                continue
-
-        conn.close()
-        return notes
+    def _notes_version(self) -> tuple[int, int]:
+        """Return (note count, max rowid) for this workflow's note events.
+
+        Notes are append-only, so this pair changes whenever a note is added
+        and is much cheaper to read than the notes themselves.
+        """
+        conn = sqlite3.connect(self._events_db)
+        try:
+            count, max_rowid = conn.execute(
+                """
+                SELECT COUNT(*), MAX(rowid)
+                FROM events
+                WHERE workflow_id = ?
+                  AND event_type LIKE 'agent.note.%'
+                """,
+                (self._workflow_id,),
+            ).fetchone()
+        finally:
+            conn.close()
+        return count, max_rowid or 0
+
+    def _all_notes(self) -> tuple[Note, ...]:
+        """Return every note for the workflow, newest first.
+
+        The decoded notes are shared with other Notes instances for the same
+        workflow and reloaded only when the event store's note version
+        changes. They must not be mutated or handed out: public methods
+        return copies.
+        """
+        if not self._events_db.exists():
+            return ()
+
+        key = (str(self._events_db), self._workflow_id)
+        version = self._notes_version()
+        cached = _NOTES_CACHE.get(key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        all_notes = tuple(self.iter_notes())
+        _cache_put(_NOTES_CACHE, key, (version, all_notes))
+        return all_notes
 
     def search(
         self,
@@ -396,18 +502,34 @@ class Notes:
             >>> notes = Notes(workflow_id="my-workflow", ...)
             >>> results = notes.search("authentication bug")
         """
-        all_notes = self.list()
-
         query_lower = query.lower()
-        matching_notes = []
-
-        for note in all_notes:
-            if search_title and query_lower in note.title.lower():
-                matching_notes.append(note)
-            elif search_content and query_lower in note.content.lower():
-                matching_notes.append(note)
+        all_notes = self._all_notes()
+
+        return [
+            _copy_note(note)
+            for note, (title, content) in zip(
+                all_notes, self._search_texts(all_notes), strict=True
+            )
+            if (search_title and query_lower in title)
+            or (search_content and query_lower in content)
+        ]
+
+    def _search_texts(
+        self, all_notes: tuple[Note, ...]
+    ) -> tuple[tuple[str, str], ...]:
+        """Return lowercased (title, content) pairs for all_notes.
+
+        The pairs are cached for as long as the shared notes load is reused,
+        so each note is lowercased once per load rather than once per search.
+        """
+        key = (str(self._events_db), self._workflow_id)
+        cached = _SEARCH_TEXT_CACHE.get(key)
+        if cached is not None and cached[0] is all_notes:
+            return cached[1]
 
-        return matching_notes
+        texts = tuple((note.title.lower(), note.content.lower()) for note in all_notes)
+        _cache_put(_SEARCH_TEXT_CACHE, key, (all_notes, texts))
+        return texts
 
     def get_summary(self) -> str:
         """Get a summary of all notes.
@@ -418,7 +540,7 @@ class Notes:
         Returns:
             A formatted summary string
         """
-        all_notes = self.list()
+        all_notes = self._all_notes()
 
         if not all_notes:
             return "No notes found."
@@ -0,0 +1,121 @@
+# ABOUTME: Adaptive rate limiter shared by every Claude invocation in the process
+# ABOUTME: Spaces out session starts and backs off all callers after a rate limit error
+
+"""Adaptive rate limiting for Claude invocations.
+
+Concurrent prompts (`jc prompt --batch`, execute_prompts_batch) start Claude
+sessions against the same account limits. When one of them is rate limited,
+retrying it and starting the others immediately just produces more 429s.
+The limiter:
+
+- spaces out session starts with a token bucket (`requests_per_minute`,
+  with up to `burst` starts back to back), and
+- after a rate limit error, pauses every caller for an exponential backoff
+  with jitter, slowing the bucket down until requests succeed again.
+
+The limiter's state is guarded by a threading lock and waiting is done with
+anyio.sleep(), so one limiter can be shared across event loops running in
+different threads (each `execute_prompt()` call runs its own loop).
+"""
+
+import random
+import re
+import threading
+import time
+
+import anyio
+
+# Error text from the Claude CLI/API when a request is throttled:
+# HTTP 429, "rate_limit_error", "Rate limit reached", 529 "overloaded_error"
+_RATE_LIMIT_RE = re.compile(
+    r"\b(?:429|529)\b|rate_limit_error|rate limit (?:reached|exceeded)|overloaded_error",
+    re.IGNORECASE,
+)
+
+
+def is_rate_limit_error(message: str) -> bool:
+    """Check whether an error message reports rate limiting or overload."""
+    return bool(_RATE_LIMIT_RE.search(message))
+
+
+class AdaptiveRateLimiter:
+    """Token bucket for Claude session starts with adaptive backoff.
+
+    Attributes:
+        requests_per_minute: Sustained session starts per minute
+        burst: Session starts allowed back to back
+        base_backoff: Backoff in seconds after the first rate limit error
+        max_backoff: Upper bound for the backoff in seconds
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: float = 50.0,
+        burst: int = 5,
+        base_backoff: float = 2.0,
+        max_backoff: float = 60.0,
+    ):
+        """Initialize the rate limiter.
+
+        Args:
+            requests_per_minute: Sustained session starts per minute (default: 50)
+            burst: Session starts allowed back to back (default: 5)
+            base_backoff: Backoff in seconds after the first rate limit error (default: 2)
+            max_backoff: Upper bound for the backoff in seconds (default: 60)
+        """
+        self.requests_per_minute = requests_per_minute
+        self.burst = burst
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        # Fraction of requests_per_minute currently allowed; halved on each
+        # rate limit error and restored gradually by successes
+        self._throttle = 1.0
+        self._consecutive_limits = 0
+        self._paused_until = 0.0
+
+    async def acquire(self) -> None:
+        """Wait until a new Claude session may start."""
+        delay = self._reserve()
+        if delay > 0:
+            await anyio.sleep(delay)
+
+    def _reserve(self) -> float:
+        """Take a token and return how long the caller must wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            rate = self.requests_per_minute * self._throttle / 60
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * rate)
+            self._updated = now
+            self._tokens -= 1
+
+            wait = -self._tokens / rate if self._tokens < 0 else 0.0
+            return max(wait, self._paused_until - now)
+
+    def record_success(self) -> None:
+        """Record a successful request, gradually lifting the throttle."""
+        with self._lock:
+            self._consecutive_limits = 0
+            self._throttle = min(1.0, self._throttle + 0.1)
+
+    def record_rate_limited(self) -> float:
+        """Record a rate limit error and pause all callers.
+
+        Returns:
+            The backoff in seconds before the next session may start
+        """
+        with self._lock:
+            self._consecutive_limits += 1
+            self._throttle = max(0.1, self._throttle / 2)
+            ceiling = min(self.max_backoff, self.base_backoff * 2 ** (self._consecutive_limits - 1))
+            # Jitter keeps concurrent callers from retrying in lockstep
+            backoff = random.uniform(ceiling / 2, ceiling)
+            self._paused_until = max(self._paused_until, time.monotonic() + backoff)
+            return backoff
+
+
+# Shared by all Claude invocations in this process
+claude_rate_limiter = AdaptiveRateLimiter()
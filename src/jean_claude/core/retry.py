@@ -0,0 +1,64 @@
+# ABOUTME: Retry policy shared by the Claude execution backends
+# ABOUTME: Retry codes, error classification and per-code backoff between attempts
+
+"""Retry policy for Claude invocations.
+
+Both the SDK and subprocess backends (and sdk_executor) classify failed
+attempts with a RetryCode and use the same rules for how long to wait
+before the next attempt.
+"""
+
+import random
+from enum import Enum
+from typing import TYPE_CHECKING, Final
+
+from jean_claude.core.rate_limiter import AdaptiveRateLimiter, is_rate_limit_error
+
+if TYPE_CHECKING:
+    from jean_claude.core.agent import ExecutionResult
+
+# Upper bound in seconds for the exponential delay between retries
+MAX_RETRY_DELAY: Final = 10.0
+
+
+class RetryCode(str, Enum):
+    """Codes indicating different types of errors that may be retryable."""
+
+    CLAUDE_CODE_ERROR = "claude_code_error"
+    TIMEOUT_ERROR = "timeout_error"
+    EXECUTION_ERROR = "execution_error"
+    ERROR_DURING_EXECUTION = "error_during_execution"
+    RATE_LIMITED = "rate_limited"
+    NONE = "none"
+
+
+def error_retry_code(message: str, default: RetryCode = RetryCode.NONE) -> RetryCode:
+    """Classify an error message, retrying rate limit errors with backoff."""
+    return RetryCode.RATE_LIMITED if is_rate_limit_error(message) else default
+
+
+def record_rate_limit_outcome(limiter: AdaptiveRateLimiter, result: "ExecutionResult") -> None:
+    """Feed an attempt's outcome back to the rate limiter."""
+    if result.retry_code == RetryCode.RATE_LIMITED:
+        limiter.record_rate_limited()
+    elif result.success:
+        limiter.record_success()
+
+
+def retry_delay(retry_code: RetryCode, attempt: int) -> float:
+    """Return how long to wait before retry number `attempt` (from 1).
+
+    - RATE_LIMITED: no delay here; the shared rate limiter holds the retry
+      back for every caller
+    - ERROR_DURING_EXECUTION: the session failed on its own, so the first
+      retry starts immediately
+    - anything else: exponential backoff (1s, 2s, 4s ... up to 10s) with
+      jitter, so concurrent prompts that failed together don't retry in
+      lockstep
+    """
+    if retry_code == RetryCode.RATE_LIMITED:
+        return 0.0
+    if retry_code == RetryCode.ERROR_DURING_EXECUTION and attempt == 1:
+        return 0.0
+    ceiling = min(MAX_RETRY_DELAY, 2.0 ** (attempt - 1))
+    return random.uniform(ceiling / 2, ceiling)
@@ -30,14 +30,19 @@ from claude_agent_sdk.types import Message
 
 from jean_claude.core.agent import (
     ExecutionResult,
-    RetryCode,
     PromptRequest,
     TemplateRequest,
     OUTPUT_JSONL,
-    OUTPUT_JSON,
     FINAL_OBJECT_JSON,
     generate_workflow_id,
 )
+from jean_claude.core.rate_limiter import claude_rate_limiter
+from jean_claude.core.retry import (
+    RetryCode,
+    error_retry_code,
+    record_rate_limit_outcome,
+    retry_delay,
+)
 from jean_claude.core.sandbox import get_sandbox_settings
 
 
@@ -195,6 +200,7 @@ async def _execute_prompt_async(
             output=output,
             success=not is_error,
             session_id=session_id,
+            retry_code=error_retry_code(output) if is_error else RetryCode.NONE,
             cost_usd=cost_usd,
             duration_ms=duration_ms,
         )
@@ -210,7 +216,7 @@ async def _execute_prompt_async(
         return ExecutionResult(
             output=f"Claude Code error: exit code {e.exit_code}",
             success=False,
-            retry_code=RetryCode.CLAUDE_CODE_ERROR,
+            retry_code=error_retry_code(f"{e} {e.stderr or ''}", RetryCode.CLAUDE_CODE_ERROR),
         )
 
     except ClaudeSDKError as e:
@@ -272,11 +278,6 @@ def _save_outputs(
         for msg in messages:
             f.write(json.dumps(msg) + "\n")
 
-    # Save JSON array format
-    json_file = output_dir / OUTPUT_JSON
-    with open(json_file, "w") as f:
-        json.dump(messages, f, indent=2)
-
     # Save final result if available
     if result_message:
         final_file = output_dir / FINAL_OBJECT_JSON
@@ -302,16 +303,19 @@ async def execute_prompt_async(
     Returns:
         ExecutionResult with output and status
     """
-    retry_delays = [1, 3, 5]
-    last_result = None
+    last_result: Optional[ExecutionResult] = None
 
     for attempt in range(max_retries + 1):
         if attempt > 0:
-            delay = retry_delays[min(attempt - 1, len(retry_delays) - 1)]
-            await anyio.sleep(delay)
+            assert last_result is not None
+            delay = retry_delay(last_result.retry_code, attempt)
+            if delay:
+                await anyio.sleep(delay)
+        await claude_rate_limiter.acquire()
 
         result = await _execute_prompt_async(request, agents=agents)
         last_result = result
+        record_rate_limit_outcome(claude_rate_limiter, result)
 
         if result.success or result.retry_code == RetryCode.NONE:
             return result
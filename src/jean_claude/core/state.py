@@ -3,7 +3,11 @@
 
 """Workflow state management."""
 
+import contextlib
 import json
+import os
+import tempfile
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Literal
@@ -11,6 +15,19 @@ from typing import Any, Literal
 from pydantic import BaseModel, Field
 
 
+def _default_file_mode() -> int:
+    """Return the mode open() gives a new file under the current umask."""
+    # The umask can only be read by setting it, so this is done once at import
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+# Temp files are created 0600; state.json gets the mode a plain open() would
+# give it, so other users and services can keep reading it
+_DEFAULT_FILE_MODE = _default_file_mode()
+
+
 class WorkflowPhase(BaseModel):
     """State of a single workflow phase."""
 
@@ -76,20 +93,22 @@ class WorkflowState(BaseModel):
     def load(cls, workflow_id: str, project_root: Path) -> "WorkflowState":
         """Load workflow state from disk."""
         state_path = project_root / "agents" / workflow_id / "state.json"
-        if not state_path.exists():
-            raise FileNotFoundError(f"No state found for workflow: {workflow_id}")
-        with open(state_path) as f:
-            data = json.load(f)
-        return cls.model_validate(data)
+        try:
+            raw = state_path.read_bytes()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"No state found for workflow: {workflow_id}") from None
+        # pydantic-core parses the bytes straight into the model, without an
+        # intermediate dict from json.load
+        return cls.model_validate_json(raw)
 
     @classmethod
     def load_from_file(cls, state_path: Path) -> "WorkflowState":
         """Load workflow state from a specific file path."""
-        if not state_path.exists():
-            raise FileNotFoundError(f"State file not found: {state_path}")
-        with open(state_path) as f:
-            data = json.load(f)
-        return cls.model_validate(data)
+        try:
+            raw = state_path.read_bytes()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"State file not found: {state_path}") from None
+        return cls.model_validate_json(raw)
 
     def save(self, project_root: Path) -> None:
         """Save workflow state to disk."""
@@ -97,8 +116,34 @@ class WorkflowState(BaseModel):
         state_dir = project_root / "agents" / self.workflow_id
         state_dir.mkdir(parents=True, exist_ok=True)
         state_path = state_dir / "state.json"
-        with open(state_path, "w") as f:
-            json.dump(self.model_dump(mode="json"), f, indent=2, default=str)
+        # Serialize up front and write once (json.dump issues a write per
+        # token), then rename into place so readers never see a partial file
+        payload = json.dumps(self.model_dump(mode="json"), indent=2, default=str)
+        # A uniquely named temp file per save, so concurrent saves don't share
+        # one; it is removed if the write or the rename fails
+        temp_path: Path | None = None
+        try:
+            with tempfile.NamedTemporaryFile(
+                "w",
+                encoding="utf-8",
+                dir=state_dir,
+                prefix="state.json.",
+                suffix=".tmp",
+                delete=False,
+            ) as f:
+                temp_path = Path(f.name)
+                f.write(payload)
+            try:
+                mode = state_path.stat().st_mode & 0o777
+            except FileNotFoundError:
+                mode = _DEFAULT_FILE_MODE
+            os.chmod(temp_path, mode)
+            os.replace(temp_path, state_path)
+        except BaseException:
+            if temp_path is not None:
+                with contextlib.suppress(OSError):
+                    temp_path.unlink()
+            raise
 
     def update_phase(self, phase_name: str, status: str) -> None:
         """Update a phase's status."""
@@ -118,7 +163,8 @@ class WorkflowState(BaseModel):
         """Calculate completion percentage based on features."""
         if not self.features:
             return 0.0
-        completed = sum(1 for f in self.features if f.status == "completed")
+        # list.count compares in C; cheaper than summing a filtered generator
+        completed = [f.status for f in self.features].count("completed")
         return (completed / len(self.features)) * 100
 
     @property
@@ -147,6 +193,36 @@ class WorkflowState(BaseModel):
             self.current_feature.completed_at = datetime.now()
             self.current_feature_index += 1
 
+    def bulk_complete(self, n: int, now: datetime | None = None) -> int:
+        """Start and complete the next n features in one step.
+
+        Equivalent to calling start_feature() then mark_feature_complete()
+        n times, but reads the clock once and writes the index once.
+
+        Args:
+            n: Number of features to complete, starting at the current one
+            now: Timestamp to record (default: datetime.now())
+
+        Returns:
+            Number of features actually completed (fewer than n when the
+            feature list runs out)
+        """
+        start = self.current_feature_index
+        if start < 0:
+            return 0
+        batch = self.features[start:start + max(n, 0)]
+        if not batch:
+            return 0
+        if now is None:
+            now = datetime.now()
+        for feature in batch:
+            if feature.status == "not_started":
+                feature.started_at = now
+            feature.status = "completed"
+            feature.completed_at = now
+        self.current_feature_index = start + len(batch)
+        return len(batch)
+
     def mark_feature_failed(self, error: str | None = None) -> None:
         """Mark the current feature as failed."""
         if self.current_feature:
@@ -210,20 +286,28 @@ class WorkflowState(BaseModel):
         self.verification_count += 1
 
     def get_summary(self) -> dict[str, Any]:
-        """Get a summary of workflow progress."""
+        """Get a summary of workflow progress.
+
+        Feature statuses are tallied in a single pass; every count and flag
+        in the summary is derived from that tally.
+        """
+        total = len(self.features)
+        status_counts = Counter(f.status for f in self.features)
+        completed = status_counts["completed"]
+        failed = status_counts["failed"]
         return {
             "workflow_id": self.workflow_id,
             "workflow_type": self.workflow_type,
             "beads_task_id": self.beads_task_id,
             "beads_task_title": self.beads_task_title,
             "phase": self.phase,
-            "total_features": len(self.features),
-            "completed_features": sum(1 for f in self.features if f.status == "completed"),
-            "failed_features": sum(1 for f in self.features if f.status == "failed"),
-            "in_progress_features": sum(1 for f in self.features if f.status == "in_progress"),
-            "progress_percentage": self.progress_percentage,
-            "is_complete": self.is_complete(),
-            "is_failed": self.is_failed(),
+            "total_features": total,
+            "completed_features": completed,
+            "failed_features": failed,
+            "in_progress_features": status_counts["in_progress"],
+            "progress_percentage": (completed / total) * 100 if total else 0.0,
+            "is_complete": total > 0 and completed == total,
+            "is_failed": failed > 0,
             "iteration_count": self.iteration_count,
             "total_cost_usd": self.total_cost_usd,
             "total_duration_ms": self.total_duration_ms,
@@ -9,12 +9,33 @@ the agents directory with proper error handling.
 """
 
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 from jean_claude.core.state import WorkflowState
 
 
+@lru_cache(maxsize=256)
+def _state_updated_at(state_path: str, mtime_ns: int, size: int) -> datetime:
+    """Return updated_at from a state file, cached by its stat signature.
+
+    The mtime and size are part of the cache key so a rewritten state file
+    is reloaded, while repeated lookups in the same process skip the JSON
+    parse and model validation. Load errors propagate and are not cached,
+    so a file that was unreadable (or caught mid-write) is retried next time.
+
+    Args:
+        state_path: Path to the state.json file
+        mtime_ns: Modification time of the file in nanoseconds
+        size: Size of the file in bytes
+
+    Returns:
+        The state's updated_at timestamp
+    """
+    return WorkflowState.load_from_file(Path(state_path)).updated_at
+
+
 def find_most_recent_workflow(project_root: Path) -> Optional[str]:
     """Find the most recently updated workflow.
 
@@ -63,15 +84,23 @@ def find_most_recent_workflow(project_root: Path) -> Optional[str]:
         workflow_most_recent_time = None
 
         # Check state.json
-        if state_file.exists():
+        try:
+            stat = state_file.stat()
+        except OSError:
+            stat = None
+        if stat is not None:
+            # Use the updated_at timestamp from the state file; unreadable
+            # state files yield None and are skipped
             try:
-                state = WorkflowState.load_from_file(state_file)
-                # Use the updated_at timestamp from the state file
-                if workflow_most_recent_time is None or state.updated_at > workflow_most_recent_time:
-                    workflow_most_recent_time = state.updated_at
+                updated_at = _state_updated_at(
+                    str(state_file), stat.st_mtime_ns, stat.st_size
+                )
             except Exception:
-                # If we can't load the state file, skip it
-                pass
+                updated_at = None
+            if updated_at is not None and (
+                workflow_most_recent_time is None or updated_at > workflow_most_recent_time
+            ):
+                workflow_most_recent_time = updated_at
 
         # Check events.jsonl mtime
         if events_file.exists():
@@ -47,7 +47,7 @@ def get_recent_events(events_file: Path, max_events: int = 1000) -> list[dict]:
 
     events = []
     try:
-        with open(events_file) as f:
+        with open(events_file, encoding="utf-8") as f:
             # Use deque with maxlen for memory efficiency - automatically discards old items
             recent_lines = deque(f, maxlen=max_events)
 
@@ -234,7 +234,7 @@ def create_app(project_root: Path | None = None) -> FastAPI:
 
                 # Get file position after loading recent events
                 try:
-                    with open(events_file) as f:
+                    with open(events_file, encoding="utf-8") as f:
                         f.seek(0, 2)  # Seek to end of file
                         last_position = f.tell()
                 except IOError:
@@ -266,7 +266,7 @@ def create_app(project_root: Path | None = None) -> FastAPI:
 
                     # Poll for new events
                     try:
-                        with open(events_file) as f:
+                        with open(events_file, encoding="utf-8") as f:
                             f.seek(last_position)
                             for line in f:
                                 line = line.strip()
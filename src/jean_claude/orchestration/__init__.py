@@ -3,15 +3,52 @@
 
 """Orchestration modules for workflow execution."""
 
-from jean_claude.orchestration.auto_continue import (
-    run_auto_continue,
-    initialize_workflow,
-    resume_workflow,
-    AutoContinueError,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+# The hooks are imported eagerly: each shares its name with its submodule,
+# and importing a submodule rebinds the package attribute to the module, so
+# a lazily loaded hook could later be shadowed by its own module.
+from jean_claude.orchestration.post_tool_use_hook import post_tool_use_hook
 from jean_claude.orchestration.subagent_stop_hook import subagent_stop_hook
 from jean_claude.orchestration.user_prompt_submit_hook import user_prompt_submit_hook
-from jean_claude.orchestration.post_tool_use_hook import post_tool_use_hook
+
+if TYPE_CHECKING:
+    from jean_claude.orchestration.auto_continue import (
+        AutoContinueError,
+        initialize_workflow,
+        resume_workflow,
+        run_auto_continue,
+    )
+
+# Public names by defining submodule. auto_continue loads the Agent SDK, so
+# it is imported on first attribute access (PEP 562) rather than with the
+# package.
+_EXPORTS: dict[str, tuple[str, ...]] = {
+    "auto_continue": (
+        "run_auto_continue",
+        "initialize_workflow",
+        "resume_workflow",
+        "AutoContinueError",
+    ),
+}
+
+_LAZY_IMPORTS = {name: module for module, names in _EXPORTS.items() for name in names}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    # Cache on the package so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
+
 
 __all__ = [
     "run_auto_continue",
@@ -46,6 +46,15 @@ except ImportError:
     def create_sdk_mcp_server(name, version, tools):
         return {"name": name, "version": version, "tools": tools}
 
+try:
+    from claude_agent_sdk import ToolAnnotations
+
+    # Tools that only read notes; Claude Code may run these concurrently
+    _READ_ONLY_TOOL: dict[str, Any] = {"annotations": ToolAnnotations(readOnlyHint=True)}
+except ImportError:
+    # SDKs without tool annotations (and the testing fallback above)
+    _READ_ONLY_TOOL = {}
+
 from jean_claude.core.notes import NoteCategory
 from jean_claude.core.notes_api import Notes
 
@@ -229,7 +238,8 @@ async def take_note(args: dict[str, Any]) -> dict[str, Any]:
     {
         "category": str,  # optional filter by category
         "limit": int,  # optional limit on number of notes
-    }
+    },
+    **_READ_ONLY_TOOL,
 )
 async def read_notes(args: dict[str, Any]) -> dict[str, Any]:
     """Read notes from the shared notes file.
@@ -324,7 +334,8 @@ async def read_notes(args: dict[str, Any]) -> dict[str, Any]:
     "Search notes for specific keywords or topics. Use this to find relevant information from other agents.",
     {
         "query": str,  # search query
-    }
+    },
+    **_READ_ONLY_TOOL,
 )
 async def search_notes(args: dict[str, Any]) -> dict[str, Any]:
     """Search notes by content.
@@ -404,7 +415,8 @@ async def search_notes(args: dict[str, Any]) -> dict[str, Any]:
 @tool(
     "get_notes_summary",
     "Get a summary of all notes organized by category. Use this for a quick overview of shared knowledge.",
-    {}
+    {},
+    **_READ_ONLY_TOOL,
 )
 async def get_notes_summary(args: dict[str, Any]) -> dict[str, Any]:
     """Get a summary of all notes.
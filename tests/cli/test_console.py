@@ -0,0 +1,18 @@
+# ABOUTME: Tests for the shared Rich console used by prompt and run
+# ABOUTME: Verifies a single console instance is reused with highlighting disabled
+
+"""Tests for jean_claude.cli._console."""
+
+from jean_claude.cli._console import get_console
+from jean_claude.cli.commands import prompt, run
+
+
+def test_console_is_shared_between_commands():
+    """prompt and run print through the same console instance."""
+    assert get_console() is get_console()
+    assert prompt.console is run.console is get_console()
+
+
+def test_console_does_not_highlight():
+    """Automatic highlighting is disabled for printed responses."""
+    assert get_console().render_str("took 12.5s at 127.0.0.1").spans == []
@@ -0,0 +1,53 @@
+# ABOUTME: Tests for the root 'jc' command group
+# ABOUTME: Verifies subcommands are listed, resolved and imported lazily
+
+"""Tests for jean_claude.cli.main."""
+
+import subprocess
+import sys
+
+import click
+from click.testing import CliRunner
+
+from jean_claude.cli.main import _LAZY_COMMANDS, cli
+
+
+class TestLazyGroup:
+    """Tests for lazy subcommand loading."""
+
+    def test_lists_all_commands(self):
+        """Lazy and eager commands are listed together, sorted."""
+        names = cli.list_commands(click.Context(cli))
+        assert names == sorted([*_LAZY_COMMANDS, "version"])
+
+    def test_every_lazy_command_resolves(self):
+        """Each entry points at a Click command with the registered name."""
+        ctx = click.Context(cli)
+        for name in _LAZY_COMMANDS:
+            command = cli.get_command(ctx, name)
+            assert isinstance(command, click.Command)
+            assert command.name == name
+
+    def test_unknown_command_fails(self, cli_runner: CliRunner):
+        """An unknown command is still reported as an error."""
+        result = cli_runner.invoke(cli, ["no-such-command"])
+        assert result.exit_code == 2
+        assert "No such command" in result.output
+
+    def test_command_help_skips_other_command_modules(self):
+        """Running one command doesn't import the others or the Agent SDK."""
+        code = (
+            "import sys\n"
+            "from jean_claude.cli.main import cli\n"
+            "try:\n"
+            "    cli(['note', '--help'])\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "loaded = [m for m in ('jean_claude.cli.commands.work',"
+            " 'jean_claude.cli.commands.prompt', 'claude_agent_sdk') if m in sys.modules]\n"
+            "print(loaded, file=sys.stderr)\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stderr.strip().splitlines()[-1] == "[]"
@@ -0,0 +1,47 @@
+# ABOUTME: Tests for Claude response rendering helpers
+# ABOUTME: Verifies markdown is parsed only when the response contains markdown syntax
+
+"""Tests for jean_claude.cli.rendering."""
+
+import pytest
+from rich.markdown import Markdown
+from rich.text import Text
+
+from jean_claude.cli.rendering import response_renderable
+
+
+class TestResponseRenderable:
+    """Tests for response_renderable."""
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "Just a plain answer.",
+            "Two lines\nof plain text, costing $5 * 2.",
+            "Use [brackets] and 3.5 as-is",
+            "",
+        ],
+    )
+    def test_plain_text_skips_markdown(self, text):
+        """Responses without markdown syntax render as plain text."""
+        renderable = response_renderable(text)
+        assert isinstance(renderable, Text)
+        assert renderable.plain == text
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "# Title",
+            "Intro\n## Section",
+            "Run `jc init` first",
+            "This is **important**",
+            "Steps:\n- one\n- two",
+            "1. first\n2. second",
+            "See [docs](https://example.com)",
+            "> quoted",
+            "| a | b |\n|---|---|",
+        ],
+    )
+    def test_markdown_is_rendered_as_markdown(self, text):
+        """Responses with markdown syntax are parsed as markdown."""
+        assert isinstance(response_renderable(text), Markdown)
@@ -0,0 +1,121 @@
+# ABOUTME: Tests for the shared prompt/run execution helpers
+# ABOUTME: Covers the metadata line, result printing and Ctrl-C exit codes
+
+"""Tests for jean_claude.cli._runner."""
+
+import pytest
+from claude_agent_sdk import AssistantMessage, TextBlock, ToolUseBlock
+
+from jean_claude.cli._runner import (
+    ensure_output_dir,
+    execute_with_progress,
+    format_metadata,
+    print_result,
+)
+from jean_claude.core.agent import ExecutionResult, RetryCode
+
+
+class TestFormatMetadata:
+    """Tests for format_metadata."""
+
+    def test_includes_available_fields(self):
+        """Session, duration and cost are joined in order."""
+        result = ExecutionResult(
+            output="ok", success=True, session_id="abc", duration_ms=2500, cost_usd=0.0123
+        )
+        assert format_metadata(result) == "Session: abc | Duration: 2.5s | Cost: $0.0123"
+
+    def test_skips_missing_fields(self):
+        """Fields that are unset are left out."""
+        assert format_metadata(ExecutionResult(output="ok", success=True)) == ""
+        result = ExecutionResult(output="ok", success=True, duration_ms=1000)
+        assert format_metadata(result) == "Duration: 1.0s"
+
+
+class TestPrintResult:
+    """Tests for print_result."""
+
+    def test_raw_success_writes_output(self, capsys):
+        """Raw mode writes the response as-is to stdout."""
+        print_result(ExecutionResult(output="[b]hi[/b]", success=True), "Response", raw=True)
+        assert capsys.readouterr().out == "[b]hi[/b]\n"
+
+    def test_raw_failure_writes_stderr_and_exits(self, capsys):
+        """Raw mode reports failures on stderr with the retry code."""
+        result = ExecutionResult(
+            output="boom", success=False, retry_code=RetryCode.EXECUTION_ERROR
+        )
+        with pytest.raises(SystemExit) as exc_info:
+            print_result(result, "Response", raw=True)
+
+        assert exc_info.value.code == 1
+        captured = capsys.readouterr()
+        assert captured.out == ""
+        assert "boom" in captured.err
+        assert "Retry code: execution_error" in captured.err
+
+
+class TestExecuteWithProgress:
+    """Tests for execute_with_progress."""
+
+    def test_returns_result(self):
+        """The request's result is returned."""
+        result = ExecutionResult(output="ok", success=True)
+        assert execute_with_progress(lambda on_message: result, "Working...", raw=True) is result
+
+    def test_tool_use_updates_spinner_text(self, monkeypatch):
+        """SDK messages that start tools are reported in the spinner text."""
+        descriptions = []
+        monkeypatch.setattr(
+            "rich.progress.Progress.update",
+            lambda self, task_id, **kwargs: descriptions.append(kwargs["description"]),
+        )
+
+        def execute(on_message) -> ExecutionResult:
+            on_message(AssistantMessage(content=[TextBlock(text="Looking")], model="m"))
+            on_message(
+                AssistantMessage(
+                    content=[
+                        ToolUseBlock(id="1", name="Read", input={}),
+                        ToolUseBlock(id="2", name="Grep", input={}),
+                    ],
+                    model="m",
+                )
+            )
+            return ExecutionResult(output="ok", success=True)
+
+        execute_with_progress(execute, "Working...", raw=False)
+
+        assert descriptions == ["Working... [dim]2 tool calls, using Grep[/dim]"]
+
+    @pytest.mark.parametrize("raw", [True, False])
+    def test_interrupt_exits_130(self, raw):
+        """Ctrl-C during the request exits with the SIGINT status."""
+
+        def interrupted(on_message) -> ExecutionResult:
+            raise KeyboardInterrupt
+
+        with pytest.raises(SystemExit) as exc_info:
+            execute_with_progress(interrupted, "Working...", raw=raw)
+
+        assert exc_info.value.code == 130
+
+
+class TestEnsureOutputDir:
+    """Tests for ensure_output_dir."""
+
+    def test_creates_nested_directory(self, tmp_path):
+        """Missing parent directories are created."""
+        output_dir = tmp_path / "agents" / "abc123"
+        ensure_output_dir(output_dir, raw=False)
+        assert output_dir.is_dir()
+
+    def test_unusable_directory_exits(self, tmp_path, capsys):
+        """A path blocked by a file is reported and exits with status 1."""
+        (tmp_path / "agents").write_text("not a directory")
+
+        with pytest.raises(SystemExit) as exc_info:
+            ensure_output_dir(tmp_path / "agents" / "abc123", raw=True)
+
+        assert exc_info.value.code == 1
+        assert "Cannot create output directory" in capsys.readouterr().err
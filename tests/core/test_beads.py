@@ -56,6 +56,7 @@ class TestValidateBeadsId:
             "../etc/passwd", "beads-123; rm -rf /", "beads-123 && echo pwned",
             "beads-123|cat /etc/shadow", "beads-123`whoami`", "beads-123$(whoami)",
             "'; DROP TABLE users--", "../../secrets", "beads-123\nrm -rf",
+            "beads-123\n",
         ]
         for malicious_id in malicious_ids:
             with pytest.raises(ValueError, match="Invalid beads task ID format"):
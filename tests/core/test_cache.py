@@ -0,0 +1,103 @@
+# ABOUTME: Tests for the on-disk prompt response cache helpers
+# ABOUTME: Verifies cache keys, TTL expiry, corrupted entries, and XDG cache dir handling
+
+"""Tests for jean_claude.core.cache."""
+
+import os
+import threading
+import time
+from pathlib import Path
+
+from jean_claude.core.cache import (
+    load_cached_response,
+    prompt_cache_dir,
+    prompt_cache_key,
+    save_cached_response,
+    user_cache_dir,
+)
+
+
+class TestPromptCacheKey:
+    """Tests for prompt_cache_key."""
+
+    def test_key_is_stable_for_same_request(self):
+        """Identical requests produce identical keys."""
+        first = prompt_cache_key("sonnet", "Explain auth", Path("/repo"))
+        second = prompt_cache_key("sonnet", "Explain auth", "/repo")
+        assert first == second
+        assert len(first) == 64
+
+    def test_key_changes_with_model_prompt_or_directory(self):
+        """Each component of the request is part of the key."""
+        base = prompt_cache_key("sonnet", "Explain auth", "/repo")
+        assert prompt_cache_key("opus", "Explain auth", "/repo") != base
+        assert prompt_cache_key("sonnet", "Explain auth.", "/repo") != base
+        assert prompt_cache_key("sonnet", "Explain auth", "/other") != base
+
+    def test_insignificant_whitespace_shares_a_key(self):
+        """Outer whitespace, trailing spaces and CRLF don't change the key."""
+        base = prompt_cache_key("sonnet", "Fix this:\n    return 1", "/repo")
+        variant = "  Fix this:  \r\n    return 1\n\n"
+        assert prompt_cache_key("sonnet", variant, "/repo") == base
+
+    def test_indentation_is_significant(self):
+        """Leading indentation inside the prompt is preserved."""
+        base = prompt_cache_key("sonnet", "Fix this:\n    return 1", "/repo")
+        assert prompt_cache_key("sonnet", "Fix this:\nreturn 1", "/repo") != base
+
+
+class TestCachedResponses:
+    """Tests for load_cached_response and save_cached_response."""
+
+    def test_roundtrip(self, tmp_path):
+        """A saved response is returned by a later load."""
+        data = {"output": "hello", "success": True, "cost_usd": 0.01}
+        save_cached_response("abc", data, cache_dir=tmp_path)
+
+        assert load_cached_response("abc", cache_dir=tmp_path) == data
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_concurrent_saves_of_one_key_use_separate_temp_files(self, tmp_path):
+        """Threads saving the same key never corrupt the entry or leave temp files."""
+        payloads = [{"output": str(i) * 10_000} for i in range(8)]
+        threads = [
+            threading.Thread(target=save_cached_response, args=("abc", data, tmp_path))
+            for data in payloads
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert load_cached_response("abc", cache_dir=tmp_path) in payloads
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_missing_entry_is_a_miss(self, tmp_path):
+        """Loading an unknown key returns None."""
+        assert load_cached_response("missing", cache_dir=tmp_path) is None
+
+    def test_expired_entry_is_a_miss(self, tmp_path):
+        """Entries older than the TTL are ignored."""
+        save_cached_response("abc", {"output": "old"}, cache_dir=tmp_path)
+        old = time.time() - 120
+        os.utime(tmp_path / "abc.json", (old, old))
+
+        assert load_cached_response("abc", ttl_seconds=60, cache_dir=tmp_path) is None
+        assert load_cached_response("abc", ttl_seconds=600, cache_dir=tmp_path) is not None
+
+    def test_corrupted_entry_is_a_miss(self, tmp_path):
+        """Unparseable or non-object entries are ignored."""
+        (tmp_path / "bad.json").write_text("{not json")
+        (tmp_path / "list.json").write_text("[1, 2]")
+
+        assert load_cached_response("bad", cache_dir=tmp_path) is None
+        assert load_cached_response("list", cache_dir=tmp_path) is None
+
+    def test_default_directory_honors_xdg_cache_home(self, tmp_path, monkeypatch):
+        """Without cache_dir, entries go under $XDG_CACHE_HOME/jean-claude/prompts."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        save_cached_response("abc", {"output": "hi"})
+
+        assert user_cache_dir() == tmp_path / "jean-claude"
+        assert (prompt_cache_dir() / "abc.json").exists()
+        assert load_cached_response("abc") == {"output": "hi"}
@@ -0,0 +1,114 @@
+# ABOUTME: Tests for the Claude CLI installation probe and its result cache
+# ABOUTME: Verifies successful probes are reused until the binary changes
+
+"""Tests for check_claude_installed() probe caching.
+
+The `claude --version` probe is remembered per binary (path, mtime, size),
+both in-process and in a stamp file under $XDG_CACHE_HOME.
+"""
+
+import os
+import subprocess
+from unittest.mock import patch
+
+import pytest
+
+from jean_claude.core import agent
+from jean_claude.core.agent import check_claude_installed
+
+
+@pytest.fixture
+def fake_claude(tmp_path, monkeypatch):
+    """Point CLAUDE_CODE_PATH at a fake binary and isolate the probe caches."""
+    binary = tmp_path / "bin" / "claude"
+    binary.parent.mkdir()
+    binary.write_text("#!/bin/sh\necho 1.0.0\n")
+    binary.chmod(0o755)
+    monkeypatch.setenv("CLAUDE_CODE_PATH", str(binary))
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.setattr(agent, "_verified_claude_binaries", set())
+    return binary
+
+
+def _version_ok(*args, **kwargs):
+    return subprocess.CompletedProcess(args[0], 0, stdout="1.0.0\n", stderr="")
+
+
+class TestCheckClaudeInstalled:
+    """Tests for check_claude_installed probe caching."""
+
+    def test_successful_probe_is_reused_in_process(self, fake_claude):
+        """A second check in the same process skips the probe."""
+        with patch.object(agent.subprocess, "run", side_effect=_version_ok) as run:
+            assert check_claude_installed() is None
+            assert check_claude_installed() is None
+
+        assert run.call_count == 1
+
+    def test_stamp_file_skips_probe_in_new_process(self, fake_claude, monkeypatch):
+        """A later invocation reuses the on-disk stamp for the same binary."""
+        with patch.object(agent.subprocess, "run", side_effect=_version_ok):
+            assert check_claude_installed() is None
+
+        # Simulate a fresh process
+        monkeypatch.setattr(agent, "_verified_claude_binaries", set())
+        with patch.object(agent.subprocess, "run", side_effect=_version_ok) as run:
+            assert check_claude_installed() is None
+
+        assert run.call_count == 0
+
+    def test_changed_binary_is_probed_again(self, fake_claude):
+        """Updating the binary invalidates the cached probe."""
+        with patch.object(agent.subprocess, "run", side_effect=_version_ok):
+            assert check_claude_installed() is None
+
+        stat = fake_claude.stat()
+        fake_claude.write_text("#!/bin/sh\necho 2.0.0 updated\n")
+        os.utime(fake_claude, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        with patch.object(agent.subprocess, "run", side_effect=_version_ok) as run:
+            assert check_claude_installed() is None
+
+        assert run.call_count == 1
+
+    def test_failed_probe_is_not_cached(self, fake_claude):
+        """A failing probe returns an error and is retried next time."""
+        failed = subprocess.CompletedProcess(["claude"], 1, stdout="", stderr="boom")
+        with patch.object(agent.subprocess, "run", return_value=failed) as run:
+            assert "error" in check_claude_installed()
+            assert "error" in check_claude_installed()
+
+        assert run.call_count == 2
+
+    def test_missing_binary_reports_not_found(self, tmp_path, monkeypatch):
+        """A nonexistent CLAUDE_CODE_PATH is reported without caching."""
+        monkeypatch.setenv("CLAUDE_CODE_PATH", str(tmp_path / "missing" / "claude"))
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        monkeypatch.setattr(agent, "_verified_claude_binaries", set())
+
+        assert "not found" in check_claude_installed()
+        assert not (tmp_path / "cache").exists()
+
+
+class TestFindClaudeCli:
+    """Tests for find_claude_cli search caching."""
+
+    def test_search_is_reused_until_path_changes(self, tmp_path, monkeypatch):
+        """PATH is searched once per PATH value."""
+        first, second = tmp_path / "a", tmp_path / "b"
+        for directory in (first, second):
+            directory.mkdir()
+            binary = directory / "claude"
+            binary.write_text("#!/bin/sh\n")
+            binary.chmod(0o755)
+        monkeypatch.delenv("CLAUDE_CODE_PATH", raising=False)
+        monkeypatch.setenv("PATH", str(first))
+
+        with patch.object(agent.shutil, "which", wraps=agent.shutil.which) as which:
+            assert agent.find_claude_cli() == str(first / "claude")
+            assert agent.find_claude_cli() == str(first / "claude")
+            assert which.call_count == 1
+
+            monkeypatch.setenv("PATH", str(second))
+            assert agent.find_claude_cli() == str(second / "claude")
+            assert which.call_count == 2
@@ -7,9 +7,12 @@ This test module validates the event system infrastructure, particularly
 ensuring that event types match corresponding model enums like NoteCategory.
 """
 
+import json
+
 import pytest
 
-from jean_claude.core.events import EventType
+from jean_claude.cli.commands.status import get_feature_durations
+from jean_claude.core.events import Event, EventLogger, EventType, JSONLEventWriter
 from jean_claude.core.notes import NoteCategory
 
 
@@ -44,3 +47,55 @@ def test_event_types_match_note_categories():
     assert note_categories == expected_categories, (
         f"Expected 10 note categories, got {len(note_categories)}: {note_categories}"
     )
+
+
+class TestEventLoggerBatch:
+    """Tests for EventLogger.batch()."""
+
+    def test_batch_defers_writes_until_block_exits(self, tmp_path):
+        """Events emitted in a batch are written together, in order, on exit."""
+        logger = EventLogger(tmp_path)
+        jsonl_path = tmp_path / "agents" / "wf" / "events.jsonl"
+
+        with logger.batch():
+            logger.emit("wf", "workflow.phase_changed", {"to_phase": "verifying"})
+            logger.emit("wf", "workflow.phase_changed", {"to_phase": "complete"})
+            assert not jsonl_path.exists()
+            assert logger.get_workflow_events("wf") == []
+
+        lines = [json.loads(line) for line in jsonl_path.read_text().splitlines()]
+        assert [line["data"]["to_phase"] for line in lines] == ["verifying", "complete"]
+        assert len(logger.get_workflow_events("wf")) == 2
+
+        # Outside a batch, events are written immediately again
+        logger.emit("wf", "workflow.completed", {})
+        assert len(jsonl_path.read_text().splitlines()) == 3
+
+    def test_batch_flushes_on_error(self, tmp_path):
+        """Buffered events are still written when the block raises."""
+        logger = EventLogger(tmp_path)
+
+        with pytest.raises(RuntimeError):
+            with logger.batch():
+                logger.emit("wf", "workflow.phase_changed", {"to_phase": "verifying"})
+                raise RuntimeError("boom")
+
+        assert len(logger.get_workflow_events("wf")) == 1
+
+
+class TestJSONLEncoding:
+    """Tests for non-ASCII text in events.jsonl."""
+
+    async def test_non_ascii_data_is_written_and_read_as_utf8(self, tmp_path):
+        """Both writers store UTF-8 regardless of locale, and readers decode it."""
+        logger = EventLogger(tmp_path)
+        logger.emit("wf", "feature.started", {"feature_name": "café 🚀"})
+        jsonl_path = tmp_path / "agents" / "wf" / "events.jsonl"
+        await JSONLEventWriter(jsonl_path).write_event_async(
+            Event(workflow_id="wf", event_type="feature.completed",
+                  data={"feature_name": "café 🚀"})
+        )
+
+        lines = jsonl_path.read_bytes().decode("utf-8").splitlines()
+        assert all("café 🚀" in line for line in lines)
+        assert list(get_feature_durations(tmp_path, "wf")) == ["café 🚀"]
@@ -10,6 +10,7 @@ ensuring that all notes are written to and read from the SQLite event store.
 import pytest
 from pathlib import Path
 
+from jean_claude.core import notes_api
 from jean_claude.core.notes_api import Notes
 from jean_claude.core.notes import Note, NoteCategory
 from jean_claude.core.events import EventLogger, EventType
@@ -214,6 +215,46 @@ class TestNotesSQLiteEventSourcing:
         # Verify
         assert len(limited_notes) == 3
 
+    def test_list_applies_limit_after_agent_and_tag_filters(self, tmp_path):
+        """Verify limit counts only notes matching agent_id and tag filters."""
+        # Setup
+        workflow_id = "test-workflow"
+        event_logger = EventLogger(tmp_path)
+        notes = Notes(
+            workflow_id=workflow_id,
+            project_root=tmp_path,
+            event_logger=event_logger
+        )
+
+        # Matching notes are written first so newer non-matching notes
+        # would fill the limit if filtering happened after LIMIT
+        for i in range(3):
+            notes.add(
+                agent_id="agent-1",
+                title=f"Tagged {i}",
+                content=f"Content {i}",
+                category=NoteCategory.OBSERVATION,
+                tags=["api"],
+            )
+        for i in range(3):
+            notes.add(
+                agent_id="agent-2",
+                title=f"Other {i}",
+                content=f"Content {i}",
+                category=NoteCategory.OBSERVATION,
+                tags=["ui"],
+            )
+
+        # Execute
+        by_agent = notes.list(agent_id="agent-1", limit=2)
+        by_tag = notes.list(tag="api", limit=2)
+
+        # Verify
+        assert len(by_agent) == 2
+        assert all(n.agent_id == "agent-1" for n in by_agent)
+        assert len(by_tag) == 2
+        assert all("api" in n.tags for n in by_tag)
+
     def test_search_finds_matching_notes(self, tmp_path):
         """Verify search() finds notes by text query."""
         # Setup
@@ -252,6 +293,83 @@ class TestNotesSQLiteEventSourcing:
         assert len(results) == 2
         assert any("auth" in n.title.lower() or "auth" in n.content.lower() for n in results)
 
+    def test_unfiltered_reads_reuse_loaded_notes_until_store_changes(self, tmp_path):
+        """Verify instances share decoded notes and see notes added later."""
+        # Setup
+        workflow_id = "test-workflow"
+        event_logger = EventLogger(tmp_path)
+        notes = Notes(
+            workflow_id=workflow_id,
+            project_root=tmp_path,
+            event_logger=event_logger
+        )
+        notes.add(agent_id="agent-1", title="Auth note", content="Content 1")
+
+        # Execute - a second instance reads the same unchanged store
+        other = Notes(
+            workflow_id=workflow_id,
+            project_root=tmp_path,
+            event_logger=event_logger
+        )
+        first = notes.list()
+        second = other.list()
+
+        # Verify - each caller gets its own copy of the shared notes
+        assert len(first) == 1
+        assert first[0] == second[0]
+        first[0].tags.append("mutated")
+        assert other.list()[0].tags == []
+
+        # Execute - adding a note invalidates the shared load
+        other.add(agent_id="agent-2", title="Auth follow-up", content="Content 2")
+
+        # Verify
+        assert len(notes.list()) == 2
+        assert len(notes.search("auth")) == 2
+        assert "2 total" in notes.get_summary()
+
+    def test_limited_list_reads_only_limit_rows(self, tmp_path, monkeypatch):
+        """Verify list(limit=N) queries SQLite rather than loading every note."""
+        # Setup
+        workflow_id = "test-workflow"
+        event_logger = EventLogger(tmp_path)
+        notes = Notes(
+            workflow_id=workflow_id,
+            project_root=tmp_path,
+            event_logger=event_logger
+        )
+        for i in range(3):
+            notes.add(agent_id="agent-1", title=f"Note {i}", content="Content")
+
+        # Execute
+        monkeypatch.setattr(
+            notes, "_all_notes", lambda: pytest.fail("limit read loaded all notes")
+        )
+        recent = notes.list(limit=2)
+
+        # Verify
+        assert len(recent) == 2
+
+    def test_shared_cache_is_bounded(self, tmp_path):
+        """Verify only the most recently loaded workflows stay cached."""
+        # Setup
+        event_logger = EventLogger(tmp_path)
+        notes_api._NOTES_CACHE.clear()
+
+        # Execute
+        for i in range(notes_api._MAX_CACHED_WORKFLOWS + 3):
+            notes = Notes(
+                workflow_id=f"workflow-{i}",
+                project_root=tmp_path,
+                event_logger=event_logger
+            )
+            notes.add(agent_id="agent-1", title="Note", content="Content")
+            notes.list()
+
+        # Verify
+        assert len(notes_api._NOTES_CACHE) == notes_api._MAX_CACHED_WORKFLOWS
+        assert (str(tmp_path / ".jc" / "events.db"), "workflow-0") not in notes_api._NOTES_CACHE
+
     @pytest.mark.parametrize(
         "category,expected_event_type",
         [
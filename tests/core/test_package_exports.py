@@ -0,0 +1,56 @@
+# ABOUTME: Tests for the lazily loaded re-exports of the core and orchestration packages
+# ABOUTME: Verifies every exported name resolves and submodules load only on first use
+
+"""Tests for jean_claude.core and jean_claude.orchestration package exports."""
+
+import importlib
+import subprocess
+import sys
+
+import pytest
+
+
+@pytest.mark.parametrize("package", ["jean_claude.core", "jean_claude.orchestration"])
+def test_every_exported_name_resolves(package):
+    """Each name in __all__ is importable from the package itself."""
+    module = importlib.import_module(package)
+    for name in module.__all__:
+        value = getattr(module, name)
+        assert getattr(value, "__name__", name) == name
+    assert set(module.__all__) <= set(dir(module))
+
+
+def test_unknown_name_raises_attribute_error():
+    """Names that aren't exported still raise AttributeError."""
+    import jean_claude.core
+
+    missing = "DoesNotExist"
+    with pytest.raises(AttributeError):
+        getattr(jean_claude.core, missing)
+
+
+def test_importing_a_submodule_does_not_load_siblings():
+    """Importing core.beads leaves the rest of the package unloaded."""
+    code = (
+        "import sys\n"
+        "import jean_claude.core.beads\n"
+        "print(sorted(m for m in sys.modules if m.startswith('jean_claude.')))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "['jean_claude.core', 'jean_claude.core.beads']"
+
+
+def test_hooks_are_not_shadowed_by_their_submodules():
+    """Importing a hook's submodule doesn't replace the exported hook."""
+    code = (
+        "import inspect\n"
+        "import jean_claude.orchestration.subagent_stop_hook\n"
+        "from jean_claude.orchestration import subagent_stop_hook\n"
+        "print(inspect.isfunction(subagent_stop_hook))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "True"
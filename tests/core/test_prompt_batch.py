@@ -0,0 +1,79 @@
+# ABOUTME: Tests for running several prompts concurrently with execute_prompts_batch
+# ABOUTME: Verifies ordering, the concurrency limit and per-prompt failure isolation
+
+"""Tests for execute_prompts_batch."""
+
+import anyio
+import pytest
+
+from jean_claude.core import agent
+from jean_claude.core.agent import (
+    ExecutionResult,
+    PromptRequest,
+    RetryCode,
+    execute_prompts_batch,
+)
+
+
+@pytest.fixture
+def fake_backend(monkeypatch):
+    """Replace the subprocess backend with a fake that records concurrency."""
+    stats = {"running": 0, "peak": 0}
+
+    async def fake_execute(request, max_retries):
+        stats["running"] += 1
+        stats["peak"] = max(stats["peak"], stats["running"])
+        try:
+            # Shorter prompts finish first, so results complete out of order
+            await anyio.sleep(0.01 * len(request.prompt))
+            if request.prompt.startswith("boom"):
+                raise RuntimeError("backend crashed")
+            return ExecutionResult(output=request.prompt.upper(), success=True)
+        finally:
+            stats["running"] -= 1
+
+    monkeypatch.setattr(agent, "_execute_prompt_subprocess_async", fake_execute)
+    return stats
+
+
+class TestExecutePromptsBatch:
+    """Tests for execute_prompts_batch."""
+
+    @pytest.mark.asyncio
+    async def test_results_follow_request_order(self, fake_backend):
+        """Results come back in request order, not completion order."""
+        prompts = ["longest prompt", "mid one", "a"]
+        results = await execute_prompts_batch(
+            [PromptRequest(prompt=p) for p in prompts], use_sdk=False
+        )
+        assert [r.output for r in results] == [p.upper() for p in prompts]
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_limited(self, fake_backend):
+        """No more than max_concurrency prompts run at the same time."""
+        requests = [PromptRequest(prompt=f"prompt {i}") for i in range(6)]
+        await execute_prompts_batch(requests, max_concurrency=2, use_sdk=False)
+        assert fake_backend["peak"] == 2
+
+    @pytest.mark.asyncio
+    async def test_failure_does_not_cancel_other_prompts(self, fake_backend):
+        """A prompt that raises becomes a failed result; the rest still run."""
+        requests = [PromptRequest(prompt="boom"), PromptRequest(prompt="fine")]
+        results = await execute_prompts_batch(requests, use_sdk=False)
+
+        assert not results[0].success
+        assert results[0].retry_code == RetryCode.EXECUTION_ERROR
+        assert "backend crashed" in results[0].output
+        assert results[1].output == "FINE"
+
+    @pytest.mark.asyncio
+    async def test_on_result_reports_prompts_as_they_finish(self, fake_backend):
+        """on_result gets each (index, result) in completion order."""
+        finished = []
+        prompts = ["longest prompt", "a"]
+        await execute_prompts_batch(
+            [PromptRequest(prompt=p) for p in prompts],
+            use_sdk=False,
+            on_result=lambda index, result: finished.append((index, result.output)),
+        )
+        assert finished == [(1, "A"), (0, "LONGEST PROMPT")]
@@ -0,0 +1,89 @@
+# ABOUTME: Tests for the adaptive rate limiter around Claude invocations
+# ABOUTME: Covers rate limit detection, token bucket spacing, backoff and retry integration
+
+"""Tests for jean_claude.core.rate_limiter."""
+
+import pytest
+
+from jean_claude.core import agent
+from jean_claude.core.agent import ExecutionResult, PromptRequest, RetryCode
+from jean_claude.core.rate_limiter import AdaptiveRateLimiter, is_rate_limit_error
+
+
+class TestIsRateLimitError:
+    """Tests for is_rate_limit_error."""
+
+    @pytest.mark.parametrize(
+        "message",
+        [
+            "API Error: 429 Too Many Requests",
+            '{"type":"error","error":{"type":"rate_limit_error"}}',
+            "Rate limit reached for requests",
+            "API Error: 529 overloaded_error",
+        ],
+    )
+    def test_detects_rate_limit_messages(self, message):
+        assert is_rate_limit_error(message)
+
+    @pytest.mark.parametrize(
+        "message", ["Claude Code error: exit code 1", "Read 4290 lines", "Added a rate limiter", ""]
+    )
+    def test_ignores_other_errors(self, message):
+        assert not is_rate_limit_error(message)
+
+
+class TestAdaptiveRateLimiter:
+    """Tests for AdaptiveRateLimiter."""
+
+    def test_burst_then_spacing(self):
+        """Starts within the burst don't wait; the next one waits for a token."""
+        limiter = AdaptiveRateLimiter(requests_per_minute=60, burst=2)
+        assert limiter._reserve() == 0
+        assert limiter._reserve() == 0
+        assert limiter._reserve() == pytest.approx(1.0, abs=0.05)
+
+    def test_rate_limit_pauses_callers_with_growing_backoff(self):
+        """Each consecutive rate limit error backs off longer, up to the maximum."""
+        limiter = AdaptiveRateLimiter(burst=10, base_backoff=2, max_backoff=5)
+
+        first = limiter.record_rate_limited()
+        assert 1 <= first <= 2
+        assert limiter._reserve() == pytest.approx(first, abs=0.05)
+
+        assert 2 <= limiter.record_rate_limited() <= 4
+        assert 2.5 <= limiter.record_rate_limited() <= 5
+
+    def test_success_resets_backoff_and_restores_rate(self):
+        """A success starts the backoff over and lifts the throttle gradually."""
+        limiter = AdaptiveRateLimiter(base_backoff=2)
+        limiter.record_rate_limited()
+        limiter.record_rate_limited()
+        assert limiter._throttle == 0.25
+
+        limiter.record_success()
+        assert limiter._throttle == pytest.approx(0.35)
+        assert limiter.record_rate_limited() <= 2
+
+
+class TestRetryOnRateLimit:
+    """Tests for rate limited attempts in the execute_prompt retry loop."""
+
+    def test_rate_limited_attempt_is_retried_after_backoff(self, monkeypatch):
+        """A rate limited attempt is retried once the limiter's backoff passes."""
+        limiter = AdaptiveRateLimiter(base_backoff=0.02)
+        monkeypatch.setattr(agent, "claude_rate_limiter", limiter)
+        attempts = [
+            ExecutionResult(output="API Error: 429", success=False, retry_code=RetryCode.RATE_LIMITED),
+            ExecutionResult(output="Done", success=True),
+        ]
+
+        async def fake_once(request):
+            return attempts.pop(0)
+
+        monkeypatch.setattr(agent, "_execute_prompt_once", fake_once)
+        result = agent.execute_prompt(PromptRequest(prompt="hi"), use_sdk=False)
+
+        assert result.output == "Done"
+        assert attempts == []
+        assert limiter._consecutive_limits == 0
+
@@ -0,0 +1,31 @@
+# ABOUTME: Tests for the retry policy shared by the Claude execution backends
+# ABOUTME: Covers the per retry code backoff between attempts
+
+"""Tests for jean_claude.core.retry."""
+
+import pytest
+
+from jean_claude.core.retry import RetryCode, retry_delay
+
+
+class TestRetryDelay:
+    """Tests for the per retry code backoff in retry_delay."""
+
+    def test_rate_limited_retries_wait_on_the_limiter_only(self):
+        """Rate limited retries get no extra delay from the retry loop."""
+        assert retry_delay(RetryCode.RATE_LIMITED, 1) == 0
+        assert retry_delay(RetryCode.RATE_LIMITED, 3) == 0
+
+    def test_error_during_execution_retries_immediately_once(self):
+        """A failed session is retried at once, then backs off."""
+        assert retry_delay(RetryCode.ERROR_DURING_EXECUTION, 1) == 0
+        assert 1 <= retry_delay(RetryCode.ERROR_DURING_EXECUTION, 2) <= 2
+
+    @pytest.mark.parametrize(
+        "attempt, low, high", [(1, 0.5, 1), (2, 1, 2), (3, 2, 4), (8, 5, 10)]
+    )
+    def test_other_errors_back_off_exponentially_with_jitter(self, attempt, low, high):
+        """Delays double per attempt within a jitter band, capped at 10s."""
+        for _ in range(20):
+            delay = retry_delay(RetryCode.TIMEOUT_ERROR, attempt)
+            assert low <= delay <= high
@@ -0,0 +1,130 @@
+# ABOUTME: Tests for the Claude CLI subprocess fallback backend
+# ABOUTME: Runs a fake CLI that emits stream-json to check streaming, parsing and errors
+
+"""Tests for execute_prompt(use_sdk=False)."""
+
+import json
+import sys
+
+import pytest
+
+from jean_claude.core import agent
+from jean_claude.core.agent import (
+    FINAL_OBJECT_JSON,
+    OUTPUT_JSONL,
+    PromptRequest,
+    RetryCode,
+    execute_prompt,
+)
+
+
+def _fake_cli(tmp_path, body: str):
+    """Write a fake Claude CLI (a Python script) and return its path."""
+    script = tmp_path / "claude"
+    script.write_text(f"#!{sys.executable}\nimport sys\n{body}\n")
+    script.chmod(0o755)
+    return script
+
+
+@pytest.fixture
+def use_fake_cli(monkeypatch):
+    """Route the subprocess backend to a given fake CLI."""
+
+    def _use(script):
+        monkeypatch.setattr(agent, "check_claude_installed", lambda: None)
+        monkeypatch.setattr(agent, "find_claude_cli", lambda: str(script))
+
+    return _use
+
+
+class TestSubprocessBackend:
+    """Tests for the subprocess backend of execute_prompt."""
+
+    def test_streams_and_parses_jsonl_output(self, tmp_path, use_fake_cli):
+        """Messages are saved to the output files and the result is returned."""
+        messages = [
+            {"type": "system", "subtype": "init"},
+            {"type": "assistant", "message": {"content": "héllo"}},
+            {"type": "result", "result": "Done", "session_id": "s1",
+             "total_cost_usd": 0.01, "duration_ms": 1200, "is_error": False},
+        ]
+        lines = "".join(json.dumps(m) + "\n" for m in messages)
+        use_fake_cli(_fake_cli(tmp_path, f"sys.stdout.write({lines!r})"))
+
+        output_dir = tmp_path / "out"
+        request = PromptRequest(prompt="hi", output_dir=output_dir)
+        result = execute_prompt(request, max_retries=0, use_sdk=False)
+
+        assert result.success
+        assert result.output == "Done"
+        assert result.session_id == "s1"
+        assert result.duration_ms == 1200
+        assert (output_dir / OUTPUT_JSONL).read_text(encoding="utf-8") == lines
+        # The JSONL file is the only copy of the full transcript
+        assert sorted(p.name for p in output_dir.iterdir()) == [
+            FINAL_OBJECT_JSON, OUTPUT_JSONL
+        ]
+        assert json.loads((output_dir / FINAL_OBJECT_JSON).read_text()) == messages[-1]
+
+    def test_line_split_across_many_chunks(self, tmp_path, use_fake_cli):
+        """A long message written in many small pieces is reassembled."""
+        result = {"type": "result", "result": "x" * 200_000, "is_error": False}
+        body = (
+            "import json\n"
+            f"line = json.dumps({result!r}) + '\\n'\n"
+            "for i in range(0, len(line), 4096):\n"
+            "    sys.stdout.write(line[i:i + 4096])\n"
+            "    sys.stdout.flush()"
+        )
+        use_fake_cli(_fake_cli(tmp_path, body))
+
+        request = PromptRequest(prompt="hi", output_dir=tmp_path / "out")
+        outcome = execute_prompt(request, max_retries=0, use_sdk=False)
+
+        assert outcome.success
+        assert outcome.output == result["result"]
+
+    def test_nonzero_exit_reports_stderr(self, tmp_path, use_fake_cli):
+        """A failing CLI returns its stderr as a retryable Claude Code error."""
+        use_fake_cli(_fake_cli(tmp_path, "sys.stderr.write('bad things')\nsys.exit(2)"))
+
+        request = PromptRequest(prompt="hi", output_dir=tmp_path / "out")
+        result = execute_prompt(request, max_retries=0, use_sdk=False)
+
+        assert not result.success
+        assert result.output == "Claude Code error: bad things"
+        assert result.retry_code == RetryCode.CLAUDE_CODE_ERROR
+
+    def test_installation_checked_once_across_retries(
+        self, tmp_path, use_fake_cli, monkeypatch
+    ):
+        """Retries reuse the installation check made before the first attempt."""
+        use_fake_cli(_fake_cli(tmp_path, "sys.stderr.write('bad things')\nsys.exit(2)"))
+        checks = []
+        monkeypatch.setattr(agent, "check_claude_installed", lambda: checks.append(1))
+        monkeypatch.setattr(agent, "retry_delay", lambda retry_code, attempt: 0)
+
+        request = PromptRequest(prompt="hi", output_dir=tmp_path / "out")
+        result = execute_prompt(request, max_retries=2, use_sdk=False)
+
+        assert not result.success
+        assert len(checks) == 1
+
+
+class TestSubprocessEnv:
+    """Tests for get_subprocess_env."""
+
+    def test_passes_allowed_variables_with_defaults(self, monkeypatch):
+        """Only allowed variables are passed, read at call time, with defaults."""
+        monkeypatch.setenv("PATH", "/opt/claude/bin")
+        monkeypatch.setenv("SECRET_TOKEN", "x")
+        monkeypatch.delenv("CLAUDE_CODE_PATH", raising=False)
+        monkeypatch.delenv("CLAUDE_BASH_MAINTAIN_PROJECT_WORKING_DIR", raising=False)
+
+        env = agent.get_subprocess_env()
+
+        assert env["PATH"] == "/opt/claude/bin"
+        assert "SECRET_TOKEN" not in env
+        assert env["CLAUDE_CODE_PATH"] == "claude"
+        assert env["CLAUDE_BASH_MAINTAIN_PROJECT_WORKING_DIR"] == "true"
+        assert env["PYTHONUNBUFFERED"] == "1"
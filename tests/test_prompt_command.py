@@ -0,0 +1,164 @@
+# ABOUTME: Tests for the prompt CLI command
+# ABOUTME: Covers input validation and concurrent --batch execution with JSONL results
+
+"""Tests for jc prompt command.
+
+Claude execution is mocked; these tests cover argument validation and the
+--batch JSONL mode.
+"""
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import anyio
+import pytest
+from click.testing import CliRunner
+
+from jean_claude.cli.commands.prompt import prompt
+from jean_claude.core import agent
+from jean_claude.core.agent import ExecutionResult
+
+
+@pytest.fixture
+def claude_ok():
+    """Skip the Claude CLI installation check."""
+    with patch("jean_claude.cli.commands.prompt.check_claude_installed", return_value=None):
+        yield
+
+
+def _batch_input(*entries: dict) -> str:
+    return "".join(json.dumps(entry) + "\n" for entry in entries)
+
+
+class TestPromptInputValidation:
+    """Tests for TEXT / --batch validation."""
+
+    def test_requires_text_or_batch(self, cli_runner: CliRunner, claude_ok):
+        """Running without TEXT or --batch fails."""
+        result = cli_runner.invoke(prompt, [])
+        assert result.exit_code == 1
+        assert "Must provide TEXT or --batch" in result.output
+
+    def test_rejects_text_with_batch(self, cli_runner: CliRunner, claude_ok):
+        """TEXT and --batch are mutually exclusive."""
+        result = cli_runner.invoke(prompt, ["hello", "--batch", "-"], input="")
+        assert result.exit_code == 1
+        assert "not both" in result.output
+
+    def test_rejects_invalid_batch_line(self, cli_runner: CliRunner, claude_ok):
+        """A malformed line aborts the batch before anything runs."""
+        with patch("jean_claude.cli.commands.prompt.execute_prompts_batch") as execute:
+            result = cli_runner.invoke(
+                prompt, ["--batch", "-"], input='{"prompt": "ok"}\n{"text": "no prompt"}\n'
+            )
+
+        assert result.exit_code == 1
+        assert "Batch line 2" in result.output
+        execute.assert_not_called()
+
+    def test_unusable_output_dir_fails_before_execution(
+        self, cli_runner: CliRunner, claude_ok, tmp_path: Path
+    ):
+        """An output directory that can't be created aborts before Claude runs."""
+        blocker = tmp_path / "blocker"
+        blocker.write_text("")
+
+        with patch("jean_claude.cli.commands.prompt.execute_prompt") as execute:
+            result = cli_runner.invoke(prompt, ["hello", "-o", str(blocker / "out")])
+
+        assert result.exit_code == 1
+        assert "Cannot create output directory" in result.output
+        execute.assert_not_called()
+
+
+@pytest.fixture
+def fake_backend(monkeypatch):
+    """Route batch prompts to a fake backend; returns a setter for its behavior."""
+
+    def _use(fake_execute):
+        monkeypatch.setattr(agent, "_is_sdk_available", lambda: False)
+        monkeypatch.setattr(agent, "_execute_prompt_subprocess_async", fake_execute)
+
+    return _use
+
+
+class TestPromptBatch:
+    """Tests for --batch execution."""
+
+    def test_batch_runs_prompts_concurrently(
+        self, cli_runner: CliRunner, claude_ok, fake_backend, tmp_path: Path
+    ):
+        """Prompts overlap up to --concurrency and each yields one JSON line."""
+        active = 0
+        peak = 0
+
+        async def fake_execute(request, max_retries):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await anyio.sleep(0.05)
+            active -= 1
+            return ExecutionResult(output=f"re: {request.prompt}", success=True)
+
+        entries = [{"prompt": f"p{i}", "id": i} for i in range(4)]
+        entries[1]["model"] = "haiku"
+        fake_backend(fake_execute)
+        result = cli_runner.invoke(
+            prompt,
+            ["--batch", "-", "--concurrency", "2", "-o", str(tmp_path)],
+            input=_batch_input(*entries),
+        )
+
+        assert result.exit_code == 0
+        records = sorted(
+            (json.loads(line) for line in result.output.splitlines()),
+            key=lambda r: r["index"],
+        )
+        assert [r["id"] for r in records] == [0, 1, 2, 3]
+        assert [r["output"] for r in records] == ["re: p0", "re: p1", "re: p2", "re: p3"]
+        assert records[1]["model"] == "haiku"
+        assert records[0]["model"] == "sonnet"
+        assert peak == 2
+
+    def test_batch_exits_nonzero_when_a_prompt_fails(
+        self, cli_runner: CliRunner, claude_ok, fake_backend, tmp_path: Path
+    ):
+        """Failures are reported per line and reflected in the exit code."""
+
+        async def fake_execute(request, max_retries):
+            return ExecutionResult(output="boom", success=request.prompt != "bad")
+
+        fake_backend(fake_execute)
+        result = cli_runner.invoke(
+            prompt,
+            ["--batch", "-", "-o", str(tmp_path)],
+            input=_batch_input({"prompt": "good"}, {"prompt": "bad"}),
+        )
+
+        assert result.exit_code == 1
+        records = [json.loads(line) for line in result.output.splitlines()]
+        assert sorted(r["success"] for r in records) == [False, True]
+
+    def test_batch_serves_cached_prompts_before_dispatch(
+        self, cli_runner: CliRunner, claude_ok, fake_backend, tmp_path: Path, monkeypatch
+    ):
+        """With --cache, a repeated batch answers from the cache without running Claude."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        calls = []
+
+        async def fake_execute(request, max_retries):
+            calls.append(request.prompt)
+            return ExecutionResult(output=f"re: {request.prompt}", success=True)
+
+        fake_backend(fake_execute)
+        args = ["--batch", "-", "--cache", "-o", str(tmp_path / "out")]
+        batch = _batch_input({"prompt": "p0"}, {"prompt": "p1"})
+        cli_runner.invoke(prompt, args, input=batch)
+        result = cli_runner.invoke(prompt, args, input=batch)
+
+        assert result.exit_code == 0
+        assert sorted(calls) == ["p0", "p1"]
+        records = [json.loads(line) for line in result.output.splitlines()]
+        assert [r["cached"] for r in records] == [True, True]
+        assert [r["output"] for r in records] == ["re: p0", "re: p1"]
@@ -4,6 +4,7 @@
 """Tests for workflow state management."""
 
 import json
+import os
 from datetime import datetime
 from pathlib import Path
 from tempfile import TemporaryDirectory
@@ -102,6 +103,24 @@ class TestWorkflowState:
         assert state.current_feature is None
         assert state.get_next_feature() is None
 
+    def test_bulk_complete(self):
+        """Test bulk_complete matches start/complete loops and stops at the end."""
+        state = WorkflowState(workflow_id="test-123", workflow_name="Test", workflow_type="feature")
+        for i in range(3):
+            state.add_feature(f"f{i}", f"Feature {i}")
+        now = datetime(2025, 1, 1, 12, 0)
+
+        assert state.bulk_complete(2, now=now) == 2
+        assert state.current_feature_index == 2
+        assert [f.status for f in state.features] == ["completed", "completed", "not_started"]
+        assert state.features[0].started_at == now
+        assert state.features[1].completed_at == now
+
+        # Only one feature remains
+        assert state.bulk_complete(5) == 1
+        assert state.is_complete() is True
+        assert state.bulk_complete(1) == 0
+
     def test_progress_and_completion(self):
         """Test progress percentage, is_complete, and is_failed."""
         state = WorkflowState(workflow_id="test-123", workflow_name="Test", workflow_type="feature")
@@ -161,6 +180,24 @@ class TestWorkflowState:
         assert summary["beads_task_title"] == "Link WorkflowState to Beads Tasks"
         assert summary["phase"] == "verifying"
 
+    def test_get_summary_empty_and_all_complete(self):
+        """Test get_summary flags and percentage at the zero and full boundaries."""
+        state = WorkflowState(workflow_id="test-123", workflow_name="Test", workflow_type="feature")
+        summary = state.get_summary()
+        assert summary["total_features"] == 0
+        assert summary["progress_percentage"] == 0.0
+        assert summary["is_complete"] is False
+        assert summary["is_failed"] is False
+
+        state.add_feature("f1", "First")
+        state.add_feature("f2", "Second")
+        for feature in state.features:
+            feature.status = "completed"
+        summary = state.get_summary()
+        assert summary["completed_features"] == 2
+        assert summary["progress_percentage"] == 100.0
+        assert summary["is_complete"] is True
+
     def test_update_phase(self):
         """Test that update_phase works for starting and completing phases."""
         state = WorkflowState(workflow_id="test-123", workflow_name="Test", workflow_type="feature")
@@ -240,6 +277,54 @@ class TestWorkflowStatePersistence:
             assert len(data["features"]) == 1
             assert data["features"][0]["status"] == "in_progress"
 
+    def test_save_replaces_state_file_without_leftovers(self):
+        """Test that repeated saves replace state.json and leave no temp files."""
+        with TemporaryDirectory() as tmpdir:
+            project_root = Path(tmpdir)
+            state = WorkflowState(workflow_id="test-123", workflow_name="Test", workflow_type="chore")
+            state.save(project_root)
+            state.iteration_count = 2
+            state.save(project_root)
+
+            state_dir = project_root / "agents" / "test-123"
+            assert [p.name for p in state_dir.iterdir()] == ["state.json"]
+            assert WorkflowState.load("test-123", project_root).iteration_count == 2
+
+    def test_save_keeps_file_mode(self):
+        """Test that state.json gets the umask default mode and keeps a custom one."""
+        with TemporaryDirectory() as tmpdir:
+            project_root = Path(tmpdir)
+            state = WorkflowState(workflow_id="test-123", workflow_name="Test", workflow_type="chore")
+            state.save(project_root)
+            state_path = project_root / "agents" / "test-123" / "state.json"
+
+            umask = os.umask(0)
+            os.umask(umask)
+            assert state_path.stat().st_mode & 0o777 == 0o666 & ~umask
+
+            state_path.chmod(0o640)
+            state.save(project_root)
+            assert state_path.stat().st_mode & 0o777 == 0o640
+
+    def test_failed_save_keeps_previous_state_and_removes_temp_file(self, monkeypatch):
+        """Test that a save failing at the rename leaves the old state and no temp file."""
+        with TemporaryDirectory() as tmpdir:
+            project_root = Path(tmpdir)
+            state = WorkflowState(workflow_id="test-123", workflow_name="Test", workflow_type="chore")
+            state.save(project_root)
+
+            def failing_replace(src, dst):
+                raise OSError("disk full")
+
+            monkeypatch.setattr("jean_claude.core.state.os.replace", failing_replace)
+            state.iteration_count = 2
+            with pytest.raises(OSError, match="disk full"):
+                state.save(project_root)
+
+            state_dir = project_root / "agents" / "test-123"
+            assert [p.name for p in state_dir.iterdir()] == ["state.json"]
+            assert WorkflowState.load("test-123", project_root).iteration_count == 0
+
     def test_load_nonexistent_workflow(self):
         """Test loading a workflow that doesn't exist raises FileNotFoundError."""
         with TemporaryDirectory() as tmpdir:
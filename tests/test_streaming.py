@@ -85,6 +85,21 @@ class TestStreamingDisplay:
         display.start_tool("Read")
         assert len(display.tool_uses) == 1
 
+    def test_render_reuses_markdown_until_text_changes(self):
+        """Test that re-rendering unchanged text doesn't re-parse markdown."""
+        console = Console()
+        display = StreamingDisplay(console, show_thinking=True)
+
+        display.add_text("# Heading")
+        first = display.render().renderables[0]
+
+        # A tool event re-renders the display without new text
+        display.start_tool("Read")
+        assert display.render().renderables[0] is first
+
+        display.add_text("More text")
+        assert display.render().renderables[0] is not first
+
 
 class MockMessage:
     """Mock message for testing."""
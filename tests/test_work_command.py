@@ -11,6 +11,7 @@ fixtures in each class. All tests use:
 """
 
 import json
+import threading
 from pathlib import Path
 from unittest.mock import Mock, patch
 
@@ -60,6 +61,16 @@ class TestWorkFetchAndSpec:
                     spec_path = Path("specs/beads-test-task.1.md")
                     assert spec_path.exists()
 
+    def test_work_prints_spec_as_written_when_not_a_terminal(self, mock_beads_task, mock_task_validator, isolated_cli_runner):
+        """Test that piped output shows the raw spec instead of rendered markdown."""
+        spec_content = "# Test Spec\n\n- [ ] **Criterion** 1"
+        with patch('jean_claude.cli.commands.work.fetch_beads_task', return_value=mock_beads_task):
+            with patch('jean_claude.cli.commands.work.generate_spec_from_beads', return_value=spec_content):
+                with patch('jean_claude.cli.commands.work.update_beads_status'):
+                    result = isolated_cli_runner.invoke(work, ["test-task.1", "--dry-run"])
+
+        assert spec_content in result.output
+
     def test_work_handles_fetch_error_gracefully(self, cli_runner, isolated_cli_runner):
         """Test that work command handles fetch_beads_task errors gracefully."""
         with patch('jean_claude.cli.commands.work.fetch_beads_task', side_effect=RuntimeError("Failed to fetch")):
@@ -67,6 +78,31 @@ class TestWorkFetchAndSpec:
             assert result.exit_code != 0 or "error" in result.output.lower() or "failed" in result.output.lower()
 
 
+    def test_work_uses_task_returned_by_edit(self, mock_beads_task, mock_beads_task_factory, isolated_cli_runner):
+        """Test that editing a task reuses the edited task instead of fetching it again."""
+        from jean_claude.core.interactive_prompt_handler import PromptAction
+        from jean_claude.core.task_validator import ValidationResult
+
+        edited_task = mock_beads_task_factory(title="Edited Task")
+        clean_result = ValidationResult(is_valid=True, warnings=[], errors=[])
+
+        with patch('jean_claude.cli.commands.work.fetch_beads_task', return_value=mock_beads_task) as mock_fetch:
+            with patch('jean_claude.cli.commands.work.TaskValidator') as mock_validator_class:
+                mock_validator_class.return_value.validate.return_value = ValidationResult(warnings=["Short description"])
+                with patch('jean_claude.cli.commands.work.InteractivePromptHandler') as mock_prompt_class:
+                    mock_prompt_class.return_value.prompt.return_value = PromptAction.EDIT
+                    with patch(
+                        'jean_claude.core.edit_and_revalidate.edit_and_revalidate',
+                        return_value=(clean_result, edited_task),
+                    ):
+                        with patch('jean_claude.cli.commands.work.generate_spec_from_beads', return_value="# Test") as mock_generate:
+                            with patch('jean_claude.cli.commands.work.update_beads_status'):
+                                isolated_cli_runner.invoke(work, ["test-task.1", "--dry-run"])
+
+        mock_fetch.assert_called_once_with("test-task.1")
+        mock_generate.assert_called_once_with(edited_task)
+
+
 class TestWorkflowStateSetup:
     """Tests for WorkflowState initialization in work command."""
 
@@ -104,6 +140,25 @@ class TestBeadsStatusLifecycle:
                         result = isolated_cli_runner.invoke(work, ["test-task.1"])
                         mock_update_status.assert_called_with("test-task.1", "in_progress")
 
+    def test_work_generates_spec_while_status_update_runs(self, mock_beads_task, mock_task_validator, isolated_cli_runner):
+        """Test that spec generation doesn't wait for the Beads status update."""
+        spec_generated = threading.Event()
+
+        def update_status(task_id, status):
+            # Only finishes once the spec has been generated on the main thread
+            assert spec_generated.wait(timeout=5)
+
+        def generate_spec(task):
+            spec_generated.set()
+            return "# Test"
+
+        with patch('jean_claude.cli.commands.work.fetch_beads_task', return_value=mock_beads_task):
+            with patch('jean_claude.cli.commands.work.generate_spec_from_beads', side_effect=generate_spec):
+                with patch('jean_claude.cli.commands.work.update_beads_status', side_effect=update_status):
+                    with patch('jean_claude.cli.commands.work.anyio.run', return_value=Mock()):
+                        result = isolated_cli_runner.invoke(work, ["test-task.1"])
+                        assert "Task status updated to 'in_progress'" in result.output
+
     def test_work_closes_task_on_success(self, mock_beads_task, mock_task_validator, isolated_cli_runner):
         """Test that work command closes Beads task when workflow completes successfully."""
         with patch('jean_claude.cli.commands.work.fetch_beads_task', return_value=mock_beads_task):
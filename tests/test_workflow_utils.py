@@ -208,3 +208,43 @@ def test_find_most_recent_workflow_with_only_workflow_dir(temp_project):
 
     # Should return workflow-2, ignoring the empty directory
     assert result == "workflow-2"
+
+
+def test_find_most_recent_workflow_reloads_rewritten_state_file(temp_project):
+    """Test that repeated calls see a state.json rewritten in the same process."""
+    import os
+
+    workflow1_dir = temp_project / "agents" / "workflow-1"
+    workflow1_dir.mkdir(parents=True)
+    state_file1 = create_state_file(workflow1_dir, datetime.now() - timedelta(hours=2))
+
+    workflow2_dir = temp_project / "agents" / "workflow-2"
+    workflow2_dir.mkdir(parents=True)
+    create_state_file(workflow2_dir, datetime.now() - timedelta(hours=1))
+
+    assert find_most_recent_workflow(temp_project) == "workflow-2"
+
+    # Rewrite workflow-1 with a newer updated_at and bump its mtime
+    stat = state_file1.stat()
+    create_state_file(workflow1_dir, datetime.now())
+    os.utime(state_file1, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert find_most_recent_workflow(temp_project) == "workflow-1"
+
+
+def test_state_updated_at_does_not_cache_failed_loads(temp_project):
+    """Test that a state file that failed to load is read again next time."""
+    from jean_claude.core.workflow_utils import _state_updated_at
+
+    workflow_dir = temp_project / "agents" / "workflow-1"
+    workflow_dir.mkdir(parents=True)
+    state_file = workflow_dir / "state.json"
+
+    with pytest.raises(FileNotFoundError):
+        _state_updated_at(str(state_file), 0, 0)
+
+    updated_at = datetime.now()
+    create_state_file(workflow_dir, updated_at)
+
+    # Same cache key as the failed call
+    assert _state_updated_at(str(state_file), 0, 0) == updated_at
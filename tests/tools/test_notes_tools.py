@@ -273,6 +273,13 @@ class TestMCPServer:
         # The SDK wraps this differently, so we just check basic structure
         assert "type" in jean_claude_notes_tools or "instance" in jean_claude_notes_tools or "tools" in jean_claude_notes_tools
 
+    def test_read_tools_are_marked_read_only(self):
+        """Test that only the tools that don't write notes are read-only."""
+        for read_tool in (read_notes, search_notes, get_notes_summary):
+            annotations = read_tool.annotations.model_dump(by_alias=True)
+            assert annotations["readOnlyHint"] is True
+        assert take_note.annotations is None
+
 
 class TestIntegration:
     """Integration tests for notes tools."""